@@ -0,0 +1,460 @@
+from functools import lru_cache
+import numpy as np
+import constants
+
+"""
+Módulo de cálculo analítico (exacto) del resultado de una ronda.
+
+Dado el estado de los equipos al empezar una ronda (resistencia, suerte y género de cada arquero y arquero especial
+de la ronda anterior), los puntos de cada lanzamiento son independientes y siguen la distribución fija del conversor
+de su género. Por lo tanto los puntos de un arquero son la suma de current_resistance // RESISTANCE_CONSUMPTION
+lanzamientos (más el adicional si repite como arquero especial), los de un equipo la suma de sus arqueros más el
+lanzamiento especial, y sus distribuciones se obtienen convolucionando las de cada lanzamiento. A partir de ellas se
+calculan la probabilidad de empate de la ronda, la de victoria de cada equipo (con la misma comparación secuencial
+que Round.define_winning_team) y la de que haya empate de arqueros (que dispara Round.execute_additional_shots).
+
+Las mismas distribuciones permiten reemplazar los lanzamientos normales de un arquero en una ronda por un único
+sorteo de su total (sample_shots_points), que usa Round en modo sampled_shots.
+
+En ese modo el desempate de arqueros también se sortea con la distribución de un lanzamiento de cada arquero
+empatado: el de dos arqueros en forma cerrada (rondas geométricas y ganador según las probabilidades de que un
+lanzamiento supere al otro, ver tie_break_probabilities y sample_two_archer_tie_break) y el de tres o más simulando
+sus rondas con un arreglo de Ri por ronda (sample_tie_breaks).
+
+Las probabilidades de los conversores son las del modelo; la simulación, con Ri de 5 decimales, las reproduce con un
+sesgo menor a 1e-4.
+
+Ejemplo:
+    round_distribution = AnalyticRound(tournament.teams)
+    print(round_distribution.tie_probability, round_distribution.win_probabilities)
+"""
+
+# Largo a partir del cual las convoluciones se hacen con la transformada rápida de Fourier
+FFT_THRESHOLD = 500
+
+
+def convolve(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+    Distribución de la suma de dos variables independientes
+
+    Args:
+        first (np.ndarray): Probabilidad de cada valor (posición = valor) de la primera variable
+        second (np.ndarray): Probabilidad de cada valor de la segunda variable
+
+    Returns:
+        np.ndarray: Probabilidad de cada valor de la suma
+    """
+    length = len(first) + len(second) - 1
+    if min(len(first), len(second)) < FFT_THRESHOLD:
+        return np.convolve(first, second)
+    size = 1 << (length - 1).bit_length()
+    result = np.fft.irfft(np.fft.rfft(first, size) * np.fft.rfft(second, size), size)[:length]
+    # El redondeo de la transformada puede dejar valores negativos muy pequeños
+    return np.maximum(result, 0.0)
+
+
+@lru_cache(maxsize=None)
+def shot_distribution(converter_class) -> np.ndarray:
+    """
+    Distribución de los puntos de un lanzamiento
+
+    Args:
+        converter_class (type[PointsConverter]): Conversor de puntos del arquero
+
+    Returns:
+        np.ndarray: Probabilidad de cada puntaje (posición = puntos), de solo lectura
+    """
+    pmf = converter_class().pmf()
+    distribution = np.zeros(max(pmf) + 1)
+    for points, probability in pmf.items():
+        distribution[points] += probability
+    distribution.setflags(write=False)
+    return distribution
+
+
+@lru_cache(maxsize=None)
+def shots_distribution(converter_class, quantity_of_shots: int) -> np.ndarray:
+    """
+    Distribución de la suma de los puntos de varios lanzamientos, por duplicación (log2 convoluciones)
+
+    Args:
+        converter_class (type[PointsConverter]): Conversor de puntos del arquero
+        quantity_of_shots (int): Cantidad de lanzamientos
+
+    Returns:
+        np.ndarray: Probabilidad de cada total de puntos, de solo lectura
+    """
+    if quantity_of_shots <= 0:
+        distribution = np.ones(1)
+    elif quantity_of_shots == 1:
+        return shot_distribution(converter_class)
+    else:
+        half = shots_distribution(converter_class, quantity_of_shots // 2)
+        distribution = convolve(half, half)
+        if quantity_of_shots % 2:
+            distribution = convolve(distribution, shot_distribution(converter_class))
+    distribution.setflags(write=False)
+    return distribution
+
+
+@lru_cache(maxsize=None)
+def shots_cumulative(converter_class, quantity_of_shots: int) -> np.ndarray:
+    """
+    Distribución acumulada de la suma de los puntos de varios lanzamientos
+
+    Args:
+        converter_class (type[PointsConverter]): Conversor de puntos del arquero
+        quantity_of_shots (int): Cantidad de lanzamientos
+
+    Returns:
+        np.ndarray: Probabilidad de obtener cada total de puntos o menos, de solo lectura
+    """
+    cumulative = np.cumsum(shots_distribution(converter_class, quantity_of_shots))
+    cumulative.setflags(write=False)
+    return cumulative
+
+
+def sample_shots_points(converter_class, quantity_of_shots: int, value: float) -> int:
+    """
+    Sortea la suma de los puntos de varios lanzamientos con un solo Ri, por la inversa de su distribución acumulada
+
+    Args:
+        converter_class (type[PointsConverter]): Conversor de puntos del arquero
+        quantity_of_shots (int): Cantidad de lanzamientos
+        value (float): Ri en [0, 1]
+
+    Returns:
+        int: Total de puntos de los lanzamientos
+    """
+    cumulative = shots_cumulative(converter_class, quantity_of_shots)
+    # El Ri puede valer exactamente 1 y la última acumulada quedar apenas por debajo por el redondeo
+    return int(min(np.searchsorted(cumulative, value, side="right"), len(cumulative) - 1))
+
+
+def quantity_of_shots(archer) -> int:
+    """
+    Cantidad de lanzamientos normales que hará el arquero en la ronda (ver Archer.can_continue)
+
+    Args:
+        archer (Archer): Arquero al empezar la ronda
+
+    Returns:
+        int: Cantidad de lanzamientos
+    """
+    return max(archer.current_resistance // constants.RESISTANCE_CONSUMPTION, 0)
+
+
+def archer_distribution(archer, additional_shot: bool = False) -> np.ndarray:
+    """
+    Distribución de los puntos del arquero en la ronda (sin el lanzamiento especial, que no suma a sus puntos)
+
+    Args:
+        archer (Archer): Arquero al empezar la ronda
+        additional_shot (bool): Indica si hace el lanzamiento adicional por repetir como arquero especial
+
+    Returns:
+        np.ndarray: Probabilidad de cada total de puntos
+    """
+    return shots_distribution(
+        type(archer.points_converter), quantity_of_shots(archer) + (1 if additional_shot else 0)
+    )
+
+
+def team_distributions(team) -> tuple:
+    """
+    Distribuciones de los puntos del equipo y de cada uno de sus arqueros en la ronda
+
+    Args:
+        team (Team): Equipo al empezar la ronda
+
+    Returns:
+        tuple[np.ndarray, list[np.ndarray]]: Distribución de los puntos del equipo (con el lanzamiento especial) y de
+        los de cada arquero, en el orden del equipo
+    """
+    luckiest = team.the_most_lucky_archer()
+    repeated = team.special_archer is not None and team.special_archer.name == luckiest.name
+    archers = []
+    # Los lanzamientos de un mismo conversor son idénticamente distribuidos: el total del equipo solo depende de
+    # cuántos hace cada conversor
+    shots_by_converter = {type(luckiest.points_converter): 1}
+    for archer in team.archers:
+        converter_class = type(archer.points_converter)
+        quantity = quantity_of_shots(archer) + (1 if repeated and archer is luckiest else 0)
+        archers.append(shots_distribution(converter_class, quantity))
+        shots_by_converter[converter_class] = shots_by_converter.get(converter_class, 0) + quantity
+    return team_total_distribution(tuple(shots_by_converter.items())), archers
+
+
+@lru_cache(maxsize=None)
+def team_total_distribution(shots_by_converter: tuple) -> np.ndarray:
+    """
+    Distribución de los puntos del equipo a partir de la cantidad de lanzamientos de cada conversor
+
+    Args:
+        shots_by_converter (tuple[tuple[type, int]]): Conversor y cantidad total de lanzamientos que hacen sus arqueros
+
+    Returns:
+        np.ndarray: Probabilidad de cada total de puntos del equipo, de solo lectura
+    """
+    total = np.ones(1)
+    for converter_class, quantity in shots_by_converter:
+        total = convolve(total, shots_distribution(converter_class, quantity))
+    total.setflags(write=False)
+    return total
+
+
+def padded(distributions: list) -> np.ndarray:
+    """
+    Agrupa distribuciones de distinto largo en una matriz, completando con probabilidad 0
+    """
+    length = max(len(distribution) for distribution in distributions)
+    matrix = np.zeros((len(distributions), length))
+    for i, distribution in enumerate(distributions):
+        matrix[i, :len(distribution)] = distribution
+    return matrix
+
+
+def winning_team_probabilities(distributions: list) -> tuple:
+    """
+    Probabilidades del resultado de Round.define_winning_team, que compara los equipos en orden: un equipo con más
+    puntos que el mejor hasta el momento pasa a ser el mejor (y quita el empate), uno con los mismos puntos lo anula
+    y marca empate, y tras un empate el siguiente equipo pasa a ser el mejor sin quitar la marca.
+
+    Args:
+        distributions (list[np.ndarray]): Distribución de los puntos de cada equipo, en orden
+
+    Returns:
+        tuple[float, list[float]]: Probabilidad de que la ronda quede marcada como empatada y de que cada equipo quede
+        como el mejor de la ronda
+    """
+    matrix = padded(distributions)
+    # Distribución de los puntos del mejor equipo por (equipo, marca de empate)
+    best = np.zeros((len(distributions), 2, matrix.shape[1]))
+    # Probabilidad de no tener mejor equipo, por marca de empate
+    without_best = np.array([1.0, 0.0])
+    for j, team in enumerate(matrix):
+        team_less = np.cumsum(team) - team
+        best_less = np.cumsum(best, axis=2) - best
+        # Supera al mejor: pasa a ser el mejor y se quita el empate
+        surpass = (best_less * team).sum(axis=(0, 1))
+        # Iguala al mejor: no queda mejor equipo y se marca el empate
+        tie = (best * team).sum(axis=(0, 1, 2))
+        # Queda por debajo: el mejor se mantiene
+        best *= team_less
+        best[j] += without_best[:, None] * team
+        best[j, 0] += surpass
+        without_best = np.array([0.0, tie])
+    tie_probability = without_best[1] + best[:, 1].sum()
+    return float(tie_probability), best.sum(axis=(1, 2)).tolist()
+
+
+def archer_tie_probability(distributions: list) -> float:
+    """
+    Probabilidad de que el mayor puntaje de la ronda lo alcance más de un arquero, es decir, de que haya lanzamientos
+    adicionales de desempate
+
+    Args:
+        distributions (list[np.ndarray]): Distribución de los puntos de cada arquero
+
+    Returns:
+        float: Probabilidad de empate de arqueros
+    """
+    matrix = padded(distributions)
+    less = np.cumsum(matrix, axis=1) - matrix
+    # Producto de P(A_j < v) de todos los arqueros menos el i, con productos acumulados a izquierda y derecha
+    before = np.vstack((np.ones(matrix.shape[1]), np.cumprod(less, axis=0)[:-1]))
+    after = np.vstack((np.cumprod(less[::-1], axis=0)[-2::-1], np.ones(matrix.shape[1])))
+    unique_maximum = (matrix * before * after).sum()
+    return float(max(1.0 - unique_maximum, 0.0))
+
+
+def beat_probabilities(first: np.ndarray, second: np.ndarray) -> tuple:
+    """
+    Probabilidades de que un lanzamiento supere, iguale o quede por debajo de otro
+
+    Args:
+        first (np.ndarray): Distribución de los puntos del primer lanzamiento
+        second (np.ndarray): Distribución de los puntos del segundo lanzamiento
+
+    Returns:
+        tuple[float, float, float]: P(primero > segundo), P(primero == segundo) y P(primero < segundo)
+    """
+    first, second = padded([first, second])
+    equal = float(first @ second)
+    greater = float(first @ (np.cumsum(second) - second))
+    return greater, equal, max(1.0 - greater - equal, 0.0)
+
+
+def tie_break_probabilities(first: np.ndarray, second: np.ndarray) -> tuple:
+    """
+    Resultado exacto del desempate de dos arqueros (Round.execute_additional_shots): cada ronda de desempate ambos
+    lanzan una vez y termina en la primera en que sus puntos difieren
+
+    Args:
+        first (np.ndarray): Distribución de los puntos de un lanzamiento del primer arquero
+        second (np.ndarray): Distribución de los puntos de un lanzamiento del segundo arquero
+
+    Returns:
+        tuple[float, float]: Probabilidad de que gane el primer arquero y probabilidad de terminar en cada ronda
+        (la cantidad de rondas es geométrica con esta probabilidad)
+    """
+    greater, equal, less = beat_probabilities(first, second)
+    return greater / (greater + less), 1.0 - equal
+
+
+def cumulative_cells(distribution: np.ndarray) -> tuple:
+    """
+    Celdas con probabilidad positiva de una distribución y su distribución acumulada normalizada, para sortearlas
+    por la inversa sin caer en una celda imposible
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Posición de cada celda y probabilidad acumulada hasta ella, de solo lectura
+    """
+    cells = np.flatnonzero(distribution > 0)
+    cumulative = np.cumsum(distribution[cells])
+    cumulative /= cumulative[-1]
+    cells.setflags(write=False)
+    cumulative.setflags(write=False)
+    return cells, cumulative
+
+
+def sample_cell(cells: tuple, value: float) -> int:
+    """
+    Sortea una celda de cumulative_cells con un Ri en [0, 1]
+    """
+    positions, cumulative = cells
+    return int(positions[min(np.searchsorted(cumulative, value, side="right"), len(positions) - 1)])
+
+
+@lru_cache(maxsize=None)
+def two_archer_tie_break(first_class, second_class) -> tuple:
+    """
+    Tablas para sortear en forma cerrada el desempate de dos arqueros (ver sample_two_archer_tie_break)
+
+    Args:
+        first_class (type[PointsConverter]): Conversor de puntos del primer arquero
+        second_class (type[PointsConverter]): Conversor de puntos del segundo arquero
+
+    Returns:
+        tuple: Probabilidad de que gane el primero, de que el desempate termine en cada ronda, celdas del puntaje
+        común de una ronda empatada y celdas de los pares de puntajes (primero, segundo) de la última ronda según
+        gane el primero o el segundo, con el ancho de la matriz de pares
+    """
+    first, second = padded([shot_distribution(first_class), shot_distribution(second_class)])
+    winner_probability, end_probability = tie_break_probabilities(first, second)
+    # Puntajes conjuntos de una ronda: fila = puntos del primero, columna = puntos del segundo
+    joint = np.outer(first, second)
+    tied = cumulative_cells(np.diag(joint)) if end_probability < 1 else None
+    last_round = (cumulative_cells(np.tril(joint, -1).ravel()), cumulative_cells(np.triu(joint, 1).ravel()))
+    return winner_probability, end_probability, tied, last_round, joint.shape[1]
+
+
+def sample_two_archer_tie_break(first_class, second_class, uniform) -> tuple:
+    """
+    Sortea en forma cerrada el desempate de dos arqueros, con la misma regla que Round.execute_additional_shots y sin
+    simular sus rondas: la cantidad de rondas es geométrica con la probabilidad de que los lanzamientos difieran, el
+    ganador sale de P(primero > segundo) / (P(>) + P(<)), en cada ronda empatada ambos suman el mismo puntaje y en la
+    última suman un par de puntajes en el que el del ganador es mayor
+
+    Args:
+        first_class (type[PointsConverter]): Conversor de puntos del primer arquero
+        second_class (type[PointsConverter]): Conversor de puntos del segundo arquero
+        uniform (callable): Recibe una forma y devuelve Ri en [0, 1] con esa forma, por ejemplo
+            np.random.default_rng().random o Values.unit_random_values
+
+    Returns:
+        tuple[int, int, list[int]]: Posición del arquero ganador (0 o 1), cantidad de rondas de desempate y puntos
+        adicionales de cada arquero
+    """
+    winner_probability, end_probability, tied, last_round, width = two_archer_tie_break(first_class, second_class)
+    rounds_value, winner_value, last_value = uniform(3).tolist()
+    rounds = 1
+    if end_probability < 1:
+        # Inversa de la geométrica: P(rondas > k) = P(Ri < P(empate)^k); un Ri de 0 daría infinitas rondas
+        rounds += int(np.log(max(rounds_value, np.finfo(float).eps)) // np.log1p(-end_probability))
+    winner = 0 if winner_value < winner_probability else 1
+    tied_points = 0
+    if rounds > 1:
+        positions, cumulative = tied
+        shots = np.minimum(np.searchsorted(cumulative, uniform(rounds - 1), side="right"), len(positions) - 1)
+        tied_points = int(positions[shots].sum())
+    first_points, second_points = divmod(sample_cell(last_round[winner], last_value), width)
+    return winner, rounds, [tied_points + first_points, tied_points + second_points]
+
+
+def sample_tie_breaks(shot_distributions: list, size: int, uniform) -> tuple:
+    """
+    Simula a la vez size desempates independientes de los mismos arqueros, con la misma regla que
+    Round.execute_additional_shots: en cada ronda de desempate todos los arqueros empatados lanzan una vez, los puntos
+    se acumulan y termina cuando uno solo tiene el mayor total. Las rondas de todos los desempates pendientes se
+    sortean juntas con un arreglo de Ri por ronda. Round (modo sampled_shots) la usa con size=1 para los desempates
+    de tres o más arqueros; los de dos se sortean en forma cerrada con sample_two_archer_tie_break
+
+    Args:
+        shot_distributions (list[np.ndarray]): Distribución de los puntos de un lanzamiento de cada arquero empatado
+        size (int): Cantidad de desempates
+        uniform (callable): Recibe una forma y devuelve Ri en [0, 1] con esa forma, por ejemplo
+            np.random.default_rng().random o Values.unit_random_values
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Posición del arquero ganador y cantidad de rondas de cada desempate,
+        y puntos adicionales de cada arquero en cada desempate (forma (size, arqueros))
+    """
+    cumulative = np.cumsum(padded(shot_distributions), axis=1)
+    quantity_of_archers = len(shot_distributions)
+    points = np.zeros((size, quantity_of_archers), dtype=np.int64)
+    rounds = np.zeros(size, dtype=np.int64)
+    winners = np.full(size, -1, dtype=np.int64)
+    pending = np.arange(size)
+    while len(pending):
+        values = uniform((len(pending), quantity_of_archers))
+        for archer in range(quantity_of_archers):
+            # Inversa de la distribución acumulada
+            shots = np.searchsorted(cumulative[archer], values[:, archer], side="right")
+            points[pending, archer] += np.minimum(shots, cumulative.shape[1] - 1)
+        rounds[pending] += 1
+        totals = points[pending]
+        unique = (totals == totals.max(axis=1, keepdims=True)).sum(axis=1) == 1
+        winners[pending[unique]] = totals[unique].argmax(axis=1)
+        pending = pending[~unique]
+    return winners, rounds, points
+
+
+class AnalyticRound:
+    """
+    Distribución exacta del resultado de una ronda a partir del estado de los equipos al empezarla.
+
+    Attributes:
+        team_distributions (dict[str, np.ndarray]): Probabilidad de cada total de puntos de cada equipo (posición = puntos).
+        tie_probability (float): Probabilidad de que la ronda quede empatada.
+        win_probabilities (dict[str, float]): Probabilidad de que cada equipo gane la ronda.
+        archer_tie_probability (float): Probabilidad de que haya lanzamientos adicionales por empate de arqueros.
+    """
+    def __init__(self, teams: list):
+        """
+        Calcula las distribuciones de la ronda
+
+        Args:
+            teams (list[Team]): Equipos al empezar la ronda, en el orden en que los compara Round
+        """
+        self.team_distributions: dict[str, np.ndarray] = {}
+        archers = []
+        for team in teams:
+            total, archer_distributions = team_distributions(team)
+            self.team_distributions[team.name] = total
+            archers.extend(archer_distributions)
+        self.tie_probability, win_probabilities = winning_team_probabilities(list(self.team_distributions.values()))
+        self.win_probabilities = dict(zip(self.team_distributions, win_probabilities))
+        self.archer_tie_probability = archer_tie_probability(archers)
+
+    def expected_points(self) -> dict:
+        """
+        Devuelve los puntos esperados de cada equipo en la ronda
+
+        Returns:
+            dict[str, float]: puntos esperados por nombre de equipo
+        """
+        return {
+            name: float(np.arange(len(distribution)) @ distribution)
+            for name, distribution in self.team_distributions.items()
+        }
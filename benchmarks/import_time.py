@@ -0,0 +1,117 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+"""
+Benchmark del tiempo de importación de los módulos principales.
+
+Importa cada módulo en un proceso nuevo con python -X importtime y toma el tiempo acumulado del módulo (el menor de
+varias repeticiones). Falla si algún módulo carga dependencias pesadas que deben importarse de forma diferida
+(HEAVY_MODULES) o si su tiempo supera al de la línea base en más de la tolerancia.
+
+Ejemplo (desde la raíz del repositorio):
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --update-baseline
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, "benchmarks", "baselines", "import_time.json")
+
+MODULES = [
+    "random_library.Random",
+    "random_values",
+    "tournament_simulation",
+    "cli",
+    "main",
+]
+
+# Dependencias que ningún módulo debe cargar al importarse
+HEAVY_MODULES = {
+    "random_library.Random": ["scipy", "matplotlib", "PyQt5"],
+    "random_values": ["scipy", "matplotlib", "PyQt5"],
+    "tournament_simulation": ["scipy", "matplotlib", "PyQt5"],
+    "cli": ["scipy", "matplotlib", "PyQt5"],
+    "main": ["scipy", "matplotlib"],
+}
+
+
+def measure(module: str, repeats: int) -> dict:
+    """
+    Mide el tiempo de importación de un módulo
+
+    Args:
+        module (str): Nombre del módulo
+        repeats (int): Cantidad de procesos en los que se importa
+
+    Returns:
+        dict: menor tiempo acumulado en microsegundos y dependencias pesadas cargadas
+    """
+    times = []
+    loaded = set()
+    for _ in range(repeats):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        for line in process.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, name = line.split("|")
+            if name.strip() == module and not name.startswith("  "):
+                times.append(int(cumulative))
+            imported = name.strip().split(".")[0]
+            if imported in HEAVY_MODULES[module]:
+                loaded.add(imported)
+    return {"microseconds": min(times), "heavy_modules": sorted(loaded)}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Compara los resultados con la línea base
+
+    Returns:
+        list[str]: descripción de cada regresión encontrada
+    """
+    regressions = []
+    for module, result in results.items():
+        if result["heavy_modules"]:
+            regressions.append(f"{module} importa {', '.join(result['heavy_modules'])}")
+        reference = baseline.get(module)
+        if reference and result["microseconds"] > reference * (1 + tolerance):
+            regressions.append(
+                f"{module} tarda {result['microseconds']} µs en importarse (línea base {reference} µs)"
+            )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark del tiempo de importación")
+    parser.add_argument("--repeats", type=int, default=5, help="procesos por módulo")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="aumento relativo permitido sobre la línea base")
+    parser.add_argument("--update-baseline", action="store_true", help="guardar los resultados como línea base")
+    arguments = parser.parse_args(argv)
+
+    results = {module: measure(module, arguments.repeats) for module in MODULES}
+    if arguments.update_baseline:
+        os.makedirs(os.path.dirname(BASELINE), exist_ok=True)
+        with open(BASELINE, "w") as file:
+            json.dump({module: result["microseconds"] for module, result in results.items()}, file, indent=2)
+        regressions = []
+    else:
+        baseline = {}
+        if os.path.exists(BASELINE):
+            with open(BASELINE) as file:
+                baseline = json.load(file)
+        regressions = compare(results, baseline, arguments.tolerance)
+
+    print(json.dumps({"results": results, "regressions": regressions}, indent=2, ensure_ascii=False))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
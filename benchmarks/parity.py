@@ -0,0 +1,265 @@
+import argparse
+import json
+import sys
+import numpy as np
+import constants
+from random_library.generators.Congruences import LinealCongruence, RI_SCALE
+from random_library.generators.test.RandomTest import RandomTestFacade, bin_counts
+from tournament_simulation import Game, define_winner_index
+
+"""
+Verificaciones de paridad de las implementaciones vectorizadas con las implementaciones secuenciales a las que
+reemplazan.
+
+Cada verificación genera casos aleatorios con una semilla fija (incluidos los casos borde, como empates entre todos
+los participantes, rondas sin ganador, secuencias constantes o Ri iguales a 0 o 1) y compara el resultado de ambas
+implementaciones. Falla si algún caso difiere.
+
+Ejemplo (desde la raíz del repositorio):
+    python -m benchmarks.parity
+    python -m benchmarks.parity --only game --cases 100000
+"""
+
+SEED = 12345
+# Largos de las secuencias de las pruebas de aleatoriedad; cada lote tiene secuencias de un mismo largo
+SEQUENCE_SIZES = [5, 10, 37, 100, 999, 1000]
+BATCH_ROWS = 8
+
+
+def sequential_winner(participants: list):
+    """
+    Plegado secuencial original de Game.define_winner: cada participante con más puntaje que el ganador actual lo
+    reemplaza, uno con el mismo puntaje lo descarta y, sin ganador actual, el siguiente toma su lugar
+
+    Args:
+        participants (list[tuple]): Identificador y puntaje de cada participante, en el orden en que se comparan
+
+    Returns:
+        tuple: Identificador y puntaje del ganador, None si hubo empate
+    """
+    winner = None
+    for participant in participants:
+        if winner:
+            if participant[1] > winner[1]:
+                winner = participant
+            elif participant[1] == winner[1]:
+                winner = None
+        else:
+            winner = participant
+    return winner
+
+
+def sequential_rounds_won(round_winners: list) -> list:
+    """
+    Conteo original de rondas ganadas (Game.count_victories_by_team): los participantes quedan en el orden en que
+    ganaron su primera ronda
+
+    Args:
+        round_winners (list[int]): Identificador del ganador de cada ronda, -1 si no hubo ganador
+
+    Returns:
+        list[tuple]: Identificador y rondas ganadas de cada participante
+    """
+    counts = {}
+    for winner in round_winners:
+        if winner >= 0:
+            counts[winner] = counts.get(winner, 0) + 1
+    return list(counts.items())
+
+
+def check_game_winner(cases: int, rng: np.random.Generator) -> dict:
+    """
+    Compara Game.define_winner con el conteo y el plegado secuenciales sobre ganadores de ronda aleatorios
+    """
+    game = Game(0, None)
+    mismatches = []
+    for case in range(cases):
+        participants = int(rng.integers(1, 11))
+        # Con pocos participantes los empates en rondas ganadas son frecuentes
+        round_winners = rng.integers(-1, participants, constants.QUANTITY_OF_ROUNDS).astype(np.int16)
+        if case % 10 == 0:
+            round_winners[:] = -1
+        expected = sequential_winner(sequential_rounds_won(round_winners.tolist()))
+        expected = expected if expected else (-1, 0)
+        result = game.define_winner(round_winners)
+        if result != expected:
+            mismatches.append({"round_winners": round_winners.tolist(), "expected": expected, "result": result})
+    return {"cases": cases, "mismatches": mismatches}
+
+
+def check_winner_index(cases: int, rng: np.random.Generator) -> dict:
+    """
+    Compara define_winner_index con el plegado secuencial sobre puntajes aleatorios enteros (con empates) y reales
+    """
+    mismatches = []
+    for case in range(cases):
+        size = int(rng.integers(0, constants.QUANTITY_OF_ROUNDS + 1))
+        if case % 2 == 0:
+            scores = rng.integers(0, 4, size).astype(float)
+        else:
+            scores = rng.normal(1.5, 1, size)
+        winner = sequential_winner(list(enumerate(scores.tolist())))
+        expected = winner[0] if winner else -1
+        result = define_winner_index(scores)
+        if result != expected:
+            mismatches.append({"scores": scores.tolist(), "expected": expected, "result": result})
+    return {"cases": cases, "mismatches": mismatches}
+
+
+def edge_sequences(n: int) -> np.ndarray:
+    """
+    Secuencias borde de largo n: constantes (también en 0 y en 1), alternando 0 y 1, con valores sobre los bordes de
+    los intervalos de Sturges y aleatorias con un 0 y un 1
+    """
+    k = int(1 + 3.322 * np.log10(n))
+    on_edges = np.resize(np.linspace(0, 1, k + 1), n)
+    with_extremes = np.linspace(0.3, 0.7, n)
+    with_extremes[[0, -1]] = 1.0, 0.0
+    return np.array([
+        np.full(n, 0.5),
+        np.zeros(n),
+        np.ones(n),
+        np.resize([0.0, 1.0], n),
+        np.linspace(0, 1, n),
+        on_edges,
+        with_extremes,
+        np.round(np.resize([0.25, 0.75, 0.5], n), 5),
+    ])
+
+
+def random_test_batches(cases: int, rng: np.random.Generator):
+    """
+    Lotes de secuencias para las pruebas de aleatoriedad: Ri del generador congruencial (flotantes y cuantizados),
+    uniformes arbitrarios, uniformes con 5 decimales y secuencias borde, flotantes y cuantizadas
+
+    Yields:
+        np.ndarray: Lote de BATCH_ROWS secuencias (una por fila)
+    """
+    kinds = 6
+    for case in range(cases):
+        n = SEQUENCE_SIZES[case // kinds % len(SEQUENCE_SIZES)]
+        kind = case % kinds
+        if kind < 2:
+            generators = [
+                LinealCongruence(int(seed), 551757622, 12345, 31) for seed in rng.integers(1, 2**31 - 1, BATCH_ROWS)
+            ]
+            if kind == 0:
+                yield np.array([generator.generate_array(n) for generator in generators])
+            else:
+                yield np.array([generator.generate_quantized_array(n) for generator in generators])
+        elif kind == 2:
+            yield rng.random((BATCH_ROWS, n))
+        elif kind == 3:
+            yield rng.integers(0, RI_SCALE + 1, (BATCH_ROWS, n)) / RI_SCALE
+        elif kind == 4:
+            yield edge_sequences(n)
+        else:
+            yield np.rint(edge_sequences(n) * RI_SCALE).astype(np.int64)
+
+
+def same_statistic(expected: float, result: float) -> bool:
+    return expected == result or (np.isnan(expected) and np.isnan(result))
+
+
+def check_random_tests(cases: int, rng: np.random.Generator) -> dict:
+    """
+    Compara el run_batch de cada prueba de aleatoriedad y de la fachada (run_batch, passing y first_passing) con run
+    y run_all sobre cada fila del lote. En la prueba de Poker run devuelve las frecuencias observadas, por lo que se
+    compara el estadístico Chi-cuadrado que se calcula con ellas
+    """
+    facade = RandomTestFacade()
+    mismatches = []
+    rows = 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for batch in random_test_batches(cases, rng):
+            rows += len(batch)
+            for name, test in zip(facade.test_names, facade.tests):
+                batch_passed, batch_statistics = test.run_batch(batch)
+                for i, sequence in enumerate(batch):
+                    passed, statistic, expected = test.run(sequence)
+                    if name == "Poker":
+                        statistic = float(np.sum((np.array(statistic) - np.array(expected)) ** 2 / np.array(expected)))
+                    if bool(passed) != bool(batch_passed[i]) or not same_statistic(statistic, batch_statistics[i]):
+                        mismatches.append({
+                            "test": name,
+                            "sequence": sequence.tolist(),
+                            "expected": [bool(passed), float(statistic)],
+                            "result": [bool(batch_passed[i]), float(batch_statistics[i])],
+                        })
+            expected = np.array([facade.run_all(sequence)[1] for sequence in batch])
+            _, batch_passed = facade.run_batch(batch)
+            first = int(np.flatnonzero(expected)[0]) if expected.any() else -1
+            if (
+                not np.array_equal(batch_passed, expected)
+                or not np.array_equal(facade.passing(batch), expected)
+                or facade.first_passing(batch) != first
+            ):
+                mismatches.append({"test": "Fachada", "sequences": batch.tolist(), "expected": expected.tolist()})
+    return {"cases": rows, "mismatches": mismatches}
+
+
+def check_bin_counts(cases: int, rng: np.random.Generator) -> dict:
+    """
+    Compara bin_counts con np.histogram por fila, con bordes entre el mínimo y el máximo de cada fila, bordes fijos
+    en [0, 1], bordes de ancho 0, valores sobre los bordes y valores fuera de ellos
+    """
+    mismatches = []
+    for case in range(cases):
+        n = int(rng.integers(1, 200))
+        k = int(rng.integers(1, 12))
+        kind = case % 4
+        if kind == 0:
+            sequences = rng.random((BATCH_ROWS, n))
+        elif kind == 1:
+            sequences = rng.integers(0, 5, (BATCH_ROWS, n)) / 4
+        elif kind == 2:
+            sequences = np.resize(edge_sequences(max(n, 2)), (BATCH_ROWS, max(n, 2)))
+        else:
+            sequences = rng.normal(0.5, 0.5, (BATCH_ROWS, n))
+        if case % 3 == 0:
+            edges = np.broadcast_to(np.linspace(0, 1, k + 1), (len(sequences), k + 1))
+        else:
+            edges = np.linspace(sequences.min(axis=1), sequences.max(axis=1), k + 1, axis=1)
+        result = bin_counts(sequences, edges)
+        for i, sequence in enumerate(sequences):
+            expected, _ = np.histogram(sequence, bins=edges[i])
+            if not np.array_equal(result[i], expected):
+                mismatches.append({
+                    "sequence": sequence.tolist(),
+                    "edges": edges[i].tolist(),
+                    "expected": expected.tolist(),
+                    "result": result[i].tolist(),
+                })
+    return {"cases": cases * BATCH_ROWS, "mismatches": mismatches}
+
+
+# Verificación y cantidad de casos por defecto
+CHECKS = {
+    "game.define_winner": (check_game_winner, 20_000),
+    "define_winner_index": (check_winner_index, 20_000),
+    "random_test.run_batch": (check_random_tests, 72),
+    "random_test.bin_counts": (check_bin_counts, 5_000),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verificaciones de paridad con las implementaciones secuenciales")
+    parser.add_argument("--only", default=None, help="ejecutar solo las verificaciones cuyo nombre contiene el texto")
+    parser.add_argument("--cases", type=int, default=None, help="casos aleatorios por verificación, por defecto los de cada una")
+    parser.add_argument("--seed", type=int, default=SEED, help="semilla de los casos")
+    arguments = parser.parse_args(argv)
+
+    results = {}
+    for name, (check, cases) in CHECKS.items():
+        if arguments.only and arguments.only not in name:
+            continue
+        result = check(arguments.cases or cases, np.random.default_rng(arguments.seed))
+        # Alcanza con algunos ejemplos para reproducir una diferencia
+        results[name] = {"cases": result["cases"], "mismatches": len(result["mismatches"]), "examples": result["mismatches"][:3]}
+
+    print(json.dumps(results, indent=2))
+    return 1 if any(result["mismatches"] for result in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
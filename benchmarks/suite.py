@@ -0,0 +1,333 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import numpy as np
+import constants
+from random_library.Random import Random
+from random_library.generators.Congruences import LinealCongruence
+from random_library.distributions.Distributions import UniformDistribution, NormalDistribution
+from random_library.distributions.ExponentialDistribution import ExponentialDistribution
+from random_library.generators.test.RandomTest import (
+    MeanTest,
+    VarianceTest,
+    ChiSquareTest,
+    KolmogorovSmirnovTest,
+    PokerTest,
+    RunsTest,
+    RandomTestFacade,
+)
+from random_values import Values
+from tournament_simulation import Round, Game, Tournament
+from analytic import AnalyticRound
+
+"""
+Benchmarks de la librería de números aleatorios y de los caminos críticos de la simulación.
+
+Cada caso prepara sus datos con semillas fijas, hace una repetición de calentamiento y mide varias repeticiones
+(sin contar la preparación). Reporta el menor tiempo, la mediana, el rendimiento (elementos por segundo) y la memoria
+máxima reservada durante una repetición adicional medida con tracemalloc. Los resultados se imprimen en JSON y se
+comparan con la línea base guardada; un caso cuyo rendimiento cae más de la tolerancia se reporta como regresión.
+
+Ejemplo (desde la raíz del repositorio):
+    python -m benchmarks.suite
+    python -m benchmarks.suite --only random_test --repeats 5
+    python -m benchmarks.suite --tournament-games 100 1000 --update-baseline
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, "benchmarks", "baselines", "suite.json")
+
+SEED = 12345
+SEQUENCE_SIZE = 100_000
+TEST_SEQUENCE_SIZE = 10_000
+CANDIDATE_SEEDS = 64
+SCALAR_CALLS = 2_000
+ROUNDS_TO_EXECUTE = 1_000
+GAMES_TO_EXECUTE = 100
+TOURNAMENT_GAMES = [100, 1_000]
+
+
+def ri_sequence(n: int) -> list:
+    return LinealCongruence(xo_seed=SEED, k=551757622, c=12345, g=31).generate_sequence(n)
+
+
+def lcg_case():
+    generator = LinealCongruence(xo_seed=SEED, k=551757622, c=12345, g=31)
+    return lambda: generator.generate_sequence(SEQUENCE_SIZE)
+
+
+def lcg_array_case():
+    generator = LinealCongruence(xo_seed=SEED, k=551757622, c=12345, g=31)
+    return lambda: generator.generate_array(SEQUENCE_SIZE)
+
+
+def lcg_quantized_array_case():
+    generator = LinealCongruence(xo_seed=SEED, k=551757622, c=12345, g=31)
+    return lambda: generator.generate_quantized_array(SEQUENCE_SIZE)
+
+
+def uniform_case():
+    distribution = UniformDistribution(SEED, SEQUENCE_SIZE, 25, 45)
+    return distribution.generate_uniform
+
+
+def normal_case():
+    distribution = NormalDistribution(1.5, 1, SEED, SEQUENCE_SIZE)
+    return distribution.generate_normal
+
+
+def uniform_array_case():
+    distribution = UniformDistribution(SEED, SEQUENCE_SIZE, 25, 45)
+    return distribution.generate_uniform_array
+
+
+def normal_array_case():
+    distribution = NormalDistribution(1.5, 1, SEED, SEQUENCE_SIZE)
+    return distribution.generate_normal_array
+
+
+def exponential_case():
+    distribution = ExponentialDistribution(1.0, SEED, SEQUENCE_SIZE)
+    return distribution.generate_exponential
+
+
+def random_test_case(test_class):
+    def setup():
+        sequence = ri_sequence(TEST_SEQUENCE_SIZE)
+        test = test_class()
+        return lambda: test.run(sequence)
+    return setup
+
+
+def random_test_quantized_case(test_class):
+    def setup():
+        sequence = LinealCongruence(xo_seed=SEED, k=551757622, c=12345, g=31).generate_quantized_array(TEST_SEQUENCE_SIZE)
+        test = test_class()
+        return lambda: test.run(sequence)
+    return setup
+
+
+def facade_case():
+    def setup():
+        sequence = ri_sequence(TEST_SEQUENCE_SIZE)
+        facade = RandomTestFacade()
+        return lambda: facade.run_all(sequence)
+    return setup
+
+
+def facade_batch_case():
+    generator = LinealCongruence(xo_seed=SEED, k=551757622, c=12345, g=31)
+    sequences = generator.generate_array_batch(range(SEED, SEED + Random.SCREEN_BATCH_SIZE), TEST_SEQUENCE_SIZE)
+    facade = RandomTestFacade()
+    return lambda: facade.run_batch(sequences)
+
+
+def screen_seeds_case():
+    random = Random()
+    return lambda: random.screen_seeds(range(SEED, SEED + CANDIDATE_SEEDS), TEST_SEQUENCE_SIZE)
+
+
+def random_scalar_case():
+    random = Random(seed=SEED)
+
+    def run():
+        for _ in range(SCALAR_CALLS):
+            random.random()
+    return run
+
+
+def values_random_value_case(quantized: bool):
+    def setup():
+        values = Values(GAMES_TO_EXECUTE, SEED, quantized=quantized)
+
+        def run():
+            for _ in range(SCALAR_CALLS):
+                values.random_value()
+        return run
+    return setup
+
+
+def round_case():
+    values = Values(ROUNDS_TO_EXECUTE // constants.QUANTITY_OF_ROUNDS + 1, SEED)
+    teams = Tournament.build_teams(values)
+
+    def run():
+        for i in range(ROUNDS_TO_EXECUTE):
+            Round(i % constants.QUANTITY_OF_ROUNDS, i // constants.QUANTITY_OF_ROUNDS, values).execute(teams)
+    return run
+
+
+def analytic_round_case():
+    values = Values(1, SEED)
+    teams = Tournament.build_teams(values)
+
+    def run():
+        for _ in range(ROUNDS_TO_EXECUTE):
+            AnalyticRound(teams)
+    return run
+
+
+def game_case():
+    values = Values(GAMES_TO_EXECUTE, SEED)
+    teams = Tournament.build_teams(values)
+
+    def run():
+        for i in range(GAMES_TO_EXECUTE):
+            Game(i, values).execute(teams)
+    return run
+
+
+def tournament_case(quantity_of_games: int):
+    def setup():
+        tournament = Tournament(max_games=quantity_of_games, seed=SEED, verbose=False)
+        return tournament.execute
+    return setup
+
+
+def cases(tournament_games: list) -> dict:
+    """
+    Devuelve los casos del benchmark
+
+    Returns:
+        dict: por nombre de caso, la cantidad de elementos que procesa y la función que lo prepara
+    """
+    benchmark_cases = {
+        "lcg.generate_sequence": (SEQUENCE_SIZE, lcg_case),
+        "distribution.uniform": (SEQUENCE_SIZE, uniform_case),
+        "distribution.normal": (SEQUENCE_SIZE, normal_case),
+        "distribution.exponential": (SEQUENCE_SIZE, exponential_case),
+        "lcg.generate_array": (SEQUENCE_SIZE, lcg_array_case),
+        "lcg.generate_quantized_array": (SEQUENCE_SIZE, lcg_quantized_array_case),
+        "distribution.uniform_array": (SEQUENCE_SIZE, uniform_array_case),
+        "distribution.normal_array": (SEQUENCE_SIZE, normal_array_case),
+    }
+    for test_class in (MeanTest, VarianceTest, ChiSquareTest, KolmogorovSmirnovTest, PokerTest, RunsTest):
+        benchmark_cases[f"random_test.{test_class.__name__}"] = (TEST_SEQUENCE_SIZE, random_test_case(test_class))
+    benchmark_cases["random_test.PokerTest[quantized]"] = (TEST_SEQUENCE_SIZE, random_test_quantized_case(PokerTest))
+    benchmark_cases["random_test.facade.run_all"] = (TEST_SEQUENCE_SIZE, facade_case())
+    benchmark_cases["random_test.facade.run_batch"] = (Random.SCREEN_BATCH_SIZE * TEST_SEQUENCE_SIZE, facade_batch_case)
+    benchmark_cases["random.screen_seeds"] = (CANDIDATE_SEEDS, screen_seeds_case)
+    benchmark_cases["random.scalar"] = (SCALAR_CALLS, random_scalar_case)
+    benchmark_cases["values.random_value"] = (SCALAR_CALLS, values_random_value_case(False))
+    benchmark_cases["values.random_value[quantized]"] = (SCALAR_CALLS, values_random_value_case(True))
+    benchmark_cases["round.execute"] = (ROUNDS_TO_EXECUTE, round_case)
+    benchmark_cases["analytic.round"] = (ROUNDS_TO_EXECUTE, analytic_round_case)
+    benchmark_cases["game.execute"] = (GAMES_TO_EXECUTE, game_case)
+    for quantity_of_games in tournament_games:
+        benchmark_cases[f"tournament.execute[{quantity_of_games}]"] = (quantity_of_games, tournament_case(quantity_of_games))
+    return benchmark_cases
+
+
+def measure(items: int, setup, repeats: int) -> dict:
+    """
+    Mide un caso del benchmark
+
+    Args:
+        items (int): Cantidad de elementos que procesa una repetición
+        setup (callable): Prepara los datos y devuelve la función a medir
+        repeats (int): Cantidad de repeticiones medidas
+
+    Returns:
+        dict: tiempos en segundos, rendimiento y memoria máxima en bytes
+    """
+    # Repetición de calentamiento: importaciones diferidas y cachés no cuentan en la medición
+    setup()()
+
+    times = []
+    for _ in range(repeats):
+        run = setup()
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    run = setup()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    best = min(times)
+    return {
+        "items": items,
+        "seconds": best,
+        "median_seconds": statistics.median(times),
+        "throughput": items / best if best > 0 else float("inf"),
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Compara el rendimiento de cada caso con la línea base
+
+    Returns:
+        list[str]: descripción de cada regresión encontrada
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference and result["throughput"] < reference["throughput"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {result['throughput']:.1f} elementos/s (línea base {reference['throughput']:.1f})"
+            )
+    return regressions
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de la librería aleatoria y de la simulación")
+    parser.add_argument("--repeats", type=int, default=3, help="repeticiones medidas por caso")
+    parser.add_argument("--only", default=None, help="ejecutar solo los casos cuyo nombre contiene este texto")
+    parser.add_argument("--tournament-games", type=int, nargs="+", default=TOURNAMENT_GAMES, help="cantidades de juegos del torneo completo")
+    parser.add_argument("--output", default=None, help="archivo donde guardar el JSON de resultados")
+    parser.add_argument("--baseline", default=BASELINE, help="archivo de la línea base")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="caída relativa de rendimiento permitida")
+    parser.add_argument("--update-baseline", action="store_true", help="guardar los resultados como línea base")
+    arguments = parser.parse_args(argv)
+
+    results = {}
+    for name, (items, setup) in cases(arguments.tournament_games).items():
+        if arguments.only and arguments.only not in name:
+            continue
+        results[name] = measure(items, setup, arguments.repeats)
+        print(f"{name}: {results[name]['throughput']:.1f} elementos/s", file=sys.stderr)
+
+    regressions = []
+    if arguments.update_baseline:
+        baseline = {}
+        if os.path.exists(arguments.baseline):
+            with open(arguments.baseline) as file:
+                baseline = json.load(file)["results"]
+        baseline.update(results)
+        os.makedirs(os.path.dirname(arguments.baseline), exist_ok=True)
+        with open(arguments.baseline, "w") as file:
+            json.dump({"environment": environment(), "results": baseline}, file, indent=2)
+    elif os.path.exists(arguments.baseline):
+        with open(arguments.baseline) as file:
+            regressions = compare(results, json.load(file)["results"], arguments.tolerance)
+
+    report = {"environment": environment(), "results": results, "regressions": regressions}
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(report, file, indent=2)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
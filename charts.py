@@ -0,0 +1,456 @@
+from PyQt5.QtWidgets import QWidget, QVBoxLayout
+import matplotlib
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.colors import LogNorm
+from matplotlib.ticker import MaxNLocator
+from decimation import min_max_decimate, bin_pairs, binned_linear_fit, POINTS_BY_PIXEL
+import constants
+
+matplotlib.use("Qt5Agg")
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+
+"""
+Gráficos del panel de resultados.
+
+Se separan de main para que matplotlib solo se importe cuando hay gráficos que dibujar.
+"""
+
+class TiedRoundsPieChart(QWidget):
+    def __init__(self, tied_rounds, total_rounds, parent=None):
+        super().__init__(parent)
+
+        layout = QVBoxLayout(self)
+
+        # Crear figura y canvas
+        self.figure = Figure(figsize=(6, 6))
+        self.canvas = FigureCanvas(self.figure)
+        layout.addWidget(self.canvas)
+
+        # Dibujar gráfico
+        self.plot(tied_rounds, total_rounds)
+
+    def plot(self, tied_rounds, total_rounds):
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        if total_rounds == 0:
+            ax.set_axis_off()
+            ax.set_title("Porcentaje de rondas empatadas vs no empatadas")
+            self.canvas.draw_idle()
+            return
+
+        # Datos
+        rondas_no_empatadas = total_rounds - tied_rounds
+        valores = [tied_rounds, rondas_no_empatadas]
+        etiquetas = ["Empatadas", "No empatadas"]
+        colores = ["skyblue", "lightcoral"]
+
+        # Gráfico circular (sin labels)
+        wedges, texts, autotexts = ax.pie(
+            valores,
+            labels=None,  # No mostrar etiquetas en el gráfico
+            autopct="%1.1f%%",
+            colors=colores,
+            startangle=90,
+            explode=(0.05, 0),
+        )
+
+        # Añadir leyenda debajo del gráfico
+        ax.legend(
+            wedges,
+            etiquetas,
+            loc="lower center",
+            bbox_to_anchor=(0.5, -0.1),
+            fontsize=12,
+            ncol=2,
+            frameon=False,
+        )
+
+        ax.set_title("Porcentaje de rondas empatadas vs no empatadas")
+        self.canvas.draw_idle()
+
+
+class AccumulatedPointsChart(QWidget):
+    def __init__(self, points_data, title: str, y_label: str, parent=None):
+        super().__init__(parent)
+
+        self.title = title
+        self.y_label = y_label
+
+        layout = QVBoxLayout(self)
+
+        # Crear figura y canvas
+        self.figure, self.ax = plt.subplots(figsize=(8, 5))
+        self.canvas = FigureCanvas(self.figure)
+        layout.addWidget(self.canvas)
+
+        # Barra de herramientas para acercar y desplazar
+        layout.addWidget(NavigationToolbar(self.canvas, self))
+
+        # Estado de líneas activas
+        self.lines = []  # todas las líneas
+        self.series = []  # datos completos de cada línea, se dibujan decimados
+        self.active_lines = set()  # las seleccionadas
+
+        # Dibujar gráfico
+        self.plot(points_data)
+
+        # Las líneas se redibujan sobre el fondo guardado al seleccionarlas en la leyenda
+        self.blit_manager = BlitManager(self.canvas, self.lines)
+
+        # Conectar evento de click
+        self.canvas.mpl_connect("pick_event", self.on_pick)
+        self.canvas.mpl_connect("resize_event", self.decimate_lines)
+
+    def plot(self, points_data):
+        self.ax.clear()
+        self.lines.clear()
+        self.series.clear()
+        self.active_lines.clear()
+
+        # Dibujar cada jugador con a lo sumo dos puntos por píxel
+        for name, acumulados in points_data.items():
+            y = np.asarray(acumulados)
+            x = np.arange(1, len(y) + 1)
+            self.series.append((x, y))
+            (line,) = self.ax.plot(
+                *min_max_decimate(x, y, self.max_points()), label=name, picker=True
+            )
+            self.lines.append(line)
+
+        # Al acercar o desplazar se decima de nuevo desde los datos completos
+        self.ax.callbacks.connect("xlim_changed", self.decimate_lines)
+
+        # Leyenda
+        legend = self.ax.legend(
+            loc="upper left",
+            fontsize=12,
+            markerscale=4.0,
+            handlelength=3,
+            borderpad=1.2,
+        )
+        for legline, origline in zip(legend.get_lines(), self.lines):
+            legline.set_picker(True)
+            legline._associated_line = origline
+
+        self.ax.set_title(self.title)
+        self.ax.set_xlabel("Rondas")
+        self.ax.set_ylabel(self.y_label)
+        self.ax.grid(True, alpha=0.3)
+
+        self.canvas.draw()
+
+    def max_points(self) -> int:
+        """
+        Cantidad máxima de puntos por línea según el ancho actual de los ejes
+        """
+        return POINTS_BY_PIXEL * max(int(self.ax.bbox.width), 1)
+
+    def decimate_lines(self, _=None):
+        """
+        Decima cada línea en el rango visible del eje x
+        """
+        x_range = self.ax.get_xlim()
+        max_points = self.max_points()
+        for line, (x, y) in zip(self.lines, self.series):
+            line.set_data(*min_max_decimate(x, y, max_points, x_range))
+        self.canvas.draw_idle()
+
+    def on_pick(self, event):
+        legline = event.artist
+        if not hasattr(legline, "_associated_line"):
+            return  # ignorar clicks fuera de la leyenda
+
+        origline = legline._associated_line
+
+        if origline in self.active_lines:
+            # Si ya estaba seleccionada → la quitamos
+            self.active_lines.remove(origline)
+        else:
+            # Si no estaba → la añadimos
+            self.active_lines.add(origline)
+
+        if self.active_lines:
+            # Mostrar solo las seleccionadas
+            for line in self.lines:
+                line.set_visible(line in self.active_lines)
+        else:
+            # Si no hay ninguna seleccionada → mostrar todas
+            for line in self.lines:
+                line.set_visible(True)
+
+        self.blit_manager.update()
+
+
+class SpecialsExperienceChart(QWidget):
+    def __init__(self, specials, experience, density=None, parent=None):
+        """
+        Args:
+            specials (list): Lanzamientos especiales de cada juego
+            experience (list): Experiencia ganada en cada juego
+            density (bool): Dibuja la densidad de pares en lugar de un punto por juego; None para usarla cuando hay
+                más de DENSITY_THRESHOLD juegos
+        """
+        super().__init__(parent)
+
+        # Layout principal
+        layout = QVBoxLayout(self)
+
+        # Crear figura y canvas
+        self.figure = Figure(figsize=(6, 4))
+        self.canvas = FigureCanvas(self.figure)
+        layout.addWidget(self.canvas)
+
+        # Guardar datos y dibujar
+        self.specials = specials
+        self.experience = experience
+        self.density = len(specials) > constants.DENSITY_THRESHOLD if density is None else density
+        self.plot()
+
+    def plot(self):
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+
+        # Pares (especiales, experiencia) agrupados: el dibujo de densidad y la tendencia no dependen de los juegos
+        specials_values, experience_values, counts = bin_pairs(self.specials, self.experience)
+
+        if self.density and counts.size:
+            # Cada celda es un par de valores enteros, coloreada según la cantidad de juegos
+            mesh = ax.pcolormesh(
+                np.append(specials_values, specials_values[-1] + 1) - 0.5,
+                np.append(experience_values, experience_values[-1] + 1) - 0.5,
+                np.ma.masked_equal(counts.T, 0),
+                cmap="Blues",
+                norm=LogNorm(vmin=1, vmax=max(counts.max(), 1)),
+            )
+            self.figure.colorbar(mesh, ax=ax, label="Juegos")
+        else:
+            # Puntos de dispersión
+            ax.scatter(
+                self.specials, self.experience, color="blue", alpha=0.6, label="Juegos"
+            )
+
+        # Ajuste lineal (recta de tendencia)
+        fit = binned_linear_fit(specials_values, experience_values, counts)
+        if fit is not None:
+            m, b = fit
+            x_limits = np.array([specials_values[0], specials_values[-1]])
+            ax.plot(x_limits, m * x_limits + b, color="red", label="Tendencia")
+
+        # Etiquetas y título
+        ax.set_xlabel("Lanzamientos especiales por equipo")
+        ax.set_ylabel("Experiencia ganada por equipo")
+        ax.set_title("Correlación entre lanzamientos especiales y experiencia")
+        ax.legend()
+
+        ax.grid(alpha=0.3)
+
+        # Dibujar en canvas
+        self.canvas.draw()
+
+
+class TeamsBoxplotChart(QWidget):
+    def __init__(self, points_histogram_by_team, parent=None):
+        """
+        Args:
+            points_histogram_by_team (dict[str, IntegerHistogram]): Histograma de los puntos por ronda de cada equipo
+        """
+        super().__init__(parent)
+
+        layout = QVBoxLayout(self)
+        self.figure = Figure(figsize=(6, 4))
+        self.canvas = FigureCanvas(self.figure)
+        layout.addWidget(self.canvas)
+
+        # Estadísticas del diagrama de caja y muestra de puntos, calculadas una sola vez
+        rng = np.random.default_rng(0)
+        self.box_statistics = [
+            histogram.box_statistics(label=team) for team, histogram in points_histogram_by_team.items()
+        ]
+        self.samples = [
+            histogram.sample(constants.SCATTER_SAMPLE_SIZE, rng) for histogram in points_histogram_by_team.values()
+        ]
+        self.hover_index = None
+        self.plot()
+        self.blit_manager = BlitManager(self.canvas, [self.annotation])
+
+        # Conectar evento de movimiento del mouse
+        self.canvas.mpl_connect("motion_notify_event", self.on_hover)
+        # Las posiciones en pantalla de los puntos cambian con cada dibujo
+        self.canvas.mpl_connect("draw_event", self.index_points)
+
+    def plot(self):
+        self.ax = self.figure.add_subplot(111)
+        self.ax.clear()
+
+        # Dibujar boxplot a partir de las estadísticas precalculadas
+        bp = self.ax.bxp(
+            self.box_statistics,
+            showmeans=True,
+            meanline=True,
+            patch_artist=True,
+        )
+
+        # Dibujar encima una muestra de los puntos individuales, con desplazamiento horizontal aleatorio
+        rng = np.random.default_rng(0)
+        self.scatter_points = []
+        for i, sample in enumerate(self.samples, start=1):
+            jitter = rng.uniform(-0.08, 0.08, len(sample))
+            sc = self.ax.scatter(i + jitter, sample, alpha=0.6)
+            self.scatter_points.append(sc)
+
+        self.ax.set_title("Dispersión de puntajes por equipo")
+        self.ax.set_xlabel("Equipo")
+        self.ax.set_ylabel("Puntaje por ronda")
+        self.ax.grid(alpha=0.3)
+        self.ax.yaxis.set_major_locator(MaxNLocator(nbins=15))
+
+        # === Añadir texto de cuartiles y mediana ===
+        for i, statistics in enumerate(self.box_statistics, start=1):
+            q1, med, q3 = statistics["q1"], statistics["med"], statistics["q3"]
+
+            self.ax.text(
+                i + 0.1, q1, f"Q1={q1:.1f}", va="center", fontsize=8, color="blue"
+            )
+            self.ax.text(
+                i + 0.1, med, f"Med={med:.1f}", va="center", fontsize=8, color="red"
+            )
+            self.ax.text(
+                i + 0.1, q3, f"Q3={q3:.1f}", va="center", fontsize=8, color="green"
+            )
+
+        # Crear anotación (tooltip oculto inicialmente)
+        self.annotation = self.ax.annotate(
+            "",
+            xy=(0, 0),
+            xytext=(15, 15),
+            textcoords="offset points",
+            bbox=dict(boxstyle="round", fc="w"),
+            arrowprops=dict(arrowstyle="->"),
+        )
+        self.annotation.set_visible(False)
+
+        self.canvas.draw()
+
+    def update_annotation(self, x, y, text):
+        """Actualiza el tooltip con la posición y texto"""
+        self.annotation.xy = (x, y)
+        self.annotation.set_text(text)
+        self.annotation.set_visible(True)
+        self.blit_manager.update()
+
+    def index_points(self, event=None):
+        """Indexa las posiciones en pantalla de los puntos dibujados"""
+        offsets = np.concatenate([sc.get_offsets() for sc in self.scatter_points])
+        self.hover_index = ScreenPointIndex(offsets, self.ax.transData.transform(offsets))
+
+    def on_hover(self, event):
+        """Detecta cuando el mouse pasa sobre un punto"""
+        vis = self.annotation.get_visible()
+        if event.inaxes == self.ax and self.hover_index is not None:
+            point = self.hover_index.nearest(event.x, event.y)
+            if point is not None:
+                x, y = point
+                self.update_annotation(x, y, f"Puntaje: {y:.1f}")
+                return
+        if vis:
+            self.annotation.set_visible(False)
+            self.blit_manager.update()
+
+
+class BlitManager:
+    """
+    Redibuja solo los artistas que cambian (líneas seleccionadas, tooltip) sobre una copia del resto de la figura.
+
+    Los artistas administrados se marcan como animados solo mientras se redibujan con blit: la primera actualización
+    después de un dibujo completo dibuja la figura sin ellos, guarda el fondo con copy_from_bbox y los dibuja encima;
+    las siguientes restauran el fondo con restore_region, dibujan los artistas y copian el resultado a pantalla con
+    blit. Fuera de eso los artistas son normales, por lo que los dibujos completos y los archivos guardados (PDF, SVG,
+    PNG) los incluyen.
+
+    Attributes:
+        canvas (FigureCanvas): Lienzo de la figura.
+        artists (list[Artist]): Artistas que se redibujan en cada actualización.
+        background: Copia del fondo de la figura sin los artistas, None si hay que volver a tomarla.
+    """
+    def __init__(self, canvas, artists: list):
+        self.canvas = canvas
+        self.artists = []
+        self.background = None
+        for artist in artists:
+            self.add_artist(artist)
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+
+    def add_artist(self, artist):
+        self.artists.append(artist)
+
+    def on_draw(self, event):
+        """Guarda el fondo si el dibujo completo omitió los artistas; si no, el fondo guardado ya no sirve"""
+        # Al guardar la figura en otro formato el evento llega desde el lienzo del archivo
+        if event is not None and event.canvas is not self.canvas:
+            return
+        if self.artists and self.artists[0].get_animated():
+            self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+            self.draw_artists()
+        else:
+            self.background = None
+
+    def draw_artists(self):
+        for artist in self.artists:
+            self.canvas.figure.draw_artist(artist)
+
+    def update(self):
+        """Redibuja los artistas sobre el fondo guardado"""
+        if not self.canvas.supports_blit:
+            self.canvas.draw_idle()
+            return
+        self.__set_animated(True)
+        try:
+            if self.background is None:
+                self.canvas.draw()
+            self.canvas.restore_region(self.background)
+            self.draw_artists()
+            self.canvas.blit(self.canvas.figure.bbox)
+        finally:
+            self.__set_animated(False)
+
+    def __set_animated(self, animated: bool):
+        for artist in self.artists:
+            artist.set_animated(animated)
+
+
+class ScreenPointIndex:
+    """
+    Índice de puntos por su posición en pantalla para encontrar en tiempo logarítmico el punto bajo el mouse.
+
+    Los puntos se ordenan por su coordenada y en píxeles; una búsqueda binaria limita los candidatos a la franja
+    horizontal del mouse y entre ellos se elige el más cercano.
+
+    Attributes:
+        data_points (np.ndarray): Coordenadas de los puntos en los datos, en el orden del índice.
+        screen_x (np.ndarray): Coordenada x de los puntos en píxeles.
+        screen_y (np.ndarray): Coordenada y de los puntos en píxeles, ordenada de forma ascendente.
+        radius (float): Distancia máxima en píxeles entre el mouse y el punto.
+    """
+    def __init__(self, data_points, screen_points, radius: float = 5.0):
+        order = np.argsort(screen_points[:, 1], kind="stable")
+        self.data_points = np.asarray(data_points)[order]
+        self.screen_x = screen_points[order, 0]
+        self.screen_y = screen_points[order, 1]
+        self.radius = radius
+
+    def nearest(self, x: float, y: float):
+        """
+        Devuelve las coordenadas en los datos del punto más cercano a (x, y), o None si ninguno está dentro del radio
+        """
+        start = np.searchsorted(self.screen_y, y - self.radius, side="left")
+        stop = np.searchsorted(self.screen_y, y + self.radius, side="right")
+        if start == stop:
+            return None
+        distances = np.hypot(self.screen_x[start:stop] - x, self.screen_y[start:stop] - y)
+        closest = int(np.argmin(distances))
+        if distances[closest] > self.radius:
+            return None
+        return tuple(self.data_points[start + closest])
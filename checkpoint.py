@@ -0,0 +1,132 @@
+import json
+import os
+import numpy as np
+
+"""
+Módulo de puntos de control del torneo.
+
+Guarda de forma compacta (arreglos de NumPy comprimidos, sin serializar cada juego) el estado necesario para
+reanudar un torneo: contadores de arqueros y equipos, series acumuladas, índice del juego actual y posición de
+los generadores aleatorios. La escritura es atómica: se escribe un archivo temporal que luego reemplaza al anterior,
+por lo que una interrupción nunca deja un punto de control a medio escribir.
+"""
+
+METADATA = "metadata"
+
+def save_checkpoint(tournament, path: str):
+    """
+    Guarda el estado reanudable del torneo en path
+
+    Args:
+        tournament (Tournament): Torneo a guardar, entre dos lotes de juegos
+        path (str): Archivo del punto de control
+    """
+    archers = [archer for team in tournament.teams for archer in team.archers]
+    metadata = {
+        "config": {
+            "tolerance": tournament.tolerance,
+            "max_games": tournament.max_games,
+            "batch_size": tournament.batch_size,
+            "confidence": tournament.confidence,
+            "seed": tournament.seed,
+            "antithetic": tournament.antithetic,
+            "analytic": tournament.analytic,
+            "sampled_shots": tournament.sampled_shots,
+            "quantized": tournament.quantized,
+            "pool_path": tournament.pool_path,
+            "keep_observations": tournament.keep_observations,
+            "results_path": tournament.results_path,
+            "quantity_of_teams": tournament.quantity_of_teams,
+            "archers_by_team": tournament.archers_by_team,
+        },
+        "quantity_of_games": tournament.quantity_of_games,
+        "female_wins": tournament.female_wins,
+        "male_wins": tournament.male_wins,
+        "tied_rounds": tournament.tied_rounds,
+        "expected_tied_rounds": tournament.expected_tied_rounds,
+        "values": tournament.values.positions(),
+        "teams": [
+            {
+                "name": team.name,
+                "quantity_games_won": team.quantity_games_won,
+                "repeated_special_archer": team.repeated_special_archer,
+            }
+            for team in tournament.teams
+        ],
+        "archers": [
+            {
+                "name": archer.name,
+                "team": archer.team,
+                "gender": archer.gender.name,
+                "luck": archer.luck,
+                "current_resistance": archer.current_resistance,
+                "quantity_luckiest_games": archer.quantity_luckiest_games,
+                "quantity_experienced_games": archer.quantity_experienced_games,
+                "round_points": archer.round_points,
+            }
+            for archer in archers
+        ],
+        "estimates": _estimates_metadata(tournament.estimates.estimates),
+        "pair_estimates": _estimates_metadata(tournament.estimates.pair_estimates),
+        "observations": list(tournament.estimates.observations) if tournament.estimates.observations is not None else None,
+    }
+
+    arrays = {
+        METADATA: np.array(json.dumps(metadata)),
+        "female_experience_by_round": np.asarray(tournament.female_experience_by_round.view(), dtype=np.int64),
+        "male_experience_by_round": np.asarray(tournament.male_experience_by_round.view(), dtype=np.int64),
+    }
+    for i, team in enumerate(tournament.teams):
+        arrays[f"team_{i}_points_by_round"] = np.asarray(team.points_by_round.view(), dtype=np.int32)
+        arrays[f"team_{i}_special_shots_by_game"] = np.asarray(team.special_shots_by_game.view(), dtype=np.int32)
+        arrays[f"team_{i}_experience_by_game"] = np.asarray(team.experience_by_game.view(), dtype=np.int32)
+        arrays[f"team_{i}_puntuations"] = np.array(
+            [
+                (puntuation.game, puntuation.round, puntuation.points, puntuation.experience_gained, puntuation.total_special_shots)
+                for puntuation in team.puntuations
+            ],
+            dtype=np.int32,
+        ).reshape(-1, 5)
+    for i, archer in enumerate(archers):
+        arrays[f"archer_{i}_acumulation_points"] = np.asarray(archer.acumulation_points.view(), dtype=np.int64)
+    if tournament.estimates.observations is not None:
+        arrays["observations"] = np.array(list(tournament.estimates.observations.values()), dtype=np.float64)
+
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as file:
+        np.savez_compressed(file, **arrays)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_path, path)
+
+
+def load_checkpoint(path: str):
+    """
+    Lee un punto de control guardado con save_checkpoint
+
+    Args:
+        path (str): Archivo del punto de control
+
+    Returns:
+        tuple[dict, dict]: metadatos del torneo y arreglos de las series acumuladas
+    """
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in data.files}
+    metadata = json.loads(str(arrays.pop(METADATA)))
+    return metadata, arrays
+
+
+def _estimates_metadata(estimates: dict) -> dict:
+    """
+    Devuelve el estado de cada estimando acumulado
+
+    Args:
+        estimates (dict[str, RunningEstimate]): estimandos a guardar
+
+    Returns:
+        dict: cantidad, media y m2 por nombre de estimando
+    """
+    return {
+        name: [estimate.count, estimate.mean, estimate.m2]
+        for name, estimate in estimates.items()
+    }
@@ -0,0 +1,228 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import constants
+from tournament_simulation import Tournament
+from random_pool import ensure_pool, pool_directory
+
+"""
+Ejecución del torneo por línea de comandos, sin interfaz gráfica.
+
+No importa PyQt5 ni matplotlib, por lo que sirve para ejecuciones por lotes o en clústeres. Los juegos se reparten
+entre los procesos indicados, cada uno con una semilla derivada de la semilla base y su propio directorio de
+resultados (ver results_store). Con --pool-dir cada proceso lee sus valores aleatorios de un pool precalculado
+(ver random_pool), que se construye la primera vez y se reutiliza en las ejecuciones siguientes con la misma semilla
+y cantidad de juegos. Al terminar se escribe summary.json en el directorio de salida y se imprime en la
+salida estándar una línea JSON con el rendimiento (juegos por segundo) y los resultados agregados.
+
+Ejemplo:
+    python cli.py --games 20000 --workers 4 --seed 123 --output resultados
+"""
+
+def worker_seed(seed: int, worker: int) -> int:
+    """
+    Deriva la semilla de un proceso a partir de la semilla base
+
+    Args:
+        seed (int): Semilla base
+        worker (int): Número del proceso
+
+    Returns:
+        int: Semilla del proceso
+    """
+    return (seed * 1000003 + worker) % (2**31 - 1)
+
+
+def split_games(games: int, workers: int) -> list:
+    """
+    Reparte los juegos entre los procesos
+
+    Args:
+        games (int): Cantidad total de juegos
+        workers (int): Cantidad de procesos
+
+    Returns:
+        list[int]: Cantidad de juegos de cada proceso
+    """
+    base, remainder = divmod(games, workers)
+    return [base + (1 if i < remainder else 0) for i in range(workers)]
+
+
+def run_worker(arguments: dict) -> dict:
+    """
+    Ejecuta un torneo con los argumentos de un proceso y devuelve sus resultados agregados
+
+    Args:
+        arguments (dict): Argumentos del torneo del proceso
+
+    Returns:
+        dict: Resultados agregados del torneo
+    """
+    progress = print_progress_stderr if arguments.pop("progress") else None
+    instrument = arguments.pop("instrument")
+    profile_path = arguments.pop("profile_path")
+    pool_root = arguments.pop("pool_root")
+    if pool_root:
+        quantity_of_archers = arguments["quantity_of_teams"] * arguments["archers_by_team"]
+        pool = ensure_pool(
+            pool_directory(pool_root, arguments["max_games"], arguments["seed"], quantity_of_archers),
+            arguments["max_games"],
+            arguments["seed"],
+            quantity_of_archers,
+        )
+        arguments["pool_path"] = pool.directory
+    if instrument:
+        import instrumentation
+
+        instrumentation.enable(profile_path)
+    start_time = time.perf_counter()
+    tournament = Tournament(verbose=False, progress=progress, **arguments)
+    tournament.execute()
+    elapsed = time.perf_counter() - start_time
+    results = {
+        "seed": tournament.seed,
+        "games": tournament.quantity_of_games,
+        "seconds": elapsed,
+        "tied_rounds": tournament.tied_rounds,
+        "expected_tied_rounds": tournament.expected_tied_rounds if tournament.analytic else None,
+        "female_wins": tournament.female_wins,
+        "male_wins": tournament.male_wins,
+        "games_won": {team.name: team.quantity_games_won for team in tournament.teams},
+        "luckiest_games": {
+            archer.name: archer.quantity_luckiest_games
+            for team in tournament.teams
+            for archer in team.archers
+        },
+    }
+    if instrument:
+        results["instrumentation"] = instrumentation.disable().report()
+    return results
+
+
+def print_progress_stderr(games: int, max_games: int):
+    """
+    Imprime el progreso en la salida de errores para no mezclarlo con la salida JSON
+    """
+    print(f"\rProgreso: {games / max_games * 100:.1f}% ({games}/{max_games})", end="", file=sys.stderr, flush=True)
+
+
+def merge_results(results: list) -> dict:
+    """
+    Suma los resultados agregados de todos los procesos
+
+    Args:
+        results (list[dict]): Resultados de cada proceso
+
+    Returns:
+        dict: Resultados del torneo completo
+    """
+    merged = {
+        "games": 0,
+        "tied_rounds": 0,
+        "expected_tied_rounds": None,
+        "female_wins": 0,
+        "male_wins": 0,
+        "games_won": {},
+        "luckiest_games": {},
+    }
+    for result in results:
+        for key in ("games", "tied_rounds", "female_wins", "male_wins"):
+            merged[key] += result[key]
+        if result["expected_tied_rounds"] is not None:
+            merged["expected_tied_rounds"] = (merged["expected_tied_rounds"] or 0.0) + result["expected_tied_rounds"]
+        for key in ("games_won", "luckiest_games"):
+            for name, value in result[key].items():
+                merged[key][name] = merged[key].get(name, 0) + value
+    rounds = merged["games"] * constants.QUANTITY_OF_ROUNDS
+    merged["rounds"] = rounds
+    merged["tied_rounds_frequency"] = merged["tied_rounds"] / rounds if rounds else 0.0
+    if merged["expected_tied_rounds"] is not None:
+        merged["analytic_tied_rounds_frequency"] = merged["expected_tied_rounds"] / rounds if rounds else 0.0
+    return merged
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Simulación Montecarlo del torneo de arquería sin interfaz gráfica")
+    parser.add_argument("--games", type=int, default=constants.QUANTITY_OF_GAMES, help="cantidad de juegos a simular")
+    parser.add_argument("--teams", type=int, default=constants.QUANTITY_OF_TEAMS, help="cantidad de equipos")
+    parser.add_argument("--archers", type=int, default=constants.QUANTITY_OF_ARCHERS_BY_TEAM, help="cantidad de arqueros por equipo")
+    parser.add_argument("--seed", type=int, default=None, help="semilla base, por defecto basada en la hora")
+    parser.add_argument("--workers", type=int, default=1, help="cantidad de procesos")
+    parser.add_argument("--output", default="resultados", help="directorio de salida de los resultados")
+    parser.add_argument("--tolerance", type=float, default=constants.PRECISION_TOLERANCE, help="semiamplitud máxima de los intervalos de confianza de cada proceso")
+    parser.add_argument("--antithetic", action="store_true", help="usar muestreo antitético")
+    parser.add_argument("--analytic", action="store_true", help="estimar además la frecuencia de empates con la probabilidad exacta de cada ronda")
+    parser.add_argument("--sampled-shots", action="store_true", help="sortear el total de los lanzamientos normales de cada arquero por ronda con su distribución exacta")
+    parser.add_argument("--quantized", action="store_true", help="generar los Ri cuantizados como enteros (mismos resultados con la misma semilla)")
+    parser.add_argument("--pool-dir", default=None, help="directorio de los pools precalculados de valores aleatorios, que se construyen si no existen")
+    parser.add_argument("--progress", action="store_true", help="mostrar el progreso en la salida de errores")
+    parser.add_argument("--instrument", action="store_true", help="medir los caminos críticos y mostrar el desglose por fase en la salida de errores")
+    parser.add_argument("--profile", action="store_true", help="guardar las estadísticas de cProfile de cada proceso en el directorio de salida (implica --instrument)")
+    arguments = parser.parse_args(argv)
+    if arguments.games < 1 or arguments.workers < 1 or arguments.teams < 1 or arguments.archers < 1:
+        parser.error("games, workers, teams y archers deben ser mayores que 0")
+    return arguments
+
+
+def main(argv=None):
+    arguments = parse_arguments(argv)
+    seed = arguments.seed if arguments.seed is not None else int(time.time_ns() % (2**31 - 1))
+    workers = min(arguments.workers, arguments.games)
+    os.makedirs(arguments.output, exist_ok=True)
+
+    worker_arguments = [
+        {
+            "max_games": games,
+            "seed": worker_seed(seed, i),
+            "results_path": os.path.join(arguments.output, f"worker_{i}"),
+            "quantity_of_teams": arguments.teams,
+            "archers_by_team": arguments.archers,
+            "tolerance": arguments.tolerance,
+            "antithetic": arguments.antithetic,
+            "analytic": arguments.analytic,
+            "sampled_shots": arguments.sampled_shots,
+            "quantized": arguments.quantized,
+            "pool_root": arguments.pool_dir,
+            "progress": arguments.progress and i == 0,
+            "instrument": arguments.instrument or arguments.profile,
+            "profile_path": os.path.join(arguments.output, f"worker_{i}.prof") if arguments.profile else None,
+        }
+        for i, games in enumerate(split_games(arguments.games, workers))
+    ]
+
+    start_time = time.perf_counter()
+    if workers == 1:
+        results = [run_worker(worker_arguments[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(run_worker, worker_arguments))
+    elapsed = time.perf_counter() - start_time
+    if arguments.progress:
+        print(file=sys.stderr)
+    if arguments.instrument or arguments.profile:
+        from instrumentation import format_report
+
+        for i, result in enumerate(results):
+            print(f"Proceso {i}:\n{format_report(result['instrumentation'])}", file=sys.stderr)
+
+    summary = merge_results(results)
+    summary.update(
+        {
+            "seed": seed,
+            "workers": workers,
+            "seconds": elapsed,
+            "games_per_second": summary["games"] / elapsed if elapsed > 0 else 0.0,
+            "output": arguments.output,
+            "by_worker": results,
+        }
+    )
+    with open(os.path.join(arguments.output, "summary.json"), "w") as file:
+        json.dump(summary, file, indent=2)
+    print(json.dumps({key: summary[key] for key in ("games", "rounds", "workers", "seconds", "games_per_second", "tied_rounds_frequency", "analytic_tied_rounds_frequency", "output") if key in summary}))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,13 @@ QUANTITY_OF_TEAMS= 2
 QUANTITY_OF_ARCHERS_BY_TEAM = 5
 QUANTITY_OF_GAMES = 20000
 EXPERIENCE_TO_ADD = 3
-QUANTITY_OF_GAMES_TO_SHOW = 50 if QUANTITY_OF_GAMES > 50 else QUANTITY_OF_GAMES
+BATCH_SIZE = 500
+CONFIDENCE_LEVEL = 0.95
+PRECISION_TOLERANCE = None
+RESULTS_CHUNK_SIZE = 5000
+GUI_UPDATE_INTERVAL = 0.25
+SCATTER_SAMPLE_SIZE = 2000
+DENSITY_THRESHOLD = 5000
 NAME_ATRIBUTE = "nombre"
 PUNTUATION_ATRIBUTE = "puntaje"
 PUNTUATIONS = "puntajes"
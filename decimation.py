@@ -0,0 +1,124 @@
+import numpy as np
+
+"""
+Módulo de reducción de puntos (decimación) para graficar series largas.
+
+Las series acumuladas del torneo tienen una posición por ronda (cientos de miles de puntos por línea), muchos más de
+los que caben en el ancho del gráfico. La decimación por envolvente mínimo/máximo divide la parte visible de la serie
+en tantos grupos como columnas de píxeles y conserva de cada grupo el punto mínimo y el máximo, en su orden original,
+por lo que la línea dibujada se ve igual que la completa pero con unos dos puntos por píxel.
+
+Para las nubes de puntos de valores enteros (un punto por juego) se agrupan los pares iguales con np.bincount: el
+gráfico de densidad y la recta de tendencia dependen solo de la cantidad de pares distintos, no de la de juegos.
+"""
+
+POINTS_BY_PIXEL = 2
+
+def visible_slice(x: np.ndarray, x_min: float, x_max: float) -> slice:
+    """
+    Devuelve el rango de posiciones de x dentro de [x_min, x_max], más un punto a cada lado para que la línea
+    continúe hasta el borde del gráfico
+
+    Args:
+        x (np.ndarray): Valores del eje x, ordenados de forma ascendente
+        x_min (float): Límite inferior visible
+        x_max (float): Límite superior visible
+
+    Returns:
+        slice: Rango de posiciones visibles
+    """
+    start = max(int(np.searchsorted(x, x_min, side="left")) - 1, 0)
+    stop = min(int(np.searchsorted(x, x_max, side="right")) + 1, len(x))
+    return slice(start, stop)
+
+
+def min_max_decimate(x, y, max_points: int, x_range: tuple = None):
+    """
+    Reduce la serie (x, y) a lo sumo a max_points puntos conservando su envolvente mínimo/máximo
+
+    Args:
+        x (array): Valores del eje x, ordenados de forma ascendente
+        y (array): Valores del eje y
+        max_points (int): Cantidad máxima de puntos a conservar (normalmente POINTS_BY_PIXEL veces el ancho en píxeles)
+        x_range (tuple[float, float]): Rango visible del eje x; si se indica solo se decima esa parte de la serie
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Valores x e y de los puntos conservados
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if x_range is not None:
+        visible = visible_slice(x, *x_range)
+        x, y = x[visible], y[visible]
+
+    quantity_of_points = len(y)
+    quantity_of_groups = max(max_points // 2, 1)
+    if quantity_of_points <= 2 * quantity_of_groups:
+        return x, y
+
+    # Grupos del mismo tamaño; el último se completa repitiendo el último valor
+    group_size = -(-quantity_of_points // quantity_of_groups)
+    quantity_of_groups = -(-quantity_of_points // group_size)
+    padded = np.empty(quantity_of_groups * group_size, dtype=y.dtype)
+    padded[:quantity_of_points] = y
+    padded[quantity_of_points:] = y[-1]
+    groups = padded.reshape(quantity_of_groups, group_size)
+
+    offsets = np.arange(quantity_of_groups) * group_size
+    minimums = offsets + groups.argmin(axis=1)
+    maximums = offsets + groups.argmax(axis=1)
+    positions = np.concatenate((minimums, maximums, [0, quantity_of_points - 1]))
+    positions = np.unique(np.minimum(positions, quantity_of_points - 1))
+    return x[positions], y[positions]
+
+
+def bin_pairs(x, y):
+    """
+    Cuenta cuántas veces aparece cada par (x, y) de valores enteros
+
+    Args:
+        x (array): Valores enteros del eje x
+        y (array): Valores enteros del eje y, de la misma longitud que x
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Valores distintos de x, valores distintos de y (rangos continuos
+        desde el mínimo hasta el máximo) y matriz de conteos de forma (len(valores x), len(valores y))
+    """
+    x = np.asarray(x, dtype=np.int64)
+    y = np.asarray(y, dtype=np.int64)
+    if len(x) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.zeros((0, 0), dtype=np.int64)
+    x_min, y_min = int(x.min()), int(y.min())
+    width = int(x.max()) - x_min + 1
+    height = int(y.max()) - y_min + 1
+    counts = np.bincount((x - x_min) * height + (y - y_min), minlength=width * height)
+    return np.arange(x_min, x_min + width), np.arange(y_min, y_min + height), counts.reshape(width, height)
+
+
+def binned_linear_fit(x_values, y_values, counts):
+    """
+    Ajusta la recta de mínimos cuadrados a partir de los pares agrupados por bin_pairs; el resultado es el mismo que
+    el de np.polyfit(x, y, 1) sobre los pares sin agrupar
+
+    Args:
+        x_values (np.ndarray): Valores distintos de x
+        y_values (np.ndarray): Valores distintos de y
+        counts (np.ndarray): Conteo de cada par, de forma (len(x_values), len(y_values))
+
+    Returns:
+        tuple[float, float]: Pendiente y ordenada al origen, None si x no varía
+    """
+    count_by_x = counts.sum(axis=1)
+    count_by_y = counts.sum(axis=0)
+    quantity = count_by_x.sum()
+    if quantity == 0:
+        return None
+    x_mean = count_by_x @ x_values / quantity
+    y_mean = count_by_y @ y_values / quantity
+    x_deviations = x_values - x_mean
+    sum_xx = count_by_x @ (x_deviations ** 2)
+    if sum_xx == 0:
+        return None
+    sum_xy = x_deviations @ counts @ (y_values - y_mean)
+    slope = sum_xy / sum_xx
+    return float(slope), float(y_mean - slope * x_mean)
@@ -0,0 +1,403 @@
+from statistics import NormalDist
+import math
+import numpy as np
+import constants
+
+"""
+Módulo de estimación secuencial de la precisión del torneo.
+
+Acumula, juego a juego, la media y la varianza muestral de los estimandos principales
+(frecuencia de empates, probabilidad de victoria de cada equipo, proporción de rondas
+ganadas por género y proporción de juegos como el más afortunado de cada arquero) para
+calcular la semiamplitud de su intervalo de confianza y decidir cuándo detener la simulación.
+
+También acumula histogramas de valores enteros (puntos por ronda de cada equipo) de los que se obtienen los cuartiles,
+bigotes, media y valores atípicos exactos del diagrama de caja sin guardar ni ordenar la serie completa.
+"""
+
+class RunningEstimate:
+    """
+    Media y varianza muestral acumuladas de un estimando (algoritmo de Welford).
+
+    Attributes:
+        count (int): Cantidad de observaciones acumuladas.
+        mean (float): Media de las observaciones.
+        m2 (float): Suma de los cuadrados de las desviaciones respecto a la media.
+    """
+    def __init__(self):
+        """
+        Inicializa un estimando sin observaciones
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float):
+        """
+        Agrega una observación actualizando la media y la varianza
+
+        Args:
+            value (float): valor observado en un juego
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def variance(self) -> float:
+        """
+        Varianza muestral de las observaciones
+
+        Returns:
+            float: varianza muestral, 0 si hay menos de dos observaciones
+        """
+        if self.count < 2:
+            return 0.0
+        return self.m2 / (self.count - 1)
+
+    def half_width(self, z: float) -> float:
+        """
+        Semiamplitud del intervalo de confianza de la media
+
+        Args:
+            z (float): cuantil de la normal estándar para el nivel de confianza
+
+        Returns:
+            float: semiamplitud del intervalo, infinito si aún no hay suficientes observaciones
+        """
+        if self.count < 2:
+            return math.inf
+        return z * math.sqrt(self.variance() / self.count)
+
+
+class IntegerHistogram:
+    """
+    Histograma de una serie de valores enteros, acumulado valor a valor.
+
+    Los cuantiles se calculan con la misma interpolación lineal que np.percentile sobre la serie completa, por lo que
+    las estadísticas del diagrama de caja son exactas y su costo depende de la cantidad de valores distintos.
+
+    Attributes:
+        counts (dict[int, int]): Cantidad de apariciones de cada valor.
+        count (int): Cantidad de valores acumulados.
+    """
+    def __init__(self):
+        """
+        Inicializa un histograma sin valores
+        """
+        self.counts: dict[int, int] = {}
+        self.count = 0
+
+    @classmethod
+    def from_values(cls, values) -> "IntegerHistogram":
+        """
+        Crea el histograma de una serie completa
+
+        Args:
+            values (iterable): valores enteros de la serie
+        """
+        histogram = cls()
+        distinct, counts = np.unique(np.asarray(values, dtype=np.int64), return_counts=True)
+        histogram.counts = dict(zip(distinct.tolist(), counts.tolist()))
+        histogram.count = int(counts.sum())
+        return histogram
+
+    def add(self, value: int):
+        """
+        Agrega un valor al histograma
+
+        Args:
+            value (int): valor observado
+        """
+        self.counts[value] = self.counts.get(value, 0) + 1
+        self.count += 1
+
+    def __sorted(self):
+        """
+        Devuelve los valores distintos ordenados y la cantidad acumulada de valores hasta cada uno
+        """
+        values = np.array(sorted(self.counts), dtype=np.int64)
+        cumulative = np.cumsum([self.counts[value] for value in values.tolist()])
+        return values, cumulative
+
+    def __at_ranks(self, values, cumulative, ranks):
+        """
+        Devuelve los valores que ocupan las posiciones indicadas de la serie ordenada
+        """
+        return values[np.searchsorted(cumulative, ranks, side="right")]
+
+    def quantiles(self, probabilities) -> np.ndarray:
+        """
+        Cuantiles de la serie con interpolación lineal, como np.percentile
+
+        Args:
+            probabilities (array): probabilidades entre 0 y 1
+
+        Returns:
+            np.ndarray: cuantil de cada probabilidad
+        """
+        values, cumulative = self.__sorted()
+        positions = (self.count - 1) * np.asarray(probabilities, dtype=np.float64)
+        lower = np.floor(positions).astype(np.int64)
+        upper = np.minimum(lower + 1, self.count - 1)
+        lower_values = self.__at_ranks(values, cumulative, lower)
+        upper_values = self.__at_ranks(values, cumulative, upper)
+        return lower_values + (positions - lower) * (upper_values - lower_values)
+
+    def mean(self) -> float:
+        """
+        Media de la serie
+
+        Returns:
+            float: media, 0 si no hay valores
+        """
+        if self.count == 0:
+            return 0.0
+        return sum(value * count for value, count in self.counts.items()) / self.count
+
+    def box_statistics(self, label: str = None, whis: float = 1.5) -> dict:
+        """
+        Estadísticas del diagrama de caja en el formato de Axes.bxp, iguales a las que calcula Axes.boxplot
+
+        Args:
+            label (str): nombre de la serie
+            whis (float): largo de los bigotes en rangos intercuartílicos
+
+        Returns:
+            dict: cuartiles, bigotes, media y valores atípicos (cada valor distinto una vez)
+        """
+        values, _ = self.__sorted()
+        q1, median, q3 = self.quantiles([0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        inside = values[(values >= q1 - whis * iqr) & (values <= q3 + whis * iqr)]
+        whislo = inside.min() if len(inside) else q1
+        whishi = inside.max() if len(inside) else q3
+        return {
+            "label": label,
+            "mean": self.mean(),
+            "med": median,
+            "q1": q1,
+            "q3": q3,
+            "iqr": iqr,
+            "whislo": whislo,
+            "whishi": whishi,
+            "fliers": values[(values < whislo) | (values > whishi)],
+        }
+
+    def sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Muestra sin reemplazo de la serie, como rng.choice sobre los valores originales
+
+        Args:
+            size (int): tamaño de la muestra; si es mayor que la serie se devuelven todos sus valores
+            rng (np.random.Generator): generador de la muestra
+
+        Returns:
+            np.ndarray: valores de la muestra
+        """
+        values, cumulative = self.__sorted()
+        if size >= self.count:
+            return np.repeat(values, np.diff(cumulative, prepend=0))
+        return self.__at_ranks(values, cumulative, rng.choice(self.count, size, replace=False))
+
+
+class TournamentEstimates:
+    """
+    Estimandos del torneo que se usan para el criterio de parada por precisión.
+
+    En modo antitético los juegos llegan en parejas (juego original y juego reflejado), por lo
+    que la precisión se calcula sobre la media de cada pareja, que son las observaciones independientes.
+
+    Attributes:
+        confidence (float): Nivel de confianza de los intervalos.
+        z (float): Cuantil de la normal estándar asociado al nivel de confianza.
+        antithetic (bool): Indica si los juegos llegan en parejas antitéticas.
+        estimates (dict[str, RunningEstimate]): Estimandos acumulados por nombre (un valor por juego).
+        pair_estimates (dict[str, RunningEstimate]): Estimandos acumulados por pareja antitética.
+        observations (dict[str, list]): Observaciones de cada juego, solo si se pidió guardarlas.
+        stream (tuple): Secuencia de valores aleatorios con la que se simularon los juegos (ver Values.stream), None si no se conoce.
+    """
+    def __init__(
+        self,
+        confidence: float = constants.CONFIDENCE_LEVEL,
+        antithetic: bool = False,
+        keep_observations: bool = False,
+    ):
+        """
+        Inicializa los estimandos del torneo
+
+        Args:
+            confidence (float): Nivel de confianza de los intervalos.
+            antithetic (bool): Indica si los juegos llegan en parejas antitéticas.
+            keep_observations (bool): Guarda las observaciones de cada juego para comparar configuraciones.
+        """
+        self.confidence = confidence
+        self.z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        self.antithetic = antithetic
+        self.estimates: dict[str, RunningEstimate] = {}
+        self.pair_estimates: dict[str, RunningEstimate] = {}
+        self.observations: dict[str, list] = {} if keep_observations else None
+        self.stream: tuple = None
+        self.__pending: dict = None
+
+    def add_game(self, game, teams: list):
+        """
+        Agrega las observaciones de un juego terminado
+
+        Args:
+            game (Game): Juego del que se obtendrán las observaciones
+            teams (list[Team]): Lista de los equipos participantes
+        """
+        observations = game_observations(game, teams)
+        for name, value in observations.items():
+            self.__add(self.estimates, name, value)
+            if self.observations is not None:
+                self.observations.setdefault(name, []).append(value)
+
+        if self.antithetic:
+            if self.__pending is None:
+                self.__pending = observations
+            else:
+                for name, value in observations.items():
+                    if name in self.__pending:
+                        self.__add(self.pair_estimates, name, (self.__pending[name] + value) / 2)
+                self.__pending = None
+
+    def __add(self, estimates: dict, name: str, value: float):
+        """
+        Agrega una observación al estimando indicado, creándolo si no existe
+
+        Args:
+            estimates (dict): estimandos en los que se agregará la observación
+            name (str): nombre del estimando
+            value (float): valor observado
+        """
+        estimate = estimates.get(name)
+        if estimate is None:
+            estimate = RunningEstimate()
+            estimates[name] = estimate
+        estimate.add(value)
+
+    def half_widths(self) -> dict:
+        """
+        Devuelve la semiamplitud del intervalo de confianza de cada estimando
+
+        Returns:
+            dict: semiamplitud por nombre de estimando
+        """
+        estimates = self.pair_estimates if self.antithetic else self.estimates
+        return {name: estimate.half_width(self.z) for name, estimate in estimates.items()}
+
+    def variance_reduction_factors(self) -> dict:
+        """
+        Devuelve el factor de reducción de varianza logrado por el muestreo antitético en cada estimando,
+        es decir, cuántas veces menor es la varianza del estimador respecto a simular la misma cantidad
+        de juegos independientes
+
+        Returns:
+            dict: factor de reducción por nombre de estimando, vacío si no es modo antitético
+        """
+        factors = {}
+        for name, pair_estimate in self.pair_estimates.items():
+            pair_variance = pair_estimate.variance()
+            if pair_variance > 0:
+                factors[name] = self.estimates[name].variance() / (2 * pair_variance)
+        return factors
+
+    def max_half_width(self) -> float:
+        """
+        Devuelve la mayor semiamplitud entre todos los estimandos
+
+        Returns:
+            float: mayor semiamplitud, infinito si no hay estimandos
+        """
+        return max(self.half_widths().values(), default=math.inf)
+
+    def converged(self, tolerance: float) -> bool:
+        """
+        Define si todos los estimandos alcanzaron la precisión pedida
+
+        Args:
+            tolerance (float): semiamplitud máxima permitida
+
+        Returns:
+            bool: True si todas las semiamplitudes son menores o iguales a la tolerancia
+        """
+        return self.max_half_width() <= tolerance
+
+
+def game_observations(game, teams: list) -> dict:
+    """
+    Devuelve el valor de cada estimando observado en un juego
+
+    Args:
+        game (Game): Juego del que se obtendrán las observaciones
+        teams (list[Team]): Lista de los equipos participantes
+
+    Returns:
+        dict: valor observado por nombre de estimando
+    """
+    observations = {"Frecuencia de empates": game.quantity_of_tied_rounds / constants.QUANTITY_OF_ROUNDS}
+    if game.expected_tied_rounds is not None:
+        # Misma frecuencia estimada con la probabilidad exacta de empate de cada ronda: menor varianza
+        observations["Frecuencia de empates (analítica)"] = game.expected_tied_rounds / constants.QUANTITY_OF_ROUNDS
+
+    winner_team = game.bestTeam[constants.NAME_ATRIBUTE] if game.bestTeam else None
+    luckiest = game.the_luckiest_archer[constants.NAME_ATRIBUTE] if game.the_luckiest_archer else None
+    for team in teams:
+        observations[f"Victorias {team.name}"] = 1.0 if team.name == winner_team else 0.0
+        for archer in team.archers:
+            observations[f"Más afortunado {archer.name}"] = 1.0 if archer.name == luckiest else 0.0
+
+    rounds_won = game.female_wins + game.male_wins
+    if rounds_won > 0:
+        observations["Rondas ganadas femenino"] = game.female_wins / rounds_won
+        observations["Rondas ganadas masculino"] = game.male_wins / rounds_won
+    return observations
+
+
+def compare_common_random_numbers(first: TournamentEstimates, second: TournamentEstimates) -> dict:
+    """
+    Compara dos configuraciones simuladas con números aleatorios comunes juego a juego.
+    Ambos torneos deben haberse ejecutado guardando las observaciones de cada juego y con la misma secuencia de
+    valores aleatorios: la misma semilla y el mismo tamaño de los arreglos de valores, es decir la misma cantidad máxima
+    de juegos y de arqueros o el mismo pool (ver Values.stream). Con la misma semilla y distinto tamaño los juegos no
+    comparten ningún valor y la comparación no tendría la reducción de varianza que reporta.
+
+    Args:
+        first (TournamentEstimates): Estimandos de la primera configuración
+        second (TournamentEstimates): Estimandos de la segunda configuración
+
+    Returns:
+        dict: por nombre de estimando, la diferencia media, la semiamplitud de su intervalo de confianza
+        y el factor de reducción de varianza respecto a simular ambas configuraciones de forma independiente
+
+    Raises:
+        ValueError: si las configuraciones no se simularon con la misma secuencia de valores aleatorios
+    """
+    if first.stream is None or first.stream != second.stream:
+        raise ValueError(
+            "Las configuraciones no comparten los números aleatorios: "
+            f"secuencias {first.stream} y {second.stream} (semilla, valores uniformes, valores normales, Ri)"
+        )
+    comparison = {}
+    for name, first_values in first.observations.items():
+        second_values = second.observations.get(name)
+        if not second_values:
+            continue
+        difference = RunningEstimate()
+        first_estimate = RunningEstimate()
+        second_estimate = RunningEstimate()
+        for first_value, second_value in zip(first_values, second_values):
+            difference.add(first_value - second_value)
+            first_estimate.add(first_value)
+            second_estimate.add(second_value)
+        independent_variance = first_estimate.variance() + second_estimate.variance()
+        comparison[name] = {
+            "diferencia": difference.mean,
+            "semiamplitud": difference.half_width(first.z),
+            "factor de reducción": (
+                independent_variance / difference.variance() if difference.variance() > 0 else math.inf
+            ),
+        }
+    return comparison
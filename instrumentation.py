@@ -0,0 +1,263 @@
+import cProfile
+import functools
+import time
+from collections import Counter
+from contextlib import contextmanager
+from random_library.Random import Random
+from random_values import Values
+from tournament_simulation import Round, Game
+
+"""
+Módulo de instrumentación opcional de los caminos críticos de la simulación.
+
+Al habilitarse reemplaza los métodos medidos por envolturas que acumulan tiempos y contadores, y al deshabilitarse
+restaura los originales, por lo que no tiene ningún costo mientras está deshabilitada. Mide:
+    - Random._validate_sequence: tiempo, bloques rechazados y reintentos de cada generación de n valores.
+    - Random._first_valid_candidate: tiempo y candidatas de cada lote de semillas validado junto (retry_batch_size > 1).
+    - Values.random_value / norm_random_value / uniform_value: cantidad de valores consumidos y su tiempo.
+    - Round.make_shots y Game.execute: tiempo por llamada.
+    - Round.execute_additional_shots: profundidad de cada desempate (rondas de lanzamientos adicionales).
+Opcionalmente ejecuta cProfile durante la medición y guarda las estadísticas (pstats) en un archivo.
+
+Los tiempos de las fases se solapan (Game.execute incluye Round.make_shots y los consumos de Values), por lo que su
+proporción respecto al tiempo total no suma 100 %.
+
+Ejemplo:
+    with instrumented("torneo.prof") as metrics:
+        Tournament(max_games=1000).execute()
+    print(format_report(metrics.report()))
+"""
+
+class Timer:
+    """
+    Tiempo acumulado de una fase.
+
+    Attributes:
+        calls (int): Cantidad de llamadas medidas.
+        seconds (float): Tiempo total en segundos.
+    """
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+
+    def add(self, seconds: float):
+        self.calls += 1
+        self.seconds += seconds
+
+
+class Metrics:
+    """
+    Tiempos, contadores y distribuciones acumulados mientras la instrumentación está habilitada.
+
+    Attributes:
+        timers (dict[str, Timer]): Tiempo de cada fase.
+        counters (Counter): Contadores por nombre.
+        retries_per_call (Counter): Cantidad de generaciones por número de reintentos de validación.
+        reshoot_depth (Counter): Cantidad de desempates por profundidad.
+        start_time (float): Momento en que se habilitó la instrumentación.
+        end_time (float): Momento en que se deshabilitó, None mientras sigue habilitada.
+    """
+    def __init__(self):
+        self.timers: dict[str, Timer] = {}
+        self.counters = Counter()
+        self.retries_per_call = Counter()
+        self.reshoot_depth = Counter()
+        self.start_time = time.perf_counter()
+        self.end_time = None
+
+    def timer(self, name: str) -> Timer:
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = Timer()
+            self.timers[name] = timer
+        return timer
+
+    def report(self) -> dict:
+        """
+        Devuelve el desglose por fase, los contadores y las distribuciones
+
+        Returns:
+            dict: resumen de la medición
+        """
+        wall_seconds = (self.end_time or time.perf_counter()) - self.start_time
+        return {
+            "wall_seconds": wall_seconds,
+            "phases": {
+                name: {
+                    "calls": timer.calls,
+                    "seconds": timer.seconds,
+                    "mean_microseconds": timer.seconds / timer.calls * 1e6 if timer.calls else 0.0,
+                    "share": timer.seconds / wall_seconds if wall_seconds > 0 else 0.0,
+                }
+                for name, timer in self.timers.items()
+            },
+            "counters": dict(self.counters),
+            "retries_per_call": dict(sorted(self.retries_per_call.items())),
+            "reshoot_depth": dict(sorted(self.reshoot_depth.items())),
+        }
+
+
+_metrics: Metrics = None
+_profiler: cProfile.Profile = None
+_profile_path: str = None
+_originals: list = []
+
+
+def is_enabled() -> bool:
+    return _metrics is not None
+
+
+def enable(profile_path: str = None) -> Metrics:
+    """
+    Habilita la instrumentación reemplazando los métodos medidos
+
+    Args:
+        profile_path (str): Archivo donde guardar las estadísticas de cProfile al deshabilitar; None para no perfilar
+
+    Returns:
+        Metrics: Métricas que se acumularán hasta deshabilitar
+    """
+    global _metrics, _profiler, _profile_path
+    if is_enabled():
+        disable()
+    _metrics = Metrics()
+
+    _patch(Random, "_validate_sequence", _validation_wrapper)
+    _patch(Random, "_first_valid_candidate", _candidates_wrapper)
+    for name in ("random", "uniform", "normal", "random_array", "random_quantized", "uniform_array", "normal_array"):
+        _patch(Random, name, _generation_wrapper)
+    for name in ("random_value", "norm_random_value", "uniform_value"):
+        _patch(Values, name, _timed_wrapper(f"Values.{name}"))
+    _patch(Round, "make_shots", _timed_wrapper("Round.make_shots"))
+    _patch(Round, "execute_additional_shots", _reshoot_wrapper)
+    _patch(Game, "execute", _timed_wrapper("Game.execute"))
+
+    _profile_path = profile_path
+    if profile_path:
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+    return _metrics
+
+
+def disable() -> Metrics:
+    """
+    Restaura los métodos originales y guarda las estadísticas de cProfile si se pidieron
+
+    Returns:
+        Metrics: Métricas acumuladas, None si la instrumentación no estaba habilitada
+    """
+    global _metrics, _profiler, _profile_path
+    if not is_enabled():
+        return None
+    if _profiler:
+        _profiler.disable()
+        _profiler.dump_stats(_profile_path)
+    for owner, name, original in reversed(_originals):
+        setattr(owner, name, original)
+    _originals.clear()
+
+    metrics = _metrics
+    metrics.end_time = time.perf_counter()
+    _metrics = None
+    _profiler = None
+    _profile_path = None
+    return metrics
+
+
+@contextmanager
+def instrumented(profile_path: str = None):
+    """
+    Habilita la instrumentación durante un bloque with y entrega sus métricas
+    """
+    metrics = enable(profile_path)
+    try:
+        yield metrics
+    finally:
+        disable()
+
+
+def format_report(report: dict) -> str:
+    """
+    Da formato de texto al resumen devuelto por Metrics.report
+    """
+    lines = [f"Tiempo total: {report['wall_seconds']:.3f} s", "Fases:"]
+    for name, phase in sorted(report["phases"].items(), key=lambda item: -item[1]["seconds"]):
+        lines.append(
+            f"  {name:<26} {phase['calls']:>10} llamadas {phase['seconds']:>9.3f} s "
+            f"{phase['mean_microseconds']:>10.1f} µs/llamada {phase['share'] * 100:>6.1f} %"
+        )
+    if report["counters"]:
+        lines.append("Contadores:")
+        lines.extend(f"  {name}: {value}" for name, value in sorted(report["counters"].items()))
+    lines.append(f"Reintentos por generación: {report['retries_per_call']}")
+    lines.append(f"Profundidad de desempates: {report['reshoot_depth']}")
+    return "\n".join(lines)
+
+
+def _patch(owner, name: str, make_wrapper):
+    original = getattr(owner, name)
+    _originals.append((owner, name, original))
+    setattr(owner, name, functools.wraps(original)(make_wrapper(original)))
+
+
+def _timed_wrapper(phase: str):
+    def make_wrapper(function):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _metrics.timer(phase).add(time.perf_counter() - start)
+        return wrapper
+    return make_wrapper
+
+
+def _validation_wrapper(function):
+    def wrapper(self, sequence):
+        start = time.perf_counter()
+        passed = function(self, sequence)
+        _metrics.timer("Random._validate_sequence").add(time.perf_counter() - start)
+        _metrics.counters["bloques validados"] += 1
+        if not passed:
+            _metrics.counters["bloques rechazados"] += 1
+        return passed
+    return wrapper
+
+
+def _candidates_wrapper(function):
+    def wrapper(self, candidates):
+        if len(candidates) == 1:
+            # Se valida con _validate_sequence, que ya se mide
+            return function(self, candidates)
+        start = time.perf_counter()
+        index = function(self, candidates)
+        _metrics.timer("Random._first_valid_candidate").add(time.perf_counter() - start)
+        _metrics.counters["candidatas validadas en lote"] += len(candidates)
+        # Se cuentan como las validaciones que se habrían hecho de a una
+        rejected = index if index >= 0 else len(candidates)
+        _metrics.counters["bloques validados"] += rejected + (1 if index >= 0 else 0)
+        _metrics.counters["bloques rechazados"] += rejected
+        return index
+    return wrapper
+
+
+def _generation_wrapper(function):
+    def wrapper(self, *args, **kwargs):
+        validated = _metrics.counters["bloques validados"]
+        failures = _metrics.counters["bloques rechazados"]
+        value = function(self, *args, **kwargs)
+        # Solo las generaciones de n valores se validan
+        if _metrics.counters["bloques validados"] > validated:
+            _metrics.retries_per_call[_metrics.counters["bloques rechazados"] - failures] += 1
+        return value
+    return wrapper
+
+
+def _reshoot_wrapper(function):
+    def wrapper(self, *args, **kwargs):
+        reshoot_rounds = self.reshoot_rounds
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            _metrics.reshoot_depth[self.reshoot_rounds - reshoot_rounds] += 1
+    return wrapper
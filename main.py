@@ -12,34 +12,58 @@ from PyQt5.QtWidgets import (
     QScrollArea,
     QMainWindow,
     QSizePolicy,
+    QProgressBar,
+    QPushButton,
+    QTableView,
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal, QAbstractTableModel, QModelIndex
 from tournament_simulation import Tournament
+from results_store import ResultsReader
 import constants
 import time
 from datetime import timedelta
 import math
-from matplotlib.figure import Figure
-import matplotlib
 import numpy as np
-from matplotlib.ticker import MaxNLocator
-import threading
 
-matplotlib.use("Qt5Agg")
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+# Los gráficos (charts) importan matplotlib, que tarda en cargarse; se importan al construir el panel
+# para que la ventana aparezca de inmediato
 
 class MyWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.execution_time = 0
-        self.execute_tournament()
+        self.tournament = None
         self.setWindowTitle("Arquersim")
         self.setGeometry(100, 100, 1700, 900)
         self.setStyleSheet("background-color: #E2E8F0;")
 
         # ---- HEADER ----
         header_widget = self.create_header()
+        self.progress_panel = self.create_progress_panel()
+
+        self.main_widget = QWidget()
+        self.main_layout = QVBoxLayout(self.main_widget)
+        self.main_layout.addWidget(header_widget)
+        self.main_layout.addWidget(self.progress_panel)
+        self.main_layout.addStretch()
+
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setWidget(self.main_widget)
+
+        self.setCentralWidget(scroll)
+        self.execute_tournament()
+
+    def build_dashboard(self):
+        """
+        Construye el panel de resultados completo con el torneo terminado
+        """
+        from charts import (
+            AccumulatedPointsChart,
+            SpecialsExperienceChart,
+            TeamsBoxplotChart,
+            TiedRoundsPieChart,
+        )
 
         initial_val_widget = QWidget()
         initial_layout = QHBoxLayout(initial_val_widget)
@@ -98,11 +122,11 @@ class MyWindow(QMainWindow):
         chart_widget.setMinimumHeight(600)
         chart_widget.setStyleSheet("background: transparent;")
 
-        points_by_team = self.tournament.points_by_team()
+        points_histogram_by_team = self.tournament.points_histogram_by_team()
 
         chart_container = self.create_graphic(chart_widget)
 
-        chart2 = TeamsBoxplotChart(points_by_team)
+        chart2 = TeamsBoxplotChart(points_histogram_by_team)
         chart2_container = self.create_graphic(chart2)
 
         canvas = QWidget()
@@ -112,8 +136,8 @@ class MyWindow(QMainWindow):
 
         table_games = self.create_table_games()
 
-        specials = self.tournament.teams[0].special_shots_by_game
-        experience = self.tournament.teams[0].experience_by_game
+        specials = self.tournament.teams[0].special_shots_by_game.view()
+        experience = self.tournament.teams[0].experience_by_game.view()
 
         special_experience_chart = SpecialsExperienceChart(specials, experience)
         special_chart_container = self.create_graphic(special_experience_chart)
@@ -131,7 +155,7 @@ class MyWindow(QMainWindow):
         canvas2_layout.addWidget(chart_experience_gender_container)
 
         tied_rounds = self.tournament.tied_rounds
-        total_rounds = constants.QUANTITY_OF_ROUNDS * constants.QUANTITY_OF_GAMES
+        total_rounds = constants.QUANTITY_OF_ROUNDS * self.tournament.quantity_of_games
 
         pie_chart = TiedRoundsPieChart(tied_rounds, total_rounds)
         pie_chart_container = self.create_graphic(pie_chart)
@@ -141,24 +165,18 @@ class MyWindow(QMainWindow):
         canvas3_layout.addWidget(pie_chart_container)
 
         # ---- Ensamblar todo ----
-        main_widget = QWidget()
-        main_layout = QVBoxLayout(main_widget)
-        main_layout.addWidget(header_widget)
-        main_layout.addWidget(initial_val_widget)
-        main_layout.addWidget(statistics_content)
-        main_layout.addWidget(table_games)
-        main_layout.addWidget(canvas)
-        main_layout.addWidget(canvas2)
-        main_layout.addWidget(canvas3)
-        main_layout.addStretch()
-
-        main_widget.setMinimumSize(1600, 3400)
-
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setWidget(main_widget)
-
-        self.setCentralWidget(scroll)
+        # Los componentes se insertan antes del espacio final del layout
+        for widget in (
+            initial_val_widget,
+            statistics_content,
+            table_games,
+            canvas,
+            canvas2,
+            canvas3,
+        ):
+            self.main_layout.insertWidget(self.main_layout.count() - 1, widget)
+
+        self.main_widget.setMinimumSize(1600, 3400)
 
     def create_graphic(self, chart):
         chart_container = QWidget()
@@ -187,8 +205,9 @@ class MyWindow(QMainWindow):
         """
         )
 
+        games_model = GamesTableModel(*games_summary(self.tournament))
         title_table = QLabel(
-            f"Equipo ganador por juego (primeros {constants.QUANTITY_OF_GAMES_TO_SHOW} juegos)"
+            f"Equipo ganador por juego ({games_model.rowCount()} juegos)"
         )
         title_table.setStyleSheet(
             """
@@ -202,7 +221,9 @@ class MyWindow(QMainWindow):
         )
         table_layout.addWidget(title_table)
 
-        table_content = QTableWidget()
+        # Vista sobre el modelo: solo se leen las filas visibles
+        table_content = QTableView()
+        table_content.setModel(games_model)
         table_content.setFixedHeight(400)
         header = table_content.horizontalHeader()
         header.setDefaultAlignment(Qt.AlignLeft | Qt.AlignVCenter)
@@ -210,42 +231,14 @@ class MyWindow(QMainWindow):
         table_content.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
 
         table_content.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table_content.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        table_content.verticalHeader().setDefaultSectionSize(45)
 
         table_content.verticalHeader().setVisible(False)
         table_layout.addWidget(table_content)
 
-        table_content.setColumnCount(3)
-        table_content.setHorizontalHeaderLabels(
-            ["# Juego", "Equipo ganador", "Rondas ganadas"]
-        )
-
-        table_content.setRowCount(constants.QUANTITY_OF_GAMES_TO_SHOW)
-
-        for r in range(constants.QUANTITY_OF_GAMES_TO_SHOW):
-            for c in range(3):
-                item = None
-                if c == 0:
-                    item = QTableWidgetItem(str(self.tournament.games[r].id))
-                if c == 1:
-                    if self.tournament.games[r].bestTeam:
-                        item = QTableWidgetItem(
-                            str(
-                                self.tournament.games[r].bestTeam[
-                                    constants.NAME_ATRIBUTE
-                                ]
-                            )
-                        )
-                    else:
-                        item = QTableWidgetItem(str("Empate"))
-                if c == 2:
-                    if self.tournament.games[r].bestTeam:
-                        item = QTableWidgetItem(
-                            str(self.tournament.games[r].bestTeam[constants.ROUNDS_WON])
-                        )
-                    else:
-                        item = QTableWidgetItem(str("Empate"))
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                table_content.setItem(r, c, item)
+        table_content.setSortingEnabled(True)
+        table_content.sortByColumn(0, Qt.AscendingOrder)
 
         table_content.setShowGrid(False)
         table_content.setStyleSheet(
@@ -566,40 +559,182 @@ class MyWindow(QMainWindow):
         return table
 
     def execute_tournament(self):
+        """
+        Ejecuta el torneo en un hilo de trabajo para que la ventana siga respondiendo; el avance llega por señales
+        y el panel completo se construye al terminar
+        """
         print("Ejecución iniciada")
-        start_time = time.time()
-        stop_flag = {"stop": False}
+        self.simulation_thread = QThread(self)
+        self.worker = TournamentWorker()
+        self.worker.moveToThread(self.simulation_thread)
+        self.simulation_thread.started.connect(self.worker.run)
+        self.worker.progress.connect(self.update_progress)
+        self.worker.finished.connect(self.on_tournament_finished)
+        self.worker.finished.connect(self.simulation_thread.quit)
+        self.simulation_thread.finished.connect(self.worker.deleteLater)
+        self.simulation_thread.start()
+
+    def cancel_tournament(self):
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.setText("Cancelando...")
+        self.worker.cancel()
+
+    def update_progress(self, results: dict):
+        """
+        Actualiza la barra de progreso, las tarjetas y el gráfico circular con los resultados parciales
 
-        # Lanzamos el hilo
-        thread = threading.Thread(target=mostrar_tiempo, args=(start_time, stop_flag))
-        thread.start()
-        
-        self.tournament = Tournament()
-        self.tournament.execute()
+        Args:
+            results (dict): Resultados parciales, ver partial_results
+        """
+        games = results["games"]
+        max_games = results["max_games"]
+        self.progress_bar.setMaximum(max_games)
+        self.progress_bar.setValue(games)
+        self.progress_label.setText(
+            f"Juegos simulados: {games}/{max_games} — Tiempo transcurrido: {results['elapsed']:.1f} s"
+        )
 
-        stop_flag["stop"] = True
-        thread.join()
+        total_rounds = constants.QUANTITY_OF_ROUNDS * games
+        tied_frequency = results["tied_rounds"] / total_rounds * 100 if total_rounds else 0
+        self.live_games.central_label.setText(abbreviate_number(games))
+        self.live_tied_rounds.central_label.setText(f"{results['tied_rounds']} rondas empatadas")
+        self.live_tied_rounds.bottom_label.setText(f"Frecuencia relativa: {tied_frequency:.2f} %")
+        self.live_gender.central_label.setText(
+            f"M:{results['male_wins']} F:{results['female_wins']}"
+        )
+        self.live_teams.central_label.setText(
+            " - ".join(f"{name}: {won}" for name, won in results["games_won"].items())
+        )
+        if self.live_pie_chart is None:
+            from charts import TiedRoundsPieChart
+
+            self.live_pie_chart = TiedRoundsPieChart(0, 0)
+            self.progress_panel.layout().addWidget(self.create_graphic(self.live_pie_chart))
+        self.live_pie_chart.plot(results["tied_rounds"], total_rounds)
+
+    def on_tournament_finished(self, tournament: Tournament, execution_time: float):
+        """
+        Construye el panel de resultados cuando el hilo de trabajo termina el torneo
 
-        end_time = time.time()
-        execution_time = end_time - start_time
+        Args:
+            tournament (Tournament): Torneo terminado (o cancelado)
+            execution_time (float): Tiempo de ejecución en segundos
+        """
+        self.tournament = tournament
         hours, rem = divmod(execution_time, 3600)
         minutes, seconds = divmod(rem, 60)
         tiempo_formateado = f"{int(hours):02}:{int(minutes):02}:{seconds:05.2f}"
-        #first_part = tiempo_formateado.split(".")[0]
-        #second_part = tiempo_formateado.split(".")[1]
-        
-        
+
         self.execution_time = tiempo_formateado
         print(execution_time)
         print(f"\nTiempo de ejecución: {tiempo_formateado}")
 
         print("Ejecución terminada")
-        print(
-            f"cantidad de veces con arquero especial repetido equipo 1: {self.tournament.teams[0].repeated_special_archer}"
+        for i, team in enumerate(self.tournament.teams):
+            print(
+                f"cantidad de veces con arquero especial repetido equipo {i + 1}: {team.repeated_special_archer}"
+            )
+
+        if self.tournament.quantity_of_games == 0:
+            self.progress_label.setText("Simulación cancelada antes de terminar el primer juego")
+            self.cancel_button.hide()
+            return
+
+        if self.tournament.cancelled:
+            self.subtitle.setText(
+                f"{self.subtitle.text()} (cancelada tras {self.tournament.quantity_of_games} juegos)"
+            )
+        self.progress_panel.hide()
+        self.progress_panel.deleteLater()
+        self.build_dashboard()
+
+    def closeEvent(self, event):
+        if self.simulation_thread.isRunning():
+            self.worker.cancel()
+            self.simulation_thread.quit()
+            self.simulation_thread.wait()
+        super().closeEvent(event)
+
+    def create_progress_panel(self):
+        """
+        Crea el panel que se muestra mientras corre la simulación: progreso, botón de cancelar,
+        tarjetas con los resultados parciales y el gráfico circular de rondas empatadas
+        """
+        panel = QWidget()
+        panel_layout = QVBoxLayout(panel)
+
+        status_widget = QWidget()
+        status_widget.setStyleSheet(
+            """
+            background-color: #0F1730;
+            color: lightgray;
+            border-radius: 20px;
+        """
         )
-        print(
-            f"cantidad de veces con arquero especial repetido equipo 2: {self.tournament.teams[1].repeated_special_archer}"
+        status_layout = QHBoxLayout(status_widget)
+
+        self.progress_label = QLabel("Generando valores aleatorios...")
+        self.progress_label.setStyleSheet(
+            """
+            font-family: Arial, sans-serif;
+            background: none;
+            color: #9AA5B3;
+            font-size: 21px;
+            font-weight: bold;
+            padding: 10px 10px 10px 5px;
+        """
         )
+        status_layout.addWidget(self.progress_label)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximum(0)
+        self.progress_bar.setFixedHeight(30)
+        self.progress_bar.setStyleSheet(
+            """
+            QProgressBar {
+                background-color: #3C4A6E;
+                color: lightgray;
+                border-radius: 7px;
+                text-align: center;
+            }
+            QProgressBar::chunk {
+                background-color: skyblue;
+                border-radius: 7px;
+            }
+        """
+        )
+        status_layout.addWidget(self.progress_bar)
+
+        self.cancel_button = QPushButton("Cancelar")
+        self.cancel_button.setFixedSize(160, 40)
+        self.cancel_button.setStyleSheet(
+            """
+            background-color: lightcoral;
+            color: #071029;
+            font-size: 19px;
+            font-weight: bold;
+            border-radius: 10px;
+        """
+        )
+        self.cancel_button.clicked.connect(self.cancel_tournament)
+        status_layout.addWidget(self.cancel_button)
+        panel_layout.addWidget(status_widget)
+
+        cards_widget = QWidget()
+        cards_layout = QHBoxLayout(cards_widget)
+        self.live_games = create_component("Juegos simulados", "0", None, 150, 400)
+        self.live_tied_rounds = create_component(
+            "Cantidad de rondas empatadas", "0 rondas empatadas", "Frecuencia relativa: 0.00 %", 150, 400
+        )
+        self.live_gender = create_component("Rondas ganadas por género", "M:0 F:0", None, 150, 400)
+        self.live_teams = create_component("Juegos ganados por equipo", "-", None, 150, 400)
+        for card in (self.live_games, self.live_tied_rounds, self.live_gender, self.live_teams):
+            cards_layout.addWidget(card)
+        panel_layout.addWidget(cards_widget)
+
+        # El gráfico circular se crea con los primeros resultados parciales
+        self.live_pie_chart = None
+        return panel
 
     def create_header(self):
         header_widget = QWidget()
@@ -650,7 +785,7 @@ class MyWindow(QMainWindow):
         row1_widget = QWidget()
         row1_layout = QHBoxLayout(row1_widget)
 
-        abbreviated_number = abbreviate_number(constants.QUANTITY_OF_GAMES)
+        abbreviated_number = abbreviate_number(self.tournament.quantity_of_games)
 
         luckiest_component = create_component(
             f"Jugador más afortunado (conteo en {abbreviated_number} juegos)",
@@ -682,281 +817,169 @@ class MyWindow(QMainWindow):
 
         return row1_widget
 
-def mostrar_tiempo(start_time, stop_flag):
-    while not stop_flag["stop"]:
-        elapsed = time.time() - start_time
-        print(f"Tiempo transcurrido: {elapsed:.1f} s", end="\r") 
-        time.sleep(0.1) 
-
-class TiedRoundsPieChart(QWidget):
-    def __init__(self, tied_rounds, total_rounds, parent=None):
-        super().__init__(parent)
-
-        layout = QVBoxLayout(self)
-
-        # Crear figura y canvas
-        self.figure = Figure(figsize=(6, 6))
-        self.canvas = FigureCanvas(self.figure)
-        layout.addWidget(self.canvas)
-
-        # Dibujar gráfico
-        self.plot(tied_rounds, total_rounds)
-
-    def plot(self, tied_rounds, total_rounds):
-        ax = self.figure.add_subplot(111)
-        ax.clear()
-
-        # Datos
-        rondas_no_empatadas = total_rounds - tied_rounds
-        valores = [tied_rounds, rondas_no_empatadas]
-        etiquetas = ["Empatadas", "No empatadas"]
-        colores = ["skyblue", "lightcoral"]
-
-        # Gráfico circular (sin labels)
-        wedges, texts, autotexts = ax.pie(
-            valores,
-            labels=None,  # No mostrar etiquetas en el gráfico
-            autopct="%1.1f%%",
-            colors=colores,
-            startangle=90,
-            explode=(0.05, 0),
-        )
-
-        # Añadir leyenda debajo del gráfico
-        ax.legend(
-            wedges,
-            etiquetas,
-            loc="lower center",
-            bbox_to_anchor=(0.5, -0.1),
-            fontsize=12,
-            ncol=2,
-            frameon=False,
-        )
+class TournamentWorker(QObject):
+    """
+    Ejecuta el torneo fuera del hilo de la interfaz.
 
-        ax.set_title("Porcentaje de rondas empatadas vs no empatadas")
-        self.canvas.draw()
+    El progreso del torneo se reenvía como señal con los resultados parciales, limitado a una señal cada
+    constants.GUI_UPDATE_INTERVAL segundos para no saturar el hilo de la interfaz.
 
+    Attributes:
+        tournament (Tournament): Torneo en ejecución, None mientras se generan los valores aleatorios.
+        cancelled (bool): Indica si se pidió cancelar la simulación.
+    """
+    progress = pyqtSignal(dict)
+    finished = pyqtSignal(object, float)
 
-class AccumulatedPointsChart(QWidget):
-    def __init__(self, points_data, title: str, y_label: str, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
+        self.tournament = None
+        self.cancelled = False
+        self.start_time = 0.0
+        self.last_update = 0.0
+
+    def run(self):
+        self.start_time = time.time()
+        self.tournament = Tournament(progress=self.report_progress)
+        if self.cancelled:
+            self.tournament.cancel()
+        self.tournament.execute()
+        self.finished.emit(self.tournament, time.time() - self.start_time)
 
-        self.title = title
-        self.y_label = y_label
-
-        layout = QVBoxLayout(self)
-
-        # Crear figura y canvas
-        self.figure, self.ax = plt.subplots(figsize=(8, 5))
-        self.canvas = FigureCanvas(self.figure)
-        layout.addWidget(self.canvas)
-
-        # Estado de líneas activas
-        self.lines = []  # todas las líneas
-        self.active_lines = set()  # las seleccionadas
-
-        # Dibujar gráfico
-        self.plot(points_data)
-
-        # Conectar evento de click
-        self.canvas.mpl_connect("pick_event", self.on_pick)
-
-    def plot(self, points_data):
-        self.ax.clear()
-        self.lines.clear()
-        self.active_lines.clear()
-
-        # Dibujar cada jugador
-        for name, acumulados in points_data.items():
-            (line,) = self.ax.plot(
-                range(1, len(acumulados) + 1), acumulados, label=name, picker=True
-            )
-            self.lines.append(line)
-
-        # Leyenda
-        legend = self.ax.legend(
-            loc="upper left",
-            fontsize=12,
-            markerscale=4.0,
-            handlelength=3,
-            borderpad=1.2,
-        )
-        for legline, origline in zip(legend.get_lines(), self.lines):
-            legline.set_picker(True)
-            legline._associated_line = origline
-
-        self.ax.set_title(self.title)
-        self.ax.set_xlabel("Rondas")
-        self.ax.set_ylabel(self.y_label)
-        self.ax.grid(True, alpha=0.3)
-
-        self.canvas.draw()
-
-    def on_pick(self, event):
-        legline = event.artist
-        if not hasattr(legline, "_associated_line"):
-            return  # ignorar clicks fuera de la leyenda
-
-        origline = legline._associated_line
-
-        if origline in self.active_lines:
-            # Si ya estaba seleccionada → la quitamos
-            self.active_lines.remove(origline)
-        else:
-            # Si no estaba → la añadimos
-            self.active_lines.add(origline)
-
-        if self.active_lines:
-            # Mostrar solo las seleccionadas
-            for line in self.lines:
-                line.set_visible(line in self.active_lines)
-        else:
-            # Si no hay ninguna seleccionada → mostrar todas
-            for line in self.lines:
-                line.set_visible(True)
-
-        self.canvas.draw()
-
+    def cancel(self):
+        """
+        Pide cancelar la simulación; el torneo se detiene al terminar el juego en curso
+        """
+        self.cancelled = True
+        if self.tournament:
+            self.tournament.cancel()
 
-class SpecialsExperienceChart(QWidget):
-    def __init__(self, specials, experience, parent=None):
-        super().__init__(parent)
+    def report_progress(self, games: int, max_games: int):
+        now = time.time()
+        if games < max_games and now - self.last_update < constants.GUI_UPDATE_INTERVAL:
+            return
+        self.last_update = now
+        self.progress.emit(partial_results(self.tournament, now - self.start_time))
 
-        # Layout principal
-        layout = QVBoxLayout(self)
 
-        # Crear figura y canvas
-        self.figure = Figure(figsize=(6, 4))
-        self.canvas = FigureCanvas(self.figure)
-        layout.addWidget(self.canvas)
+def partial_results(tournament: Tournament, elapsed: float) -> dict:
+    """
+    Copia los contadores del torneo en curso; se llama desde el hilo de trabajo, por lo que la interfaz
+    nunca lee el torneo mientras se modifica
 
-        # Guardar datos y dibujar
-        self.specials = specials
-        self.experience = experience
-        self.plot()
+    Args:
+        tournament (Tournament): Torneo en ejecución
+        elapsed (float): Segundos transcurridos desde el inicio
 
-    def plot(self):
-        ax = self.figure.add_subplot(111)
-        ax.clear()
+    Returns:
+        dict: Resultados parciales del torneo
+    """
+    return {
+        "games": tournament.quantity_of_games,
+        "max_games": tournament.max_games,
+        "elapsed": elapsed,
+        "tied_rounds": tournament.tied_rounds,
+        "female_wins": tournament.female_wins,
+        "male_wins": tournament.male_wins,
+        "games_won": {team.name: team.quantity_games_won for team in tournament.teams},
+    }
+
+def games_summary(tournament: Tournament):
+    """
+    Devuelve los arreglos con el resumen de cada juego del torneo. Si el torneo guardó sus resultados
+    (ver results_store) se leen de ahí, lo que incluye los juegos anteriores a una reanudación
 
-        # Puntos de dispersión
-        ax.scatter(
-            self.specials, self.experience, color="blue", alpha=0.6, label="Juegos"
-        )
+    Args:
+        tournament (Tournament): Torneo terminado
 
-        # Ajuste lineal (recta de tendencia)
-        m, b = np.polyfit(self.specials, self.experience, 1)
-        ax.plot(
-            self.specials,
-            [m * x + b for x in self.specials],
-            color="red",
-            label="Tendencia",
+    Returns:
+        tuple: identificadores de los juegos, posición del equipo ganador (-1 en empate), rondas ganadas
+        y nombres de los equipos
+    """
+    team_names = [team.name for team in tournament.teams]
+    if tournament.results_path:
+        reader = ResultsReader(tournament.results_path)
+        return (
+            reader.games("game").to_numpy(),
+            reader.games("best_team").to_numpy(),
+            reader.games("rounds_won").to_numpy(),
+            reader.team_names,
         )
+    team_ids = {name: i for i, name in enumerate(team_names)}
+    games = tournament.games
+    return (
+        np.fromiter((game.id for game in games), dtype=np.int64, count=len(games)),
+        np.fromiter(
+            (team_ids[game.bestTeam[constants.NAME_ATRIBUTE]] if game.bestTeam else -1 for game in games),
+            dtype=np.int16,
+            count=len(games),
+        ),
+        np.fromiter(
+            (game.bestTeam[constants.ROUNDS_WON] if game.bestTeam else 0 for game in games),
+            dtype=np.int16,
+            count=len(games),
+        ),
+        team_names,
+    )
 
-        # Etiquetas y título
-        ax.set_xlabel("Lanzamientos especiales por equipo")
-        ax.set_ylabel("Experiencia ganada por equipo")
-        ax.set_title("Correlación entre lanzamientos especiales y experiencia")
-        ax.legend()
 
-        ax.grid(alpha=0.3)
+class GamesTableModel(QAbstractTableModel):
+    """
+    Modelo de la tabla de juegos sobre arreglos de NumPy.
 
-        # Dibujar en canvas
-        self.canvas.draw()
+    La vista solo pide el texto de las filas visibles, por lo que la tabla puede mostrar todos los juegos del torneo;
+    el ordenamiento se hace con lexsort sobre los arreglos (desempatando por juego) y se guarda como una permutación de las filas.
 
+    Attributes:
+        columns (list[np.ndarray]): Identificador del juego, posición del equipo ganador y rondas ganadas.
+        team_names (list[str]): Nombres de los equipos, en el orden de sus posiciones.
+        order (np.ndarray): Permutación de las filas según el ordenamiento actual, None si no se ha ordenado.
+    """
+    HEADERS = ["# Juego", "Equipo ganador", "Rondas ganadas"]
 
-class TeamsBoxplotChart(QWidget):
-    def __init__(self, points_by_team, parent=None):
+    def __init__(self, games, best_team, rounds_won, team_names: list, parent=None):
         super().__init__(parent)
-
-        layout = QVBoxLayout(self)
-        self.figure = Figure(figsize=(6, 4))
-        self.canvas = FigureCanvas(self.figure)
-        layout.addWidget(self.canvas)
-
-        self.points_by_team = points_by_team
-        self.plot(points_by_team)
-
-        # Conectar evento de movimiento del mouse
-        self.canvas.mpl_connect("motion_notify_event", self.on_hover)
-
-    def plot(self, points_by_team):
-        self.ax = self.figure.add_subplot(111)
-        self.ax.clear()
-
-        # Dibujar boxplot y guardar referencias
-        bp = self.ax.boxplot(
-            points_by_team.values(),
-            tick_labels=points_by_team.keys(),
-            showmeans=True,
-            meanline=True,
-            patch_artist=True,
-        )
-
-        # Dibujar puntos individuales encima
-        self.scatter_points = []
-        for i, values in enumerate(points_by_team.values(), start=1):
-            sc = self.ax.scatter([i] * len(values), values, alpha=0.6)
-            self.scatter_points.append(sc)
-
-        self.ax.set_title("Dispersión de puntajes por equipo")
-        self.ax.set_xlabel("Equipo")
-        self.ax.set_ylabel("Puntaje por ronda")
-        self.ax.grid(alpha=0.3)
-        self.ax.yaxis.set_major_locator(MaxNLocator(nbins=15))
-
-        # === Añadir texto de cuartiles y mediana ===
-        for i, (team, values) in enumerate(points_by_team.items(), start=1):
-            q1, med, q3 = (
-                np.percentile(values, 25),
-                np.median(values),
-                np.percentile(values, 75),
-            )
-
-            self.ax.text(
-                i + 0.1, q1, f"Q1={q1:.1f}", va="center", fontsize=8, color="blue"
-            )
-            self.ax.text(
-                i + 0.1, med, f"Med={med:.1f}", va="center", fontsize=8, color="red"
-            )
-            self.ax.text(
-                i + 0.1, q3, f"Q3={q3:.1f}", va="center", fontsize=8, color="green"
-            )
-
-        # Crear anotación (tooltip oculto inicialmente)
-        self.annotation = self.ax.annotate(
-            "",
-            xy=(0, 0),
-            xytext=(15, 15),
-            textcoords="offset points",
-            bbox=dict(boxstyle="round", fc="w"),
-            arrowprops=dict(arrowstyle="->"),
-        )
-        self.annotation.set_visible(False)
-
-        self.canvas.draw()
-
-    def update_annotation(self, x, y, text):
-        """Actualiza el tooltip con la posición y texto"""
-        self.annotation.xy = (x, y)
-        self.annotation.set_text(text)
-        self.annotation.set_visible(True)
-        self.canvas.draw_idle()
-
-    def on_hover(self, event):
-        """Detecta cuando el mouse pasa sobre un punto"""
-        vis = self.annotation.get_visible()
-        if event.inaxes == self.ax:
-            for sc in self.scatter_points:
-                cont, ind = sc.contains(event)
-                if cont:
-                    idx = ind["ind"][0]
-                    x, y = sc.get_offsets()[idx]
-                    self.update_annotation(x, y, f"Puntaje: {y:.1f}")
-                    return
-        if vis:
-            self.annotation.set_visible(False)
-            self.canvas.draw_idle()
+        self.columns = [np.asarray(games), np.asarray(best_team), np.asarray(rounds_won)]
+        self.team_names = list(team_names)
+        self.order = None
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.columns[0])
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        row = index.row() if self.order is None else int(self.order[index.row()])
+        column = index.column()
+        best_team = int(self.columns[1][row])
+        if column == 0:
+            return str(self.columns[0][row])
+        if best_team < 0:
+            return "Empate"
+        if column == 1:
+            return self.team_names[best_team]
+        return str(self.columns[2][row])
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        keys = self.columns[column]
+        if column == 2:
+            # Los empates no tienen rondas ganadas y se ordenan junto con el equipo ganador
+            keys = np.where(self.columns[1] < 0, -1, keys)
+        keys = keys.astype(np.int64)
+        if order == Qt.DescendingOrder:
+            keys = -keys
+        # Los valores iguales quedan siempre por id de juego ascendente
+        self.order = np.lexsort((self.columns[0], keys))
+        self.layoutChanged.emit()
 
 
 def create_component(
@@ -1014,7 +1037,10 @@ def create_component(
         """
         )
         layout.addWidget(bottom_component)
+        component.bottom_label = bottom_component
 
+    # Referencias para actualizar el componente con resultados parciales
+    component.central_label = central_component
     return component
 
 
@@ -11,7 +11,42 @@ class Gender(Enum):
 class PointsConverter(ABC):
     """
     Clase abstracta encargada de convertir los puntos
+
+    Attributes:
+        UPPER_BOUNDS (tuple[float]): Límite superior (inclusive) del valor aleatorio de cada puntaje, en orden.
+        POINTS (tuple[int]): Puntaje de cada límite y, al final, el de los valores mayores al último límite.
+        quantized (bool): Indica si los valores aleatorios llegan cuantizados (enteros Ri*10^5, de 0 a 100000).
     """
+    UPPER_BOUNDS: tuple = ()
+    POINTS: tuple = ()
+
+    def __init__(self, quantized: bool = False):
+        """
+        Inicializa el conversor
+
+        Args:
+            quantized (bool): Indica si los valores aleatorios llegan cuantizados, en cuyo caso obtain_point los compara
+                contra los límites enteros (UPPER_BOUNDS * 10^5), con el mismo resultado que sobre el Ri flotante
+        """
+        self.quantized = quantized
+        if quantized:
+            # Se reemplaza el método en la instancia para no consultar el modo en cada lanzamiento
+            self.obtain_point = self.obtain_point_quantized
+
+    def pmf(self) -> dict:
+        """
+        Devuelve la probabilidad de cada puntaje para un valor aleatorio uniforme en [0, 1], según la tabla de la clase
+
+        Returns:
+            dict[int, float]: probabilidad de cada puntaje
+        """
+        probabilities = {}
+        lower_bound = 0.0
+        for upper_bound, point in zip(self.UPPER_BOUNDS + (1.0,), self.POINTS):
+            probabilities[point] = probabilities.get(point, 0.0) + upper_bound - lower_bound
+            lower_bound = upper_bound
+        return probabilities
+
     @abstractmethod
     def obtain_point(self, value:float) -> int:
         """
@@ -24,11 +59,28 @@ class PointsConverter(ABC):
             int: puntaje obtenido a partir del valor aleatorio
         """
         pass
+
+    @abstractmethod
+    def obtain_point_quantized(self, value: int) -> int:
+        """
+        Devuelve el puntaje obtenido a partir del valor aleatorio cuantizado pasado por parámetro
+        
+        Args:
+            value (int): valor aleatorio cuantizado (Ri*10^5, de 0 a 100000)
+            
+        Returns:
+            int: puntaje obtenido a partir del valor aleatorio
+        """
+        pass
     
 class FemalePointsConverter(PointsConverter):
     """
     Conversor de puntos para el género femenino
     """
+    # obtain_point aplica esta tabla con condiciones explícitas, más rápidas que recorrerla en cada lanzamiento
+    UPPER_BOUNDS = (0.25, 0.65, 0.95)
+    POINTS = (10, 9, 8, 0)
+
     def obtain_point(self, value:float):
         """
         Devuelve el puntaje obtenido a partir del valor aletorio pasado por parámetro aplicando la matriz de probabilidades definida para el género femenino
@@ -47,11 +99,27 @@ class FemalePointsConverter(PointsConverter):
             return 8
         else:
             return 0
+
+    def obtain_point_quantized(self, value: int):
+        """
+        Igual que obtain_point, con el valor cuantizado y los límites multiplicados por 10^5
+        """
+        if value <= 25000:
+            return 10
+        elif value <= 65000:
+            return 9
+        elif value <= 95000:
+            return 8
+        else:
+            return 0
         
 class MalePointsConverter(PointsConverter):
     """
     Conversor de puntos para el género másculino
     """
+    UPPER_BOUNDS = (0.15, 0.45, 0.92)
+    POINTS = (10, 9, 8, 0)
+
     def obtain_point(self, value):
         """
         Devuelve el puntaje obtenido a partir del valor aletorio pasado por parámetro aplicando la matriz de probabilidades definida para el género másculino
@@ -70,11 +138,27 @@ class MalePointsConverter(PointsConverter):
             return 8
         else:
             return 0
+
+    def obtain_point_quantized(self, value: int):
+        """
+        Igual que obtain_point, con el valor cuantizado y los límites multiplicados por 10^5
+        """
+        if value <= 15000:
+            return 10
+        elif value <= 45000:
+            return 9
+        elif value <= 92000:
+            return 8
+        else:
+            return 0
         
 class SubstractResistanceConverter(PointsConverter):
     """
     Conversor de puntos para definir la cantidad de resitencia a restar al momento de restaurarla
     """
+    UPPER_BOUNDS = (0.33, 0.66)
+    POINTS = (1, 2, 3)
+
     def obtain_point(self, value):
         """
         Devuelve el valor a restar a partir del valor aletorio pasado por parámetro dependiendo del rango en que se encuentre este valor
@@ -91,19 +175,31 @@ class SubstractResistanceConverter(PointsConverter):
             return 2
         else:
             return 3
+
+    def obtain_point_quantized(self, value: int):
+        """
+        Igual que obtain_point, con el valor cuantizado y los límites multiplicados por 10^5
+        """
+        if value <= 33000:
+            return 1
+        elif value <= 66000:
+            return 2
+        else:
+            return 3
         
 
-def obtain_gender(value):
+def obtain_gender(value, quantized: bool = False):
     """
     Devuelve el género a asignar del valor aletorio pasado por parámetro 
     
     Args:
         value (float): valor aleatorio obtenido el cual se utilizará para convertir y definir el género a asignar
+        quantized (bool): Indica si el valor está cuantizado (Ri*10^5, de 0 a 100000)
         
     Returns:
         Gender: Género a asignar
     """
-    if value <= 0.5:
+    if value <= (50000 if quantized else 0.5):
         return Gender.FEMALE
     else:
         return Gender.MALE
\ No newline at end of file
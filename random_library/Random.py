@@ -5,13 +5,24 @@ Random — envoltura (facade) para generación de números pseudoaleatorios.
   transformaciones a distribuciones (uniforme y normal) y validación
   estadística de las secuencias con RandomTestFacade.
 - La semilla se genera dinámicamente en cada llamada usando time.time_ns(),
-  por eso cada llamada produce secuencias distintas.
-- Si una secuencia no pasa las pruebas estadísticas, se regenera con otra semilla
-  hasta que pase.
+  por eso cada llamada produce secuencias distintas. Si se indica una semilla
+  base (seed), las semillas de cada llamada se derivan de ella y la ejecución
+  completa es reproducible.
+- Las secuencias se validan por bloques de block_size valores. Si un bloque no pasa las
+  pruebas estadísticas, solo ese bloque se regenera con otra semilla, hasta max_retries veces.
+- Los métodos *_array devuelven arreglos de NumPy en lugar de listas: generan los Ri con el LCG vectorizado, validan
+  los bloques sobre vistas del arreglo y pueden escribir en un arreglo existente (out) sin copias intermedias.
+- random_quantized entrega los Ri cuantizados: el entero Ri*10^5 (0 a 100000) en lugar del flotante, sin división de
+  punto flotante y en arreglos uint32 de 4 bytes por valor. Con la misma semilla son exactamente los Ri de random()
+  multiplicados por 10^5, y las pruebas estadísticas los aceptan directamente.
+- Un bloque rechazado puede reemplazarse probando varias semillas candidatas a la vez (retry_batch_size): sus
+  secuencias se validan juntas con RandomTestFacade.first_passing y se usa la primera que pasa. screen_seeds usa la
+  misma validación por lotes para evaluar miles de semillas.
 """
 
 import time
 import math
+import numpy as np
 from random_library.generators.Congruences import LinealCongruence
 from random_library.distributions.Distributions import UniformDistribution, NormalDistribution
 from random_library.generators.test.RandomTest import RandomTestFacade
@@ -30,15 +41,42 @@ class Random:
               y se reutiliza en todas las llamadas NO SE SI LO NECESITEN PERO AHI ESTA.
             * False → modo dinámico: en cada llamada se genera una semilla distinta
               basada en time.time_ns() hora exacta con nanosegundos (por defecto, comportamiento no repetible).
+      - seed (int or None): semilla base. Si se indica, cada llamada (incluidos los reintentos
+            por pruebas fallidas) usa una semilla distinta derivada de la semilla base y de un
+            contador, de modo que dos objetos con la misma semilla producen exactamente los mismos
+            números (números aleatorios comunes).
+      - block_size (int): cantidad de valores de cada bloque validado.
+      - max_retries (int): reintentos permitidos por bloque antes de lanzar RuntimeError.
+      - retry_batch_size (int): semillas candidatas que se generan y validan juntas al reemplazar un bloque
+            rechazado. Con semilla base el resultado no depende de este valor: el contador de semillas queda como
+            si se hubieran probado de a una. Validar en lote cuesta por candidata casi lo mismo que de a una y en
+            promedio bastan 1.3 candidatas, por lo que por defecto se prueban de a una.
+    Contadores:
+      - validated_blocks: bloques que pasaron las pruebas.
+      - failed_blocks: bloques rechazados (cada uno se regeneró).
     Atributos privados:
       - self._fixed_seed: almacena la semilla fija en modo determinista.
+      - self._seed_counter: cantidad de semillas derivadas de la semilla base.
     """
-    def __init__(self, error=0.05, deterministic=False):
+    BLOCK_SIZE = 10_000
+    MAX_RETRIES = 20
+    RETRY_BATCH_SIZE = 1
+    SCREEN_BATCH_SIZE = 8
+
+    def __init__(self, error=0.05, deterministic=False, seed=None, block_size=BLOCK_SIZE, max_retries=MAX_RETRIES,
+                 retry_batch_size=RETRY_BATCH_SIZE):
         self.error = error
         self.facade = RandomTestFacade(error)
+        self.block_size = block_size
+        self.max_retries = max_retries
+        self.retry_batch_size = retry_batch_size
+        self.validated_blocks = 0
+        self.failed_blocks = 0
 
         self.deterministic = deterministic
         self._fixed_seed = None
+        self.seed = seed
+        self._seed_counter = 0
 
         if deterministic:
             # Guardamos una semilla fija para todo el ciclo de vida del objeto
@@ -53,13 +91,29 @@ class Random:
           - Si deterministic=True → devuelve la misma semilla cada vez.
           - Si deterministic=False → devuelve una semilla dinámica basada en time.time_ns().
           - Si failed_test=True (llamado tras fallo de test), fuerza semilla dinámica
+          - Si se definió una semilla base, devuelve la siguiente semilla derivada de ella.
         """
+        if self.seed is not None:
+            return self._derive_seed()
         # Si se llama desde un fallo de test, forzamos semilla dinámica
         if failed_test:
             return int(time.time_ns() % (2**31 - 1))
         if self.deterministic and self._fixed_seed is not None:
             return self._fixed_seed
         return int(time.time_ns() % (2**31 - 1))
+
+    def _derive_seed(self):
+        """
+        Deriva una nueva semilla a partir de la semilla base y del contador de semillas.
+        Se mezclan los bits (hash multiplicativo) para que semillas consecutivas no
+        produzcan secuencias solapadas del LCG.
+        """
+        self._seed_counter += 1
+        x = (self.seed * 0x9E3779B1 + self._seed_counter * 0x85EBCA77) & 0xFFFFFFFF
+        x ^= x >> 15
+        x = (x * 0x2C1B3C6D) & 0xFFFFFFFF
+        x ^= x >> 12
+        return x % (2**31 - 1)
     
     
     # ----------------------------
@@ -75,7 +129,8 @@ class Random:
               * entero > 0 -> devuelve una lista de n Ri.
         Comportamiento:
           - La semilla depende del modo (determinista o dinámico).
-          - Si se pide una secuencia, se valida con RandomTestFacade. Si falla, se regenera.
+          - Si se pide una secuencia, se valida por bloques con RandomTestFacade y se regeneran
+            solo los bloques que fallan.
           - Si se pide un solo Ri, se devuelve directamente sin validación.
         """
         seed = self._get_seed()
@@ -84,12 +139,11 @@ class Random:
         if n is None:
             return lcg.next()
         else:
-            sequence = lcg.generate_sequence(n)
-            while not self._validate_sequence(sequence):
-                seed = self._get_seed(failed_test=True)
-                lcg = LinealCongruence(xo_seed=seed, k=551757622, c=12345, g=31)
-                sequence = lcg.generate_sequence(n)
-            return sequence
+            def generate(seed, size):
+                sequence = LinealCongruence(xo_seed=seed, k=551757622, c=12345, g=31).generate_sequence(size)
+                return sequence, sequence
+
+            return self._validated_blocks(lcg.generate_sequence(n), None, generate)
 
 
     # ----------------------------
@@ -113,12 +167,11 @@ class Random:
             value = seq[0]
             return int(math.trunc(value)) if integer else value
         else:
-            u = UniformDistribution(seed, n, a, b)
-            seq = u.generate_uniform()
-            while not self._validate_sequence(u.get_ri_sequence()):
-                seed = self._get_seed(failed_test=True)
-                u = UniformDistribution(seed, n, a, b)
-                seq = u.generate_uniform()
+            def generate(seed, size):
+                u = UniformDistribution(seed, size, a, b)
+                return u.generate_uniform(), u.get_ri_sequence()
+
+            seq = self._validated_blocks(*generate(seed, n), generate)
             return [int(math.trunc(x)) for x in seq] if integer else seq
 
     # ----------------------------
@@ -139,17 +192,182 @@ class Random:
             seq = normal_d.generate_normal()
             return seq[0]
         else:
-            normal_d = NormalDistribution(mean, stddev, seed, n)
-            seq = normal_d.generate_normal()
-            while not self._validate_sequence(normal_d.get_ri_sequence()):
-                seed = self._get_seed(failed_test=True)
-                normal_d = NormalDistribution(mean, stddev, seed, n)
-                seq = normal_d.generate_normal()
+            def generate(seed, size):
+                normal_d = NormalDistribution(mean, stddev, seed, size)
+                return normal_d.generate_normal(), normal_d.get_ri_sequence()
+
+            seq = self._validated_blocks(*generate(seed, n), generate)
             return seq[0] if n == 1 else seq
 
     # ----------------------------
-    # 4. Métodos auxiliares
+    # 4. Versiones con arreglos de NumPy
     # ----------------------------
+    def random_array(self, n, out=None, dtype=np.float64):
+        """
+        Igual que random(n) pero devuelve un arreglo de NumPy.
+
+        Parámetros:
+          - n (int): cantidad de Ri.
+          - out (np.ndarray or None): arreglo de n posiciones donde escribir los Ri.
+          - dtype: tipo del arreglo devuelto si no se indica out.
+        """
+        lcg = LinealCongruence(xo_seed=self._get_seed(), k=551757622, c=12345, g=31)
+
+        def generate(seed, size):
+            sequence = LinealCongruence(xo_seed=seed, k=551757622, c=12345, g=31).generate_array(size)
+            return sequence, sequence
+
+        seq = self._validated_blocks(lcg.generate_array(n), None, generate)
+        return self._to_output(seq, out, dtype)
+
+    def random_quantized(self, n=None, out=None):
+        """
+        Igual que random(n) pero con los Ri cuantizados: enteros Ri*10^5 de 0 a 100000.
+
+        Parámetros:
+          - n (int or None): None -> devuelve un único entero; entero > 0 -> devuelve un arreglo uint32 validado.
+          - out (np.ndarray or None): arreglo de n posiciones donde escribir los valores.
+        """
+        lcg = LinealCongruence(xo_seed=self._get_seed(), k=551757622, c=12345, g=31)
+        if n is None:
+            return lcg.next_quantized()
+
+        def generate(seed, size):
+            sequence = LinealCongruence(xo_seed=seed, k=551757622, c=12345, g=31).generate_quantized_array(size)
+            return sequence, sequence
+
+        seq = self._validated_blocks(lcg.generate_quantized_array(n), None, generate)
+        return self._to_output(seq, out, np.uint32)
+
+    def uniform_array(self, a, b, n, integer=False, out=None, dtype=None):
+        """
+        Igual que uniform(a, b, n, integer) pero devuelve un arreglo de NumPy.
+
+        Parámetros:
+          - out (np.ndarray or None): arreglo de n posiciones donde escribir los valores.
+          - dtype: tipo del arreglo devuelto si no se indica out (por defecto int64 si integer, si no float64).
+        """
+        def generate(seed, size):
+            u = UniformDistribution(seed, size, a, b)
+            return u.generate_uniform_array(), u.get_ri_sequence()
+
+        seq = self._validated_blocks(*generate(self._get_seed(), n), generate)
+        if integer:
+            np.trunc(seq, out=seq)
+        if dtype is None:
+            dtype = np.int64 if integer else np.float64
+        return self._to_output(seq, out, dtype)
+
+    def normal_array(self, mean, stddev, n, out=None, dtype=np.float64):
+        """
+        Igual que normal(mean, stddev, n) pero devuelve un arreglo de NumPy. Los valores pueden diferir de los de
+        normal() en el último dígito (redondeo de las funciones trigonométricas vectorizadas).
+
+        Parámetros:
+          - out (np.ndarray or None): arreglo de n posiciones donde escribir los valores.
+          - dtype: tipo del arreglo devuelto si no se indica out.
+        """
+        def generate(seed, size):
+            normal_d = NormalDistribution(mean, stddev, seed, size)
+            return normal_d.generate_normal_array(), normal_d.get_ri_sequence()
+
+        seq = self._validated_blocks(*generate(self._get_seed(), n), generate)
+        return self._to_output(seq, out, dtype)
+
+    @staticmethod
+    def _to_output(seq, out, dtype):
+        """
+        Escribe la secuencia en out si se indicó; si no, la devuelve con el tipo pedido (sin copiar si ya lo tiene).
+        """
+        if out is not None:
+            out[...] = seq
+            return out
+        return seq.astype(dtype, copy=False)
+
+    # ----------------------------
+    # 5. Métodos auxiliares
+    # ----------------------------
+    def _block_bounds(self, n):
+        """
+        Divide n valores en bloques de block_size; el resto se agrega al último bloque para
+        no validar bloques demasiado pequeños.
+        """
+        quantity_of_blocks = max(n // self.block_size, 1)
+        bounds = [i * self.block_size for i in range(quantity_of_blocks)]
+        return list(zip(bounds, bounds[1:] + [n]))
+
+    def _validated_blocks(self, values, ri_sequence, generate):
+        """
+        Valida la secuencia por bloques y reemplaza solo los bloques rechazados.
+
+        Parámetros:
+          - values (list or np.ndarray): valores generados con la primera semilla.
+          - ri_sequence (list, np.ndarray or None): Ri usados para generarlos (None si values ya son los Ri).
+          - generate (callable): generate(seed, size) -> (valores, Ri) para regenerar un bloque.
+        Retorna:
+          - list or np.ndarray: valores con todos sus bloques validados (el mismo objeto values).
+        Lanza:
+          - RuntimeError si un bloque no pasa las pruebas después de max_retries reintentos.
+        """
+        if ri_sequence is None:
+            ri_sequence = values
+        n = len(values)
+        # Ri consumidos por cada valor (2 en la normal por Box-Muller)
+        ratio = len(ri_sequence) // n
+        for start, stop in self._block_bounds(n):
+            if not self._validate_sequence(ri_sequence[start * ratio:stop * ratio]):
+                self.failed_blocks += 1
+                values[start:stop] = self._replacement_block(start, stop, generate)
+            self.validated_blocks += 1
+        return values
+
+    def _replacement_block(self, start, stop, generate):
+        """
+        Genera con nuevas semillas un bloque que pase las pruebas para reemplazar al bloque rechazado [start, stop).
+        Las semillas se prueban en lotes de retry_batch_size candidatas y se usa la primera que pasa; con semilla
+        base, el contador de semillas avanza solo hasta ella.
+
+        Retorna:
+          - list or np.ndarray: valores del bloque.
+        Lanza:
+          - RuntimeError si ninguna de max_retries semillas pasa las pruebas.
+        """
+        retries = 0
+        while retries < self.max_retries:
+            quantity = min(self.retry_batch_size, self.max_retries - retries)
+            seed_counter = self._seed_counter
+            candidates = [generate(self._get_seed(failed_test=True), stop - start) for _ in range(quantity)]
+            index = self._first_valid_candidate([block_ri for _, block_ri in candidates])
+            if index >= 0:
+                self.failed_blocks += index
+                if self.seed is not None:
+                    self._seed_counter = seed_counter + index + 1
+                return candidates[index][0]
+            self.failed_blocks += quantity
+            retries += quantity
+        raise RuntimeError(
+            f"El bloque [{start}, {stop}) no pasó las pruebas después de {self.max_retries} reintentos"
+        )
+
+    def _first_valid_candidate(self, candidates):
+        """
+        Retorna el índice de la primera secuencia candidata que pasa las pruebas, -1 si ninguna pasa.
+        """
+        if len(candidates) == 1:
+            return 0 if self._validate_sequence(candidates[0]) else -1
+        return self.facade.first_passing(np.array(candidates))
+
+    def validation_statistics(self):
+        """
+        Retorna los contadores de validación y la tasa de bloques rechazados.
+        """
+        attempts = self.validated_blocks + self.failed_blocks
+        return {
+            "validated_blocks": self.validated_blocks,
+            "failed_blocks": self.failed_blocks,
+            "failure_rate": self.failed_blocks / attempts if attempts else 0.0,
+        }
+
     def _validate_sequence(self, seq):
         """
         Ejecuta la lista de pruebas sobre la secuencia uniforme 'seq'.
@@ -165,9 +383,31 @@ class Random:
         return passed
 
     # ----------------------------
-    # 5. Extras
+    # 6. Extras
     # ----------------------------
 
+    def screen_seeds(self, seeds, n=None, batch_size=SCREEN_BATCH_SIZE):
+        """
+        Evalúa semillas candidatas (por ejemplo, para armar una biblioteca de semillas): genera los primeros n Ri de
+        cada una con el LCG y los valida en lotes de batch_size semillas con RandomTestFacade.passing.
+
+        Parámetros:
+          - seeds (iterable of int): semillas a evaluar.
+          - n (int or None): cantidad de Ri de cada semilla (None -> block_size).
+          - batch_size (int): semillas que se generan y validan juntas.
+        Retorna:
+          - list: semillas cuyas secuencias pasaron todas las pruebas, en el orden dado.
+        """
+        n = self.block_size if n is None else n
+        seeds = [int(seed) for seed in seeds]
+        lcg = LinealCongruence(xo_seed=0, k=551757622, c=12345, g=31)
+        passing_seeds = []
+        for start in range(0, len(seeds), batch_size):
+            batch = seeds[start:start + batch_size]
+            passed = self.facade.passing(lcg.generate_array_batch(batch, n))
+            passing_seeds.extend(seed for seed, seed_passed in zip(batch, passed) if seed_passed)
+        return passing_seeds
+
     def choice(self, seq):
         """
         Elige un elemento aleatorio de la lista 'seq' si quieres usar un solo valor de un numero pseudoaleatorio pero
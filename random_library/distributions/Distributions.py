@@ -1,6 +1,7 @@
 
 from random_library.generators.Congruences import LinealCongruence
 import math
+import numpy as np
 
 class UniformDistribution:
     def __init__(self, seed, n,a,b):
@@ -18,6 +19,17 @@ class UniformDistribution:
         # secuencia de numeros uniformes con la formula de transformacion a Ni
         uniform_sequence = [self.a + (self.b - self.a) * r for r in self.ri_secuence]
         return uniform_sequence
+
+    # Igual que generate_uniform pero sobre arreglos de NumPy, sin listas intermedias
+    # (out: arreglo donde escribir los Ni, dtype: tipo del arreglo si no se indica out)
+    def generate_uniform_array(self, out=None, dtype=np.float64):
+        self.ri_secuence = self.lcg.generate_array(self.n)
+        uniform_sequence = self.ri_secuence * (self.b - self.a)
+        np.add(uniform_sequence, self.a, out=uniform_sequence)
+        if out is None:
+            return uniform_sequence if np.dtype(dtype) == np.float64 else uniform_sequence.astype(dtype)
+        out[...] = uniform_sequence
+        return out
     def get_ri_sequence(self):
         return self.ri_secuence
     
@@ -47,6 +59,27 @@ class NormalDistribution:
                 normal_sequence.append(self.mean + self.stddev * z1)
 
         return normal_sequence[:self.n]
+
+    # Igual que generate_normal pero sobre arreglos de NumPy, sin listas intermedias
+    # (out: arreglo donde escribir los Ni, dtype: tipo del arreglo si no se indica out)
+    def generate_normal_array(self, out=None, dtype=np.float64):
+        self.ri_secuence = self.lcg.generate_array(self.n * 2)
+        u1 = np.clip(self.ri_secuence[0::2], 1e-10, 1 - 1e-10)
+        u2 = np.clip(self.ri_secuence[1::2], 1e-10, 1 - 1e-10)
+        radius = np.sqrt(-2 * np.log(u1))
+        angle = 2 * math.pi * u2
+
+        normal_sequence = np.empty(self.n * 2)
+        normal_sequence[0::2] = radius * np.cos(angle)
+        normal_sequence[1::2] = radius * np.sin(angle)
+        normal_sequence = normal_sequence[:self.n]
+        np.multiply(normal_sequence, self.stddev, out=normal_sequence)
+        np.add(normal_sequence, self.mean, out=normal_sequence)
+        if out is None:
+            return normal_sequence if np.dtype(dtype) == np.float64 else normal_sequence.astype(dtype)
+        out[...] = normal_sequence
+        return out
+
     def get_ri_sequence(self):
         return self.ri_secuence
 
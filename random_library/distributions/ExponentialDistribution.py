@@ -1,10 +1,7 @@
-import sys
-import os
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from generators.Congruences import LinealCongruence
+from random_library.generators.Congruences import LinealCongruence
 
 import math
+import numpy as np
 
 class ExponentialDistribution:
     def __init__(self, rate,seed,n):
@@ -20,4 +17,16 @@ class ExponentialDistribution:
         sequence = self.lcg.generate_sequence(self.n)
         #secuencia de numeros exponenciales con la formula de transformacion inversa
         exponential_sequence = [- (1 / self.rate) * math.log(1 - u) for u in sequence]
-        return  sequence,exponential_sequence
\ No newline at end of file
+        return  sequence,exponential_sequence
+
+    # Igual que generate_exponential pero sobre arreglos de NumPy, sin listas intermedias
+    # (out: arreglo donde escribir los Ni, dtype: tipo del arreglo si no se indica out)
+    def generate_exponential_array(self, out=None, dtype=np.float64):
+        sequence = self.lcg.generate_array(self.n)
+        exponential_sequence = np.subtract(1, sequence)
+        np.log(exponential_sequence, out=exponential_sequence)
+        np.multiply(exponential_sequence, -(1 / self.rate), out=exponential_sequence)
+        if out is None:
+            return sequence, exponential_sequence if np.dtype(dtype) == np.float64 else exponential_sequence.astype(dtype)
+        out[...] = exponential_sequence
+        return sequence, out
\ No newline at end of file
@@ -1,7 +1,11 @@
 import math
+import numpy as np
 
 from abc import ABC, abstractmethod
 
+# Los Ri se truncan a 5 decimales, por lo que cada Ri es un entero de 0 a RI_SCALE dividido por RI_SCALE
+RI_SCALE = 10**5
+
 
 # Clase abstracta para generadores de congruencias
 class Congruences(ABC):
@@ -49,9 +53,88 @@ class LinealCongruence(Congruences):
         ri_trucated =math.trunc(ri * 10**5) / 10**5
         return  ri_trucated
     
+    # Genera la siguiente semilla y retorna el Ri cuantizado: el entero trunc(Ri * 10^5), de 0 a RI_SCALE, calculado
+    # sin división de punto flotante. Con m = 2^31 (el generador de Random) coincide con next() para todas las
+    # semillas: next() == next_quantized() / 10^5
+    def next_quantized(self):
+        self.xo_seed = (self.a * self.xo_seed + self.c) % self.m
+        return self.xo_seed * RI_SCALE // (self.m - 1)
+
     # Método auxiliar: calcula la siguiente semilla SIN alterar xo_seed
     def _next_seed(self, seed):
         return (self.a * seed + self.c) % self.m 
+
+    # Genera las siguientes n semillas como arreglo de NumPy saltando hacia adelante:
+    # si se conocen las primeras L semillas, las L siguientes son x[k+L] = (A_L * x[k] + C_L) mod m,
+    # con A_L = a^L y C_L = c*(a^(L-1) + ... + 1); cada paso duplica L, por lo que bastan log2(n) operaciones
+    def generate_states(self, n):
+        states = self.generate_states_batch([self.xo_seed], n)[0]
+        if n > 0:
+            self.xo_seed = int(states[-1])
+        return states
+
+    # Genera las siguientes n semillas de cada semilla inicial de seeds (una fila por semilla) con el mismo salto hacia
+    # adelante, aplicado a todas las filas a la vez y sin alterar xo_seed
+    def generate_states_batch(self, seeds, n):
+        seeds = [int(seed) for seed in seeds]
+        states = np.empty((len(seeds), n), dtype=np.uint64)
+        if n == 0 or not seeds:
+            return states
+        if self.m > 2**32:
+            # El producto A_L * x[k] no cabe en 64 bits
+            for row, seed in enumerate(seeds):
+                for i in range(n):
+                    seed = self._next_seed(seed)
+                    states[row, i] = seed
+            return states
+        states[:, 0] = [self._next_seed(seed) for seed in seeds]
+        multiplier, increment = self.a % self.m, self.c % self.m
+        length = 1
+        while length < n:
+            step = min(length, n - length)
+            states[:, length:length + step] = (states[:, :step] * np.uint64(multiplier) + np.uint64(increment)) % np.uint64(self.m)
+            increment = (multiplier * increment + increment) % self.m
+            multiplier = (multiplier * multiplier) % self.m
+            length += step
+        return states
+
+    # Genera la secuencia de n Ri como arreglo de NumPy, con los mismos valores que generate_sequence
+    # (out: arreglo donde escribir los Ri, dtype: tipo del arreglo si no se indica out)
+    def generate_array(self, n, out=None, dtype=np.float64):
+        ri = self._states_to_ri(self.generate_states(n))
+        if out is None:
+            return ri if np.dtype(dtype) == np.float64 else ri.astype(dtype)
+        out[...] = ri
+        return out
+
+    # Genera los primeros n Ri de cada semilla de seeds como un arreglo de una fila por semilla, sin alterar xo_seed;
+    # cada fila es igual a la que genera generate_array con esa semilla
+    def generate_array_batch(self, seeds, n):
+        return self._states_to_ri(self.generate_states_batch(seeds, n))
+
+    # Convierte las semillas en Ri truncados a 5 decimales
+    def _states_to_ri(self, states):
+        ri = states / (self.m - 1)
+        np.multiply(ri, 10**5, out=ri)
+        np.trunc(ri, out=ri)
+        np.divide(ri, 10**5, out=ri)
+        return ri
+
+    # Genera la secuencia de n Ri cuantizados (los mismos enteros que next_quantized) como arreglo uint32, que ocupa
+    # la mitad que el de flotantes (out: arreglo donde escribirlos)
+    def generate_quantized_array(self, n, out=None):
+        states = self.generate_states(n)
+        if (self.m - 1) * RI_SCALE >= 2**64:
+            # El producto semilla * RI_SCALE no cabe en 64 bits
+            quantized = np.array([int(state) * RI_SCALE // (self.m - 1) for state in states.tolist()], dtype=np.uint32)
+        else:
+            states *= np.uint64(RI_SCALE)
+            states //= np.uint64(self.m - 1)
+            quantized = states.astype(np.uint32)
+        if out is None:
+            return quantized
+        out[...] = quantized
+        return out
     
     
 
@@ -1,8 +1,83 @@
 from abc import ABC, abstractmethod
 import numpy as np
-from scipy.stats import norm, chi2
 from collections import Counter
 import math
+from itertools import combinations
+from functools import lru_cache
+from random_library.generators.Congruences import RI_SCALE
+
+# scipy.stats tarda cerca de un segundo en importarse, por lo que se importa dentro de cada prueba
+# y solo se paga al validar la primera secuencia
+
+# Todas las pruebas tienen también una versión por lotes (run_batch) que recibe un arreglo K x n de secuencias
+# candidatas, una por fila, y calcula los estadísticos de todas a la vez sobre el eje 1. Cada fila pasa o no exactamente
+# igual que con run
+
+
+# Los valores críticos solo dependen del error y del tamaño de la secuencia, por lo que se calculan una sola vez
+@lru_cache(maxsize=None)
+def norm_ppf(q):
+    from scipy.stats import norm
+
+    return norm.ppf(q)
+
+
+@lru_cache(maxsize=None)
+def chi2_ppf(q, df):
+    from scipy.stats import chi2
+
+    return chi2.ppf(q, df)
+
+
+# Las pruebas aceptan Ri flotantes o cuantizados (enteros Ri*10^5, ver LinealCongruence.next_quantized)
+def is_quantized(sequence):
+    return np.issubdtype(sequence.dtype, np.integer)
+
+
+# Devuelve la secuencia como arreglo de Ri en [0, 1]; los cuantizados se dividen por RI_SCALE, lo que da
+# exactamente los mismos flotantes que genera LinealCongruence.next
+def unit_interval(sequence):
+    sequence = np.asarray(sequence)
+    return sequence / RI_SCALE if is_quantized(sequence) else sequence
+
+
+# Devuelve los Ri cuantizados de la secuencia, o None si algún Ri flotante no tiene exactamente 5 decimales
+# (o está fuera de [0, 1]) y por lo tanto sus dígitos no pueden leerse del entero
+def quantized_ri(sequence):
+    sequence = np.asarray(sequence)
+    if is_quantized(sequence):
+        return sequence.astype(np.int64, copy=False)
+    quantized = np.rint(sequence * RI_SCALE)
+    if not np.array_equal(quantized / RI_SCALE, sequence) or quantized.min(initial=0) < 0 or quantized.max(initial=0) > RI_SCALE:
+        return None
+    return quantized.astype(np.int64)
+
+
+# Frecuencias observadas de cada fila en los intervalos [e_i, e_i+1) (el último también incluye e_k), las mismas que
+# np.histogram con bordes explícitos. edges tiene k+1 bordes crecientes por fila; como en np.histogram con intervalos
+# iguales, el intervalo de cada valor se estima por su distancia al primer borde y se corrige en un paso comparándolo
+# con los bordes reales
+def bin_counts(sequences, edges):
+    rows, k = len(sequences), edges.shape[1] - 1
+    first, last = edges[:, :1], edges[:, -1:]
+    width = last - first
+    scale = np.divide(k, width, out=np.zeros_like(width), where=width > 0)
+    bins = ((sequences - first) * scale).astype(np.intp)
+    np.clip(bins, 0, k - 1, out=bins)
+    # Si todos los bordes de una fila son iguales, sus valores caen en el último intervalo
+    bins[width[:, 0] == 0] = k - 1
+    offsets = np.arange(rows)[:, None] * (k + 1)
+    bins += offsets
+    bins -= sequences < edges.ravel()[bins]
+    # El último intervalo es cerrado, por lo que ningún valor pasa de él
+    upper_edges = edges.copy()
+    upper_edges[:, -1] = np.inf
+    bins += sequences >= upper_edges.ravel()[bins + 1]
+    # Los valores fuera de [e_0, e_k] se cuentan en una columna adicional que se descarta
+    outside = (sequences < first) | (sequences > last)
+    if outside.any():
+        bins[outside] = np.broadcast_to(offsets + k, bins.shape)[outside]
+    return np.bincount(bins.ravel(), minlength=rows * (k + 1)).reshape(rows, k + 1)[:, :k]
 
 
 # Interfaz común
@@ -14,6 +89,12 @@ class RandomTest(ABC):
     def run(self, sequence):
         pass
 
+    # Ejecuta la prueba sobre cada fila de un lote de secuencias (K x n) y devuelve, por fila, si pasó y su estadístico;
+    # las pruebas la reemplazan por una versión vectorizada sobre el eje 1
+    def run_batch(self, sequences):
+        results = [self.run(sequence) for sequence in sequences]
+        return np.array([result[0] for result in results], dtype=bool), np.array([result[1] for result in results])
+
     def set_error(self, error):
         self.error = error
 
@@ -25,31 +106,43 @@ class RandomTest(ABC):
 # 1. Prueba de medias
 class MeanTest(RandomTest):
     def run(self, sequence):
-        mean = np.mean(sequence)
-        n = len(sequence)
+        mean = np.mean(unit_interval(sequence))
+        li, ls = self._limits(len(sequence))
+        passed = li <= mean <= ls
+        return passed, mean, (li, ls)
 
-        z_alpha = norm.ppf(1 - self.error / 2)
+    def run_batch(self, sequences):
+        means = np.mean(unit_interval(sequences), axis=1)
+        li, ls = self._limits(np.shape(sequences)[1])
+        return (li <= means) & (means <= ls), means
+
+    def _limits(self, n):
+        z_alpha = norm_ppf(1 - self.error / 2)
         li = 0.5 - z_alpha * np.sqrt(1 / (12 * n))
         ls = 0.5 + z_alpha * np.sqrt(1 / (12 * n))
-
-        passed = li <= mean <= ls
-        return passed, mean, (li, ls)
+        return li, ls
 
 
 # 2. Prueba de Varianza
 class VarianceTest(RandomTest):
     def run(self, sequence):
-        n = len(sequence)
-        var = np.var(sequence, ddof=1)
+        var = np.var(unit_interval(sequence), ddof=1)
+        li, ls = self._limits(len(sequence))
+        passed = li <= var <= ls
+        return passed, var, (li, ls)
+
+    def run_batch(self, sequences):
+        variances = np.var(unit_interval(sequences), axis=1, ddof=1)
+        li, ls = self._limits(np.shape(sequences)[1])
+        return (li <= variances) & (variances <= ls), variances
 
-        chi2_lower = chi2.ppf(self.error / 2, n - 1)
-        chi2_upper = chi2.ppf(1 - self.error / 2, n - 1)
+    def _limits(self, n):
+        chi2_lower = chi2_ppf(self.error / 2, n - 1)
+        chi2_upper = chi2_ppf(1 - self.error / 2, n - 1)
 
         li = chi2_lower / (12 * (n - 1))
         ls = chi2_upper / (12 * (n - 1))
-
-        passed = li <= var <= ls
-        return passed, var, (li, ls)
+        return li, ls
 
 
 # 3. Prueba de Chi-cuadrado (Sturges)
@@ -58,10 +151,10 @@ class ChiSquareTest(RandomTest):
         n = len(sequence)
         k = int(1 + 3.322 * math.log10(n))  # Regla de Sturges
         intervals = np.linspace(0, 1, k + 1)
-        fo, _ = np.histogram(sequence, bins=intervals)
+        fo, _ = np.histogram(unit_interval(sequence), bins=intervals)
         fe = np.full(k, n / k)  # vector con la frecuencia esperada en cada intervalo
         chi2_stat = np.sum((fo - fe) ** 2 / fe)
-        chi2_crit = chi2.ppf(1 - self.error, k - 1)
+        chi2_crit = chi2_ppf(1 - self.error, k - 1)
 
         passed = chi2_stat < chi2_crit
         return passed, chi2_stat, {
@@ -71,15 +164,26 @@ class ChiSquareTest(RandomTest):
             "k": k
         }
 
+    def run_batch(self, sequences):
+        sequences = unit_interval(sequences)
+        rows, n = sequences.shape
+        k = int(1 + 3.322 * math.log10(n))
+        intervals = np.broadcast_to(np.linspace(0, 1, k + 1), (rows, k + 1))
+        fo = bin_counts(sequences, intervals)
+        fe = np.full(k, n / k)
+        chi2_stats = np.sum((fo - fe) ** 2 / fe, axis=1)
+        return chi2_stats < chi2_ppf(1 - self.error, k - 1), chi2_stats
+
 
 # 4. Prueba de Kolmogorov-Smirnov con Sturges
 class KolmogorovSmirnovTest(RandomTest):
     def run(self, sequence):
+        sequence = unit_interval(sequence)
         n = len(sequence)
 
         # Número de intervalos (Sturges)
         k = int(1 + 3.322 * math.log10(n))
-        intervals = np.linspace(min(sequence), max(sequence), k + 1)
+        intervals = np.linspace(np.min(sequence), np.max(sequence), k + 1)
 
         # Frecuencias observadas
         fo, _ = np.histogram(sequence, bins=intervals)
@@ -101,19 +205,92 @@ class KolmogorovSmirnovTest(RandomTest):
         passed = d_max < d_alpha
         return passed, d_max, d_alpha
 
+    def run_batch(self, sequences):
+        sequences = unit_interval(sequences)
+        n = sequences.shape[1]
+        k = int(1 + 3.322 * math.log10(n))
+        # Mismos bordes que np.linspace con escalares en run: con bordes por fila, np.linspace cambia de fórmula en
+        # todas las filas si alguna es constante
+        minimum, maximum = np.min(sequences, axis=1), np.max(sequences, axis=1)
+        intervals = np.arange(k + 1) * ((maximum - minimum) / k)[:, None] + minimum[:, None]
+        intervals[:, -1] = maximum
+        fo_acum = np.cumsum(bin_counts(sequences, intervals), axis=1) / n
+        fe_acum = np.cumsum(np.full(k, n / k)) / n
+        d_max = np.max(np.abs(fe_acum - fo_acum), axis=1)
+        return d_max < 1.36 / np.sqrt(n), d_max
+
 
 # 5. Prueba de Poker
 class PokerTest(RandomTest):
+    CATEGORIES = ["Diferentes", "Un par", "Dos pares", "Tercia", "Full", "Poker", "Quintilla"]
+    PROBABILITIES = [0.3024, 0.5040, 0.1080, 0.0720, 0.0090, 0.0045, 0.0001]
+    # Cada mano se identifica por la cantidad de pares de dígitos iguales entre sus 5 dígitos:
+    # 0 diferentes, 1 un par, 2 dos pares, 3 tercia, 4 full, 6 poker y 10 quintilla
+    CATEGORY_BY_EQUAL_PAIRS = np.array([0, 1, 2, 3, 4, -1, 5, -1, -1, -1, 6])
+    DIGIT_POWERS = 10 ** np.arange(4, -1, -1)
+    # Categoría de cada Ri cuantizado de 0 a RI_SCALE, calculada la primera vez que se usa
+    _hand_categories = None
+
     def run(self, sequence):
         n = len(sequence)
-        # Listas de categorías y sus probabilidades
-        categories = ["Diferentes", "Un par", "Dos pares", "Tercia", "Full", "Poker", "Quintilla"]
-        probs = [0.3024, 0.5040, 0.1080, 0.0720, 0.0090, 0.0045, 0.0001]
+        observed = self._count_hands(sequence)
+
+        # Estadístico Chi-cuadrado
+        expected = np.array(self.PROBABILITIES) * n
         
-        observed = np.zeros(len(categories))
+        # Observado y esperado
+        chi2_stat = np.sum((observed - expected) ** 2 / expected)
+        # Grados de libertad y valor crítico
+        gl = len(self.CATEGORIES) - 1
+        chi2_crit = chi2_ppf(1 - self.error, gl)
+        passed = chi2_stat < chi2_crit
+
+        return passed, observed.tolist(), expected.tolist()
 
-        #contar ocurrencias
-        for ri in sequence:
+    # En lotes el estadístico de cada fila es el valor Chi-cuadrado
+    def run_batch(self, sequences):
+        rows, n = np.shape(sequences)
+        quantized = quantized_ri(sequences)
+        if quantized is None:
+            observed = np.array([self._count_hands(sequence) for sequence in sequences])
+        else:
+            categories = self._categories()[quantized] + np.arange(rows)[:, None] * len(self.CATEGORIES)
+            observed = np.bincount(categories.ravel(), minlength=rows * len(self.CATEGORIES))
+            observed = observed.reshape(rows, len(self.CATEGORIES)).astype(float)
+        expected = np.array(self.PROBABILITIES) * n
+        chi2_stats = np.sum((observed - expected) ** 2 / expected, axis=1)
+        return chi2_stats < chi2_ppf(1 - self.error, len(self.CATEGORIES) - 1), chi2_stats
+
+    def _count_hands(self, sequence):
+        quantized = quantized_ri(sequence)
+        if quantized is None:
+            return self._count_text_hands(sequence)
+        return self._count_digit_hands(quantized)
+
+    # Cuenta las manos de los Ri cuantizados con la categoría precalculada de cada valor
+    def _count_digit_hands(self, quantized):
+        return np.bincount(self._categories()[quantized], minlength=len(self.CATEGORIES)).astype(float)
+
+    # Clasifica los Ri cuantizados de 0 a RI_SCALE leyendo sus 5 dígitos, sin pasar por texto
+    @classmethod
+    def _categories(cls):
+        if cls._hand_categories is None:
+            # El Ri 1 se escribe "1.0", por lo que sus dígitos son los de 0
+            quantized = np.arange(RI_SCALE + 1) % RI_SCALE
+            digits = (quantized[:, None] // cls.DIGIT_POWERS) % 10
+            equal_pairs = np.zeros(len(quantized), dtype=np.int64)
+            for i, j in combinations(range(5), 2):
+                equal_pairs += digits[:, i] == digits[:, j]
+            # Los Ri de 0.00001 a 0.00009 se escriben en notación científica ("1e-05"), cuyo texto da una tercia;
+            # se conserva para que ambas representaciones clasifiquen igual
+            equal_pairs[(quantized >= 1) & (quantized <= 9)] = 3
+            cls._hand_categories = cls.CATEGORY_BY_EQUAL_PAIRS[equal_pairs]
+        return cls._hand_categories
+
+    # Cuenta las manos sobre el texto de cada Ri (floats de Python para conservar su representación)
+    def _count_text_hands(self, sequence):
+        observed = np.zeros(len(self.CATEGORIES))
+        for ri in np.asarray(sequence).tolist():
             digits = str(ri)[2:7].ljust(5, "0")
             counts = sorted(Counter(digits).values(), reverse=True)
             if counts == [5]:
@@ -130,45 +307,47 @@ class PokerTest(RandomTest):
                 observed[1] += 1
             else:
                 observed[0] += 1
-                
-        # Estadístico Chi-cuadrado
-        expected = np.array(probs) * n
-        
-        # Observado y esperado
-        chi2_stat = np.sum((observed - expected) ** 2 / expected)
-        # Grados de libertad y valor crítico
-        gl = len(categories) - 1
-        chi2_crit = chi2.ppf(1 - self.error, gl)
-        passed = chi2_stat < chi2_crit
-
-        return passed, observed.tolist(), expected.tolist()
+        return observed
 
 
 # 6. Prueba de Corridas (Runs)
 class RunsTest(RandomTest):
     def run(self, sequence):
+        sequence = unit_interval(sequence)
         median = np.median(sequence)
-        runs, n1, n2 = 1, 0, 0
-        prev = sequence[0] > median
-        for x in sequence[1:]:
-            curr = x > median
-            if curr != prev:
-                runs += 1
-            prev = curr
-            if curr:
-                n1 += 1
-            else:
-                n2 += 1
+        above = sequence > median
+        # Una corrida nueva en cada cambio de lado; n1 y n2 cuentan desde el segundo valor
+        runs = 1 + int(np.count_nonzero(above[1:] != above[:-1]))
+        n1 = int(np.count_nonzero(above[1:]))
+        n2 = len(sequence) - 1 - n1
+        z = self._z(runs, n1, n2)
+        from scipy.stats import norm
 
-        # Estadístico Z
-        expected_runs = ((2 * n1 * n2) / (n1 + n2)) + 1
-        std_runs = np.sqrt((2 * n1 * n2 * (2 * n1 * n2 - n1 - n2)) /
-                           (((n1 + n2) ** 2) * (n1 + n2 - 1)))
-        z = (runs - expected_runs) / std_runs if std_runs > 0 else 0
         p = 2 * (1 - norm.cdf(abs(z)))
         passed = p > self.error
         return passed, z, p
 
+    def run_batch(self, sequences):
+        sequences = unit_interval(sequences)
+        median = np.median(sequences, axis=1)
+        above = sequences > median[:, None]
+        runs = 1 + np.count_nonzero(above[:, 1:] != above[:, :-1], axis=1)
+        n1 = np.count_nonzero(above[:, 1:], axis=1)
+        n2 = sequences.shape[1] - 1 - n1
+        # El estadístico se calcula con enteros de Python, como en run, para que no pierda precisión
+        z = np.array([self._z(*row) for row in zip(runs.tolist(), n1.tolist(), n2.tolist())], dtype=float)
+        from scipy.stats import norm
+
+        p = 2 * (1 - norm.cdf(np.abs(z)))
+        return p > self.error, z
+
+    # Estadístico Z de la cantidad de corridas
+    def _z(self, runs, n1, n2):
+        expected_runs = ((2 * n1 * n2) / (n1 + n2)) + 1
+        std_runs = np.sqrt((2 * n1 * n2 * (2 * n1 * n2 - n1 - n2)) /
+                           (((n1 + n2) ** 2) * (n1 + n2 - 1)))
+        return (runs - expected_runs) / std_runs if std_runs > 0 else 0
+
 
 # ------------------------------
 # FACHADA
@@ -214,6 +393,37 @@ class RandomTestFacade:
             }
         return results, overall_passed
     
+    # Ejecutar todas las pruebas sobre un lote de secuencias candidatas (arreglo K x n, una por fila); devuelve por
+    # prueba y en conjunto qué filas pasaron
+    def run_batch(self, sequences):
+        sequences = np.asarray(sequences)
+        results = {}
+        overall_passed = np.ones(len(sequences), dtype=bool)
+        for name, test in zip(self.test_names, self.tests):
+            passed, stat = test.run_batch(sequences)
+            overall_passed &= passed
+            results[name] = {"passed": passed, "statistic": stat}
+        return results, overall_passed
+
+    # Indica qué filas del lote pasan todas las pruebas; cada prueba se ejecuta solo sobre las filas que pasaron
+    # las anteriores, por lo que sirve para evaluar muchas semillas a bajo costo
+    def passing(self, sequences):
+        sequences = np.asarray(sequences)
+        candidates = np.arange(len(sequences))
+        for test in self.tests:
+            if len(candidates) == 0:
+                break
+            passed, _ = test.run_batch(sequences if len(candidates) == len(sequences) else sequences[candidates])
+            candidates = candidates[passed]
+        passed = np.zeros(len(sequences), dtype=bool)
+        passed[candidates] = True
+        return passed
+
+    # Índice de la primera fila del lote que pasa todas las pruebas, -1 si ninguna pasa
+    def first_passing(self, sequences):
+        passed = np.flatnonzero(self.passing(sequences))
+        return int(passed[0]) if len(passed) else -1
+
     # Ejecutar un subconjunto de pruebas
     def run_subset(self, sequence, chosen_tests):
         all_results, _ = self.run_all(sequence)
@@ -0,0 +1,231 @@
+import argparse
+import json
+import os
+import shutil
+import numpy as np
+import constants
+from random_library.Random import Random
+import random_values
+
+"""
+Módulo de pools precalculados de valores aleatorios.
+
+Cada torneo genera y valida millones de valores uniformes, normales y Ri antes del primer lanzamiento. Un pool los
+genera una sola vez con una semilla, los guarda en archivos .npy (los Ri como enteros Ri*10^5 de 4 bytes) junto con un
+manifiesto JSON (semilla, tamaños, parámetros de las distribuciones y estadísticas de validación) y cada torneo los abre con mapeo en memoria: no hay costo de
+generación, el inicio es casi inmediato y varias ejecuciones o procesos comparten las mismas páginas desde la caché
+del sistema operativo.
+
+Un pool construido con la semilla y la cantidad de juegos de un torneo contiene exactamente los valores que el torneo
+generaría, por lo que los resultados son los mismos con o sin él. Un pool más grande sirve para torneos de menos
+juegos con valores igualmente validados, aunque distintos.
+
+Estructura del directorio:
+    manifest.json
+    uniform.npy
+    normal.npy
+    ri.npy
+
+Ejemplo (desde la raíz del repositorio):
+    python -m random_pool --games 10000 --seed 12345 --output pools/12345
+"""
+
+MANIFEST = "manifest.json"
+UNIFORM = "uniform.npy"
+NORMAL = "normal.npy"
+RI = "ri.npy"
+FORMAT_VERSION = 2
+
+DISTRIBUTIONS = {
+    "min_value": random_values.min_value,
+    "max_value": random_values.max_value,
+    "mean": random_values.mean,
+    "stddev": random_values.stddev,
+}
+
+
+def build_pool(
+    directory: str,
+    quantity_of_games: int,
+    seed: int,
+    quantity_of_archers: int = constants.QUANTITY_OF_TEAMS*constants.QUANTITY_OF_ARCHERS_BY_TEAM,
+) -> "RandomPool":
+    """
+    Genera, valida y guarda los valores aleatorios de un torneo
+
+    El pool se escribe en un directorio temporal que reemplaza a directory al terminar, por lo que un pool
+    interrumpido nunca queda a medio escribir. Un pool ya guardado en directory no se reemplaza: si otro proceso lo
+    construyó mientras tanto con los mismos parámetros se usa ese, y si es otro pool se informa el error.
+
+    Args:
+        directory (str): Directorio del pool
+        quantity_of_games (int): Cantidad de juegos que cubre el pool
+        seed (int): Semilla base de los valores
+        quantity_of_archers (int): Cantidad de arqueros del torneo
+
+    Returns:
+        RandomPool: Pool construido, mapeado en memoria
+
+    Raises:
+        ValueError: si directory ya contiene un pool con otros parámetros
+    """
+    random = Random(seed=seed)
+    uniform_values, normal_values, ri_values = random_values.generate_values(random, quantity_of_games, quantity_of_archers)
+    manifest = {
+        "version": FORMAT_VERSION,
+        "seed": seed,
+        "quantity_of_games": quantity_of_games,
+        "quantity_of_archers": quantity_of_archers,
+        "seed_counter": random._seed_counter,
+        "distributions": DISTRIBUTIONS,
+        "arrays": {
+            UNIFORM: {"size": len(uniform_values), "dtype": uniform_values.dtype.str},
+            NORMAL: {"size": len(normal_values), "dtype": normal_values.dtype.str},
+            RI: {"size": len(ri_values), "dtype": ri_values.dtype.str},
+        },
+        "validation": {
+            **random.validation_statistics(),
+            "block_size": random.block_size,
+            "error": random.error,
+        },
+    }
+
+    temporary_directory = f"{directory.rstrip(os.sep)}.{os.getpid()}.tmp"
+    shutil.rmtree(temporary_directory, ignore_errors=True)
+    os.makedirs(temporary_directory)
+    np.save(os.path.join(temporary_directory, UNIFORM), uniform_values)
+    np.save(os.path.join(temporary_directory, NORMAL), normal_values)
+    np.save(os.path.join(temporary_directory, RI), ri_values)
+    with open(os.path.join(temporary_directory, MANIFEST), "w") as file:
+        json.dump(manifest, file, indent=2)
+    try:
+        os.replace(temporary_directory, directory)
+    except OSError:
+        # El directorio ya existe y no está vacío, por ejemplo porque otro proceso terminó antes de construir el pool
+        shutil.rmtree(temporary_directory, ignore_errors=True)
+        if not os.path.exists(os.path.join(directory, MANIFEST)):
+            raise
+        pool = RandomPool(directory)
+        if (pool.seed, pool.quantity_of_games, pool.quantity_of_archers) != (seed, quantity_of_games, quantity_of_archers):
+            raise ValueError(f"{directory} ya contiene otro pool; bórrelo para construir uno nuevo")
+        return pool
+    return RandomPool(directory)
+
+
+def pool_directory(
+    root: str,
+    quantity_of_games: int,
+    seed: int,
+    quantity_of_archers: int = constants.QUANTITY_OF_TEAMS*constants.QUANTITY_OF_ARCHERS_BY_TEAM,
+) -> str:
+    """
+    Devuelve el directorio de un pool dentro de root, nombrado por sus parámetros para reutilizarlo entre ejecuciones
+
+    Returns:
+        str: Directorio del pool
+    """
+    return os.path.join(root, f"seed_{seed}_games_{quantity_of_games}_archers_{quantity_of_archers}")
+
+
+def ensure_pool(
+    directory: str,
+    quantity_of_games: int,
+    seed: int,
+    quantity_of_archers: int = constants.QUANTITY_OF_TEAMS*constants.QUANTITY_OF_ARCHERS_BY_TEAM,
+) -> "RandomPool":
+    """
+    Abre el pool guardado en directory, construyéndolo antes si no existe
+
+    Returns:
+        RandomPool: Pool mapeado en memoria
+    """
+    if not os.path.exists(os.path.join(directory, MANIFEST)):
+        return build_pool(directory, quantity_of_games, seed, quantity_of_archers)
+    pool = RandomPool(directory)
+    pool.verify(quantity_of_games, seed, quantity_of_archers)
+    return pool
+
+
+class RandomPool:
+    """
+    Valores aleatorios precalculados, mapeados en memoria de solo lectura.
+
+    Attributes:
+        directory (str): Directorio del pool.
+        seed (int): Semilla base con la que se generaron los valores.
+        quantity_of_games (int): Cantidad de juegos que cubre el pool.
+        quantity_of_archers (int): Cantidad de arqueros del torneo.
+        seed_counter (int): Semillas derivadas usadas al terminar de generar los valores.
+        validation (dict): Estadísticas de validación de la generación.
+        uniform_values (np.ndarray): Valores uniformes (int32).
+        normal_values (np.ndarray): Valores normales (float64).
+        ri_values (np.ndarray): Ri cuantizados, enteros Ri*10^5 (uint32).
+    """
+    def __init__(self, directory: str):
+        """
+        Abre el pool guardado en directory
+
+        Args:
+            directory (str): Directorio del pool.
+        """
+        self.directory = directory
+        with open(os.path.join(directory, MANIFEST)) as file:
+            manifest = json.load(file)
+        if manifest.get("version") != FORMAT_VERSION:
+            raise ValueError(f"El pool de {directory} tiene una versión de formato no soportada")
+        if manifest["distributions"] != DISTRIBUTIONS:
+            raise ValueError(f"El pool de {directory} se generó con otros parámetros de las distribuciones")
+        self.seed = manifest["seed"]
+        self.quantity_of_games = manifest["quantity_of_games"]
+        self.quantity_of_archers = manifest["quantity_of_archers"]
+        self.seed_counter = manifest["seed_counter"]
+        self.validation = manifest["validation"]
+        self.uniform_values = self.__load(UNIFORM, manifest["arrays"][UNIFORM])
+        self.normal_values = self.__load(NORMAL, manifest["arrays"][NORMAL])
+        self.ri_values = self.__load(RI, manifest["arrays"][RI])
+
+    def verify(self, quantity_of_games: int, seed: int, quantity_of_archers: int):
+        """
+        Verifica que el pool alcance para un torneo
+
+        Args:
+            quantity_of_games (int): Cantidad de juegos del torneo
+            seed (int): Semilla del torneo, None para aceptar la del pool
+            quantity_of_archers (int): Cantidad de arqueros del torneo
+
+        Raises:
+            ValueError: si el pool no corresponde al torneo
+        """
+        if seed is not None and seed != self.seed:
+            raise ValueError(f"El pool de {self.directory} se generó con la semilla {self.seed}, no con {seed}")
+        if quantity_of_archers != self.quantity_of_archers:
+            raise ValueError(
+                f"El pool de {self.directory} es para {self.quantity_of_archers} arqueros, no para {quantity_of_archers}"
+            )
+        if quantity_of_games > self.quantity_of_games:
+            raise ValueError(
+                f"El pool de {self.directory} alcanza para {self.quantity_of_games} juegos, no para {quantity_of_games}"
+            )
+
+    def __load(self, name: str, description: dict) -> np.ndarray:
+        array = np.load(os.path.join(self.directory, name), mmap_mode="r")
+        if len(array) != description["size"] or array.dtype.str != description["dtype"]:
+            raise ValueError(f"El archivo {name} del pool de {self.directory} no coincide con su manifiesto")
+        # Vista ndarray del mapeo: el acceso por índice evita el costo de la subclase np.memmap
+        return array.view(np.ndarray)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Construye un pool precalculado de valores aleatorios")
+    parser.add_argument("--games", type=int, default=constants.QUANTITY_OF_GAMES, help="cantidad de juegos que cubre el pool")
+    parser.add_argument("--seed", type=int, required=True, help="semilla base de los valores")
+    parser.add_argument("--archers", type=int, default=constants.QUANTITY_OF_TEAMS*constants.QUANTITY_OF_ARCHERS_BY_TEAM, help="cantidad de arqueros del torneo")
+    parser.add_argument("--output", required=True, help="directorio del pool")
+    arguments = parser.parse_args(argv)
+
+    pool = build_pool(arguments.output, arguments.games, arguments.seed, arguments.archers)
+    print(json.dumps({"directory": pool.directory, "seed": pool.seed, "validation": pool.validation}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
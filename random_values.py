@@ -1,4 +1,7 @@
 from random_library.Random import Random
+from random_library.generators.Congruences import RI_SCALE
+from collections import deque
+import numpy as np
 import constants
 import math
 
@@ -6,21 +9,279 @@ stddev = 1
 mean = 1.5
 min_value = 25
 max_value = 45
-random = Random()
 
-quantity_unif_values = math.trunc(constants.QUANTITY_OF_GAMES*constants.QUANTITY_OF_ROUNDS + (constants.QUANTITY_OF_GAMES*constants.QUANTITY_OF_ROUNDS)*0.20)
-quantity_norm_values = constants.QUANTITY_OF_TEAMS*constants.QUANTITY_OF_ARCHERS_BY_TEAM*quantity_unif_values
+RANDOM_VALUE = "random"
+NORMAL_VALUE = "normal"
+UNIFORM_VALUE = "uniform"
+
+RI_BY_ARCHER_ROUND = 6
+# Ri validados que se generan cada vez que se termina el bloque de Ri
+RI_REFILL_SIZE = 100_000
+
+def quantity_of_rounds_values(quantity_of_games: int = constants.QUANTITY_OF_GAMES) -> int:
+    return math.trunc(quantity_of_games*constants.QUANTITY_OF_ROUNDS + (quantity_of_games*constants.QUANTITY_OF_ROUNDS)*0.20)
+
+def quantity_unif_values(
+    quantity_of_games: int = constants.QUANTITY_OF_GAMES,
+    quantity_of_archers: int = constants.QUANTITY_OF_TEAMS*constants.QUANTITY_OF_ARCHERS_BY_TEAM,
+) -> int:
+    # Cada arquero consume un valor uniforme al iniciar el torneo y al terminar cada juego
+    return max(quantity_of_rounds_values(quantity_of_games), quantity_of_archers*(quantity_of_games + 1))
+
+def quantity_norm_values(
+    quantity_of_games: int = constants.QUANTITY_OF_GAMES,
+    quantity_of_archers: int = constants.QUANTITY_OF_TEAMS*constants.QUANTITY_OF_ARCHERS_BY_TEAM,
+) -> int:
+    return quantity_of_archers*quantity_of_rounds_values(quantity_of_games)
+
+def quantity_ri_values(
+    quantity_of_games: int = constants.QUANTITY_OF_GAMES,
+    quantity_of_archers: int = constants.QUANTITY_OF_TEAMS*constants.QUANTITY_OF_ARCHERS_BY_TEAM,
+) -> int:
+    # Cada arquero consume en promedio unos 6 Ri por ronda (lanzamientos, lanzamiento especial y resistencia a restar);
+    # los desempates no tienen límite, por lo que si los Ri se terminan se genera otro bloque (ver RI_REFILL_SIZE)
+    return RI_BY_ARCHER_ROUND*quantity_of_archers*quantity_of_rounds_values(quantity_of_games)
+
+def generate_values(random: Random, quantity_of_games: int, quantity_of_archers: int) -> tuple:
+    """
+    Genera y valida los valores uniformes, normales y los Ri cuantizados de un torneo
+
+    Args:
+        random (Random): Generador del que se obtienen los valores
+        quantity_of_games (int): Cantidad de juegos del torneo
+        quantity_of_archers (int): Cantidad de arqueros del torneo
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: valores uniformes (int32), normales (float64) y Ri*10^5 (uint32)
+    """
+    uniform_values = random.uniform_array(min_value, max_value, quantity_unif_values(quantity_of_games, quantity_of_archers), True, dtype=np.int32)
+    normal_values = random.normal_array(mean, stddev, quantity_norm_values(quantity_of_games, quantity_of_archers))
+    ri_values = random.random_quantized(quantity_ri_values(quantity_of_games, quantity_of_archers))
+    return uniform_values, normal_values, ri_values
+
+def mirror_random_value(value: float) -> float:
+    """
+    Valor antitético de un Ri: 1 - u
+    """
+    return 1 - value
+
+def mirror_quantized_value(value: int) -> int:
+    """
+    Valor antitético de un Ri cuantizado: 10^5 - q, exacto en enteros
+    """
+    return RI_SCALE - value
+
+def mirror_norm_value(value: float) -> float:
+    """
+    Valor antitético de una normal: reflejo respecto a la media
+    """
+    return 2 * mean - value
+
+def mirror_uniform_value(value: int) -> int:
+    """
+    Valor antitético de un uniforme entero: reflejo dentro de [min_value, max_value)
+    """
+    # El Ri puede valer exactamente 1, por lo que el uniforme puede llegar a max_value
+    return max(min_value, min_value + max_value - 1 - value)
+
+MIRRORS = {
+    RANDOM_VALUE: mirror_random_value,
+    NORMAL_VALUE: mirror_norm_value,
+    UNIFORM_VALUE: mirror_uniform_value,
+}
 
 class Values:
-    def __init__(self):
-        self.uniform_values = random.uniform(min_value, max_value, quantity_unif_values, True)
-        self.normal_values = random.normal(mean, stddev, quantity_norm_values)
+    """
+    Valores aleatorios usados por el torneo.
+
+    Además de entregar los valores generados, permite registrar los valores consumidos
+    durante un juego (record) y reproducirlos reflejados en el siguiente (replay_mirrored)
+    para el muestreo antitético. Si el juego reflejado consume más valores de los registrados,
+    los restantes se generan normalmente.
+
+    Los Ri de random_value se generan y validan de una vez como un bloque de enteros Ri*10^5 (uint32, ver
+    Random.random_quantized) que se consume desde el final como los demás arreglos; si se termina, se genera otro
+    bloque con la siguiente semilla derivada. En modo cuantizado random_value devuelve el entero, que los conversores
+    comparan contra límites enteros; si no, lo divide por 10^5, lo que da exactamente el Ri flotante del LCG. Los
+    valores uniformes son enteros de 25 a 45 y se guardan en int32.
+
+    Con un pool precalculado (ver random_pool) los valores uniformes, normales y los Ri se leen del archivo mapeado en
+    memoria en lugar de generarse y validarse. Con la semilla y la cantidad de juegos con las que se construyó el pool,
+    los valores son los mismos que sin él.
+    """
+    def __init__(
+        self,
+        quantity_of_games: int = constants.QUANTITY_OF_GAMES,
+        seed: int = None,
+        quantity_of_archers: int = constants.QUANTITY_OF_TEAMS*constants.QUANTITY_OF_ARCHERS_BY_TEAM,
+        quantized: bool = False,
+        pool=None,
+    ):
+        self.quantized = quantized
+        self.mirrors = {**MIRRORS, RANDOM_VALUE: mirror_quantized_value} if quantized else MIRRORS
+        if pool is None:
+            self.random = Random(seed=seed)
+            self.uniform_values, self.normal_values, self.ri_values = generate_values(
+                self.random, quantity_of_games, quantity_of_archers
+            )
+        else:
+            pool.verify(quantity_of_games, seed, quantity_of_archers)
+            # Los bloques de Ri adicionales siguen derivándose de la semilla, desde donde quedó al construir el pool
+            self.random = Random(seed=pool.seed)
+            self.random._seed_counter = pool.seed_counter
+            self.uniform_values = pool.uniform_values
+            self.normal_values = pool.normal_values
+            self.ri_values = pool.ri_values
+        # Los valores se consumen desde el final del arreglo, como pop() sobre una lista
+        self.uniform_remaining = len(self.uniform_values)
+        self.normal_remaining = len(self.normal_values)
+        self.ri_remaining = len(self.ri_values)
+        self.initial_ri_values = self.ri_values
+        # Semillas derivadas usadas antes de generar el bloque de Ri actual, None si es el bloque inicial
+        self.ri_seed_counter: int = None
+        self.recorded: dict[str, list] = None
+        self.replay: dict[str, deque] = None
 
     def random_value(self):
-        return random.random()
-        
+        if self.quantized:
+            return self.__draw(RANDOM_VALUE, self.__next_ri)
+        return self.__draw(RANDOM_VALUE, self.__next_float_ri)
+
+    def unit_random_value(self) -> float:
+        """
+        Ri en [0, 1] consumido con random_value, también en modo cuantizado
+        """
+        value = self.random_value()
+        return value / RI_SCALE if self.quantized else value
+
+    def unit_random_values(self, shape) -> np.ndarray:
+        """
+        Arreglo de Ri en [0, 1], en orden por filas los mismos que consumirían sucesivas llamadas a
+        unit_random_value. Se toman de una vez del bloque de Ri validados; solo mientras se registran o reproducen
+        valores (muestreo antitético) se consumen uno a uno para reflejarlos
+        """
+        quantity = int(np.prod(shape))
+        if self.recorded is not None or self.replay is not None:
+            return np.array([self.unit_random_value() for _ in range(quantity)], dtype=float).reshape(shape)
+        blocks = [np.empty(0, dtype=np.uint32)]
+        while quantity:
+            if self.ri_remaining == 0:
+                self.__refill_ri()
+            taken = min(quantity, self.ri_remaining)
+            # Desde el final del bloque, en el orden en que los devolvería __next_ri
+            blocks.append(self.ri_values[self.ri_remaining - taken:self.ri_remaining][::-1])
+            self.ri_remaining -= taken
+            quantity -= taken
+        return (np.concatenate(blocks) / RI_SCALE).reshape(shape)
+
     def norm_random_value(self):
-        return self.normal_values.pop()
+        return self.__draw(NORMAL_VALUE, self.__next_normal)
 
     def uniform_value(self):
-        return self.uniform_values.pop()
+        return self.__draw(UNIFORM_VALUE, self.__next_uniform)
+
+    def stream(self) -> tuple:
+        """
+        Identifica la secuencia de valores: semilla y tamaño de los arreglos de uniformes, normales y Ri. Como los
+        arreglos se consumen desde el final y su contenido depende de su tamaño, dos torneos con la misma semilla solo
+        usan los mismos valores en cada juego si también coincide el tamaño (la misma cantidad máxima de juegos y de
+        arqueros, o el mismo pool)
+        """
+        return self.random.seed, len(self.uniform_values), len(self.normal_values), len(self.initial_ri_values)
+
+    def positions(self) -> dict:
+        """
+        Posición actual de los generadores: valores uniformes, normales y Ri restantes, semillas derivadas usadas antes
+        de generar el bloque de Ri actual (None si es el inicial) y semillas derivadas usadas en total
+        """
+        return {
+            "uniform_remaining": self.uniform_remaining,
+            "normal_remaining": self.normal_remaining,
+            "ri_remaining": self.ri_remaining,
+            "ri_seed_counter": self.ri_seed_counter,
+            "seed_counter": self.random._seed_counter,
+        }
+
+    def restore_positions(
+        self,
+        uniform_remaining: int,
+        normal_remaining: int,
+        ri_remaining: int,
+        ri_seed_counter: int,
+        seed_counter: int,
+    ):
+        """
+        Restaura la posición de los generadores guardada con positions. Los valores se generan de nuevo con la
+        misma semilla, por lo que basta con descartar los ya consumidos y, si se había generado otro bloque de Ri,
+        volver a generarlo desde la misma semilla derivada
+        """
+        self.uniform_remaining = uniform_remaining
+        self.normal_remaining = normal_remaining
+        if ri_seed_counter is None:
+            self.ri_values = self.initial_ri_values
+        else:
+            self.random._seed_counter = ri_seed_counter
+            self.__refill_ri()
+        self.ri_remaining = ri_remaining
+        self.random._seed_counter = seed_counter
+
+    def record(self):
+        """
+        Empieza a registrar los valores consumidos
+        """
+        self.recorded = {RANDOM_VALUE: [], NORMAL_VALUE: [], UNIFORM_VALUE: []}
+        self.replay = None
+
+    def replay_mirrored(self):
+        """
+        Reproduce reflejados los valores registrados, en el mismo orden en que se consumieron
+        """
+        self.replay = {
+            kind: deque(self.mirrors[kind](value) for value in values)
+            for kind, values in self.recorded.items()
+        }
+        self.recorded = None
+
+    def stop(self):
+        """
+        Deja de registrar y de reproducir valores
+        """
+        self.recorded = None
+        self.replay = None
+
+    def __next_normal(self) -> float:
+        if self.normal_remaining == 0:
+            raise IndexError("no quedan valores normales")
+        self.normal_remaining -= 1
+        return float(self.normal_values[self.normal_remaining])
+
+    def __next_uniform(self) -> int:
+        if self.uniform_remaining == 0:
+            raise IndexError("no quedan valores uniformes")
+        self.uniform_remaining -= 1
+        return int(self.uniform_values[self.uniform_remaining])
+
+    def __next_ri(self) -> int:
+        if self.ri_remaining == 0:
+            self.__refill_ri()
+        self.ri_remaining -= 1
+        return int(self.ri_values[self.ri_remaining])
+
+    def __next_float_ri(self) -> float:
+        return self.__next_ri() / RI_SCALE
+
+    def __refill_ri(self):
+        """
+        Reemplaza el bloque de Ri consumido por uno nuevo, generado y validado con la siguiente semilla derivada
+        """
+        self.ri_seed_counter = self.random._seed_counter
+        self.ri_values = self.random.random_quantized(RI_REFILL_SIZE)
+        self.ri_remaining = len(self.ri_values)
+
+    def __draw(self, kind: str, generate):
+        if self.replay is not None and self.replay[kind]:
+            return self.replay[kind].popleft()
+        value = generate()
+        if self.recorded is not None:
+            self.recorded[kind].append(value)
+        return value
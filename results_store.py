@@ -0,0 +1,317 @@
+import json
+import os
+import numpy as np
+import constants
+
+"""
+Módulo de almacenamiento columnar de los resultados del torneo.
+
+El escritor guarda los registros de cada ronda y de cada juego en archivos .npy por columna, agrupados en bloques
+(chunks) de juegos, junto con un manifiesto JSON que describe las columnas y los bloques escritos. El lector abre
+cada bloque con mapeo en memoria, por lo que una ejecución de millones de rondas puede analizarse sin volver a
+simularla ni cargarla completa en memoria.
+
+Estructura del directorio:
+    manifest.json
+    rounds/<columna>/<bloque>.npy
+    games/<columna>/<bloque>.npy
+
+Los identificadores de equipos y arqueros son su posición en el torneo (ver team_names y archer_names del manifiesto),
+-1 indica que no hubo ganador (empate).
+"""
+
+MANIFEST = "manifest.json"
+ROUNDS = "rounds"
+GAMES = "games"
+
+ROUND_COLUMNS = {
+    "game": np.int64,
+    "round": np.int16,
+    "team_points": np.int32,
+    "best_team": np.int16,
+    "best_archer": np.int16,
+    "tied": np.bool_,
+}
+
+GAME_COLUMNS = {
+    "game": np.int64,
+    "best_team": np.int16,
+    "rounds_won": np.int16,
+    "best_archer": np.int16,
+    "luckiest_archer": np.int16,
+    "tied_rounds": np.int16,
+    "female_wins": np.int16,
+    "male_wins": np.int16,
+    "female_experience": np.int32,
+    "male_experience": np.int32,
+}
+
+
+class ResultsWriter:
+    """
+    Escribe por bloques los resultados de cada ronda y juego del torneo.
+
+    Attributes:
+        directory (str): Directorio donde se guardan los resultados.
+        chunk_size (int): Cantidad de juegos por bloque.
+        team_names (list[str]): Nombres de los equipos, en el orden de sus identificadores.
+        archer_names (list[str]): Nombres de los arqueros, en el orden de sus identificadores.
+        chunks (list[dict]): Bloques escritos con su cantidad de juegos y rondas.
+    """
+    def __init__(
+        self,
+        directory: str,
+        team_names: list,
+        archer_names: list,
+        chunk_size: int = constants.RESULTS_CHUNK_SIZE,
+        resume_games: int = 0,
+    ):
+        """
+        Inicializa el escritor de resultados
+
+        Args:
+            directory (str): Directorio donde se guardan los resultados.
+            team_names (list[str]): Nombres de los equipos.
+            archer_names (list[str]): Nombres de los arqueros.
+            chunk_size (int): Cantidad de juegos por bloque.
+            resume_games (int): Juegos ya simulados al reanudar un torneo; se conservan solo los bloques de esos juegos.
+        """
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.team_names = list(team_names)
+        self.archer_names = list(archer_names)
+        self.team_ids = {name: i for i, name in enumerate(self.team_names)}
+        self.archer_ids = {name: i for i, name in enumerate(self.archer_names)}
+        self.chunks: list[dict] = []
+        self.__clear_buffers()
+
+        os.makedirs(directory, exist_ok=True)
+        if resume_games > 0:
+            self.__keep_chunks(resume_games)
+        self.__write_manifest()
+
+    def add_game(self, game, teams: list):
+        """
+        Agrega los registros de un juego terminado y de cada una de sus rondas
+
+        Args:
+            game (Game): Juego terminado
+            teams (list[Team]): Lista de los equipos participantes
+        """
+        quantity_of_rounds = len(game.rounds)
+        team_points = [team.points_by_round[-quantity_of_rounds:] for team in teams]
+        for i, round in enumerate(game.rounds):
+            self.rounds["game"].append(game.id)
+            self.rounds["round"].append(round.id)
+            self.rounds["team_points"].append([points[i] for points in team_points])
+            self.rounds["best_team"].append(self.__team_id(round.best_team))
+            self.rounds["best_archer"].append(self.__archer_id(round.best_archer))
+            self.rounds["tied"].append(round.is_a_tied_round)
+
+        self.games["game"].append(game.id)
+        self.games["best_team"].append(self.__team_id(game.bestTeam))
+        self.games["rounds_won"].append(game.bestTeam[constants.ROUNDS_WON] if game.bestTeam else 0)
+        self.games["best_archer"].append(self.__archer_id(game.bestArcher))
+        self.games["luckiest_archer"].append(self.__archer_id(game.the_luckiest_archer))
+        self.games["tied_rounds"].append(game.quantity_of_tied_rounds)
+        self.games["female_wins"].append(game.female_wins)
+        self.games["male_wins"].append(game.male_wins)
+        self.games["female_experience"].append(game.female_experience_by_round[-1])
+        self.games["male_experience"].append(game.male_experience_by_round[-1])
+
+        if len(self.games["game"]) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Escribe en disco los registros pendientes como un nuevo bloque y actualiza el manifiesto
+        """
+        quantity_of_games = len(self.games["game"])
+        if quantity_of_games == 0:
+            return
+        chunk = len(self.chunks)
+        for table, columns, buffers in ((ROUNDS, ROUND_COLUMNS, self.rounds), (GAMES, GAME_COLUMNS, self.games)):
+            for name, dtype in columns.items():
+                self.__save(self.__chunk_path(table, name, chunk), np.asarray(buffers[name], dtype=dtype))
+        self.chunks.append({"games": quantity_of_games, "rounds": len(self.rounds["game"])})
+        self.__clear_buffers()
+        self.__write_manifest()
+
+    def close(self):
+        """
+        Escribe los registros pendientes
+        """
+        self.flush()
+
+    def __team_id(self, team: dict) -> int:
+        return self.team_ids[team[constants.NAME_ATRIBUTE]] if team else -1
+
+    def __archer_id(self, archer: dict) -> int:
+        return self.archer_ids[archer[constants.NAME_ATRIBUTE]] if archer else -1
+
+    def __clear_buffers(self):
+        self.rounds = {name: [] for name in ROUND_COLUMNS}
+        self.games = {name: [] for name in GAME_COLUMNS}
+
+    def __chunk_path(self, table: str, column: str, chunk: int) -> str:
+        return os.path.join(self.directory, table, column, f"{chunk:06d}.npy")
+
+    def __save(self, path: str, array: np.ndarray):
+        """
+        Guarda un arreglo de forma atómica
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as file:
+            np.save(file, array)
+        os.replace(temporary_path, path)
+
+    def __keep_chunks(self, quantity_of_games: int):
+        """
+        Conserva los bloques escritos hasta quantity_of_games juegos, descartando los posteriores
+
+        Args:
+            quantity_of_games (int): Juegos ya simulados del torneo
+        """
+        with open(os.path.join(self.directory, MANIFEST)) as file:
+            chunks = json.load(file)["chunks"]
+        games = 0
+        for chunk in chunks:
+            if games + chunk["games"] > quantity_of_games:
+                break
+            self.chunks.append(chunk)
+            games += chunk["games"]
+        if games != quantity_of_games:
+            raise ValueError(
+                f"Los resultados guardados en {self.directory} no coinciden con los {quantity_of_games} juegos del punto de control"
+            )
+
+    def __write_manifest(self):
+        """
+        Escribe el manifiesto de forma atómica
+        """
+        manifest = {
+            "team_names": self.team_names,
+            "archer_names": self.archer_names,
+            "columns": {
+                ROUNDS: {name: np.dtype(dtype).str for name, dtype in ROUND_COLUMNS.items()},
+                GAMES: {name: np.dtype(dtype).str for name, dtype in GAME_COLUMNS.items()},
+            },
+            "chunks": self.chunks,
+        }
+        path = os.path.join(self.directory, MANIFEST)
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(manifest, file, indent=2)
+        os.replace(temporary_path, path)
+
+
+class ChunkedColumn:
+    """
+    Columna de resultados formada por los bloques mapeados en memoria.
+
+    Attributes:
+        chunks (list[np.memmap]): Bloques de la columna.
+    """
+    def __init__(self, chunks: list):
+        """
+        Inicializa la columna
+
+        Args:
+            chunks (list[np.memmap]): Bloques de la columna, en orden.
+        """
+        self.chunks = chunks
+        self.offsets = np.cumsum([0] + [len(chunk) for chunk in chunks])
+
+    def __len__(self) -> int:
+        return int(self.offsets[-1])
+
+    def __getitem__(self, key):
+        """
+        Devuelve un valor (índice entero) o un arreglo (slice), leyendo solo los bloques necesarios
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return self[start:stop][::step]
+            parts = []
+            for i, chunk in enumerate(self.chunks):
+                begin, end = self.offsets[i], self.offsets[i + 1]
+                if end <= start or begin >= stop:
+                    continue
+                parts.append(chunk[max(start - begin, 0):min(stop, end) - begin])
+            if not parts:
+                return np.empty((0,) + self.chunks[0].shape[1:], dtype=self.chunks[0].dtype) if self.chunks else np.empty(0)
+            return parts[0] if len(parts) == 1 else np.concatenate(parts)
+        index = int(key)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(key)
+        chunk = int(np.searchsorted(self.offsets, index, side="right")) - 1
+        return self.chunks[chunk][index - self.offsets[chunk]]
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Devuelve la columna completa como un solo arreglo (la carga en memoria)
+        """
+        return self[:]
+
+
+class ResultsReader:
+    """
+    Lee los resultados escritos con ResultsWriter mapeando en memoria cada bloque.
+
+    Attributes:
+        directory (str): Directorio de los resultados.
+        team_names (list[str]): Nombres de los equipos, en el orden de sus identificadores.
+        archer_names (list[str]): Nombres de los arqueros, en el orden de sus identificadores.
+        quantity_of_games (int): Cantidad de juegos guardados.
+        quantity_of_rounds (int): Cantidad de rondas guardadas.
+    """
+    def __init__(self, directory: str):
+        """
+        Abre los resultados guardados en directory
+
+        Args:
+            directory (str): Directorio de los resultados.
+        """
+        self.directory = directory
+        with open(os.path.join(directory, MANIFEST)) as file:
+            self.manifest = json.load(file)
+        self.team_names = self.manifest["team_names"]
+        self.archer_names = self.manifest["archer_names"]
+        self.quantity_of_games = sum(chunk["games"] for chunk in self.manifest["chunks"])
+        self.quantity_of_rounds = sum(chunk["rounds"] for chunk in self.manifest["chunks"])
+
+    def column(self, table: str, name: str) -> ChunkedColumn:
+        """
+        Devuelve una columna de la tabla de rondas o de juegos
+
+        Args:
+            table (str): ROUNDS o GAMES
+            name (str): nombre de la columna
+
+        Returns:
+            ChunkedColumn: columna mapeada en memoria
+        """
+        if name not in self.manifest["columns"][table]:
+            raise KeyError(f"La tabla {table} no tiene la columna {name}")
+        return ChunkedColumn(
+            [
+                np.load(os.path.join(self.directory, table, name, f"{chunk:06d}.npy"), mmap_mode="r")
+                for chunk in range(len(self.manifest["chunks"]))
+            ]
+        )
+
+    def rounds(self, name: str) -> ChunkedColumn:
+        """
+        Devuelve una columna de la tabla de rondas
+        """
+        return self.column(ROUNDS, name)
+
+    def games(self, name: str) -> ChunkedColumn:
+        """
+        Devuelve una columna de la tabla de juegos
+        """
+        return self.column(GAMES, name)
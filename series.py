@@ -0,0 +1,100 @@
+import numpy as np
+
+"""
+Módulo de series numéricas que crecen de a un elemento.
+
+Las series del torneo (puntos por ronda, experiencia por juego, acumulados por arquero y por género) reciben un valor
+por ronda o por juego y llegan a cientos de miles de elementos. Guardarlas en listas de enteros de Python cuesta un
+puntero y, fuera de los enteros pequeños, un objeto por elemento; un arreglo tipado de NumPy guarda solo los 4 u 8
+bytes del valor y los gráficos y puntos de control lo usan sin convertirlo.
+"""
+
+INITIAL_CAPACITY = 1024
+
+
+class GrowableArray:
+    """
+    Serie de valores sobre un arreglo de NumPy tipado que duplica su capacidad al llenarse, por lo que agregar un
+    elemento cuesta O(1) amortizado.
+
+    Los elementos se leen como enteros (o flotantes) de Python y los rangos como vistas del arreglo, sin copiarlo. Una
+    vista deja de reflejar los valores agregados cuando el arreglo crece, por lo que debe obtenerse después de
+    terminar de agregarlos.
+
+    Attributes:
+        size (int): Cantidad de elementos de la serie.
+    """
+    def __init__(self, dtype=np.int64, capacity: int = INITIAL_CAPACITY):
+        """
+        Inicializa una serie vacía
+
+        Args:
+            dtype: Tipo de los elementos
+            capacity (int): Cantidad de elementos que caben antes de crecer
+        """
+        self.size = 0
+        self.__data = np.empty(max(capacity, 1), dtype=dtype)
+
+    @staticmethod
+    def from_values(values, dtype=np.int64) -> "GrowableArray":
+        """
+        Crea una serie con los valores dados
+
+        Args:
+            values (array): Valores iniciales de la serie
+            dtype: Tipo de los elementos
+
+        Returns:
+            GrowableArray: Serie con una copia de los valores
+        """
+        values = np.asarray(values, dtype=dtype)
+        series = GrowableArray(dtype, max(len(values), INITIAL_CAPACITY))
+        series.__data[:len(values)] = values
+        series.size = len(values)
+        return series
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.__data.dtype
+
+    def append(self, value):
+        """
+        Agrega un valor al final de la serie
+
+        Args:
+            value: Valor a agregar
+        """
+        if self.size == len(self.__data):
+            data = np.empty(2 * len(self.__data), dtype=self.__data.dtype)
+            data[:self.size] = self.__data
+            self.__data = data
+        self.__data[self.size] = value
+        self.size += 1
+
+    def view(self) -> np.ndarray:
+        """
+        Devuelve los elementos de la serie como una vista del arreglo, sin copiarlos
+
+        Returns:
+            np.ndarray: Vista de los elementos
+        """
+        return self.__data[:self.size]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.view()[key]
+        return self.view().item(key)
+
+    def __setitem__(self, key, value):
+        self.view()[key] = value
+
+    def __iter__(self):
+        return iter(self.view().tolist())
+
+    def __array__(self, dtype=None, copy=None):
+        if copy:
+            return np.array(self.view(), dtype=dtype)
+        return self.view() if dtype is None else self.view().astype(dtype, copy=False)
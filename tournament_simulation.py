@@ -8,7 +8,22 @@ from points_conversion import (
 )
 from score import Puntuation, PuntuationTeam
 import constants
-from random_values import Values
+from random_values import Values, mirror_norm_value, mirror_uniform_value
+from estimation import TournamentEstimates, RunningEstimate, IntegerHistogram
+from checkpoint import save_checkpoint, load_checkpoint
+from results_store import ResultsWriter
+from random_pool import RandomPool
+from analytic import (
+    AnalyticRound,
+    quantity_of_shots,
+    sample_shots_points,
+    sample_tie_breaks,
+    sample_two_archer_tie_break,
+    shot_distribution,
+)
+from series import GrowableArray
+import numpy as np
+import time
 
 """
 Módulo principal de simulación de torneo de arquería.
@@ -36,7 +51,8 @@ class Archer:
         quantity_experienced_games (int): Veces que fue el más experimentado.
         puntuations (list): Lista de puntuaciones por tiro.
         round_points (list): Puntos por ronda.
-        acumulation_points (list): Puntos acumulados por ronda.
+        acumulation_points (GrowableArray): Puntos acumulados por ronda.
+        experience_listeners (list): Funciones que reciben (arquero, cambio de experiencia) cada vez que esta cambia.
     """
     def __init__(
         self,
@@ -72,7 +88,8 @@ class Archer:
         self.quantity_experienced_games = 0
         self.puntuations = []
         self.round_points = []
-        self.acumulation_points = []
+        self.acumulation_points = GrowableArray(np.int64)
+        self.experience_listeners = []
 
     def add_puntuation_round(self, id: int, points: int):
         """
@@ -120,6 +137,41 @@ class Archer:
         """
         return self.__add_points(value, game, round)
 
+    def execute_sampled_additional_shots(self, point: int, game: int, round: int) -> int:
+        """
+        Registra el total, ya sorteado, de los tiros adicionales de desempate del arquero, que no afectan a su
+        resistencia. El total queda registrado como una sola puntuación
+
+        Args:
+            point (int): puntuación total de los tiros adicionales
+            game (int): identificador del juego en que se realizaron los tiros
+            round (int): identificador de la ronda en que se realizaron los tiros
+
+        Returns:
+            int: puntuación registrada
+        """
+        return self.__record_points(point, game, round)
+
+    def execute_sampled_shots(self, value: float, quantity: int, game: int, round: int) -> int:
+        """
+        Ejecuta de una vez quantity lanzamientos normales, sorteando el total de sus puntos con un solo valor aleatorio
+        a partir de su distribución exacta (ver analytic.sample_shots_points). El total queda registrado como una sola
+        puntuación
+
+        Args:
+            value (float): Ri en [0, 1] con el que se sortea el total
+            quantity (int): cantidad de lanzamientos
+            game (int): identificador del juego en que se realizaron los tiros
+            round (int): identificador de la ronda en que se realizaron los tiros
+
+        Returns:
+            int: puntuación total de los lanzamientos
+        """
+        point = sample_shots_points(type(self.points_converter), quantity, value)
+        self.__record_points(point, game, round)
+        self.decrease_resistence(quantity * constants.RESISTANCE_CONSUMPTION)
+        return point
+
     def __add_points(self, value: float, game: int, round: int) -> int:
         """
         Agrega los puntos obtenidos al jugador a partir de value
@@ -132,7 +184,20 @@ class Archer:
         Returns:
             int: puntuación obtenida a partir de value
         """
-        point = self.points_converter.obtain_point(value)
+        return self.__record_points(self.points_converter.obtain_point(value), game, round)
+
+    def __record_points(self, point: int, game: int, round: int) -> int:
+        """
+        Registra puntos ya obtenidos en la ronda, en las puntuaciones y en el total del arquero
+
+        Args:
+            point (int): puntos obtenidos
+            game (int): identificador del juego en que se obtuvieron
+            round (int): identificador de la ronda en que se obtuvieron
+
+        Returns:
+            int: puntos registrados
+        """
         self.add_puntuation_round(round, point)
         puntuation = Puntuation(len(self.puntuations), game, round, point)
         self.puntuations.append(puntuation)
@@ -144,9 +209,8 @@ class Archer:
         Acumula los puntos obtenidos sumando los de la última ronda con el total de los que tiene en la ronda actual
         """
         if len(self.acumulation_points) > 0:
-            last_position = len(self.acumulation_points) - 1
             self.acumulation_points.append(
-                self.acumulation_points[last_position] + self.total_points
+                self.acumulation_points[-1] + self.total_points
             )
         else:
             self.acumulation_points.append(self.total_points)
@@ -191,6 +255,17 @@ class Archer:
             experience (int): Cantidad de experiencia a agregar
         """
         self.current_experience += experience
+        self.__notify_experience(experience)
+
+    def __notify_experience(self, experience: int):
+        """
+        Informa a los interesados (el equipo del arquero) el cambio de experiencia
+        
+        Args:
+            experience (int): Cambio de la experiencia
+        """
+        for listener in self.experience_listeners:
+            listener(self, experience)
 
     def restore_resistence(self, less_units: int):
         """
@@ -233,7 +308,10 @@ class Archer:
         """
         self.luck = luck
         self.current_resistance = resistance
+        experience_gained = self.experience_gained()
         self.current_experience = self.initial_experience
+        if experience_gained:
+            self.__notify_experience(-experience_gained)
         self.total_points = 0
         self.used_resistance = 0
 
@@ -262,10 +340,13 @@ class Team:
         puntuations (list[PuntuationTeam]): Puntuaciones por ronda.
         special_archer (Archer): Actual arquero especial del equipo de la ronda.
         quantity_games_won (int): Juegos ganados.
-        points_by_round (list): Puntos por ronda.
-        special_shots_by_game (list): Tiros especiales por juego.
-        experience_by_game (list): Experiencia obtenida por juego.
+        points_by_round (GrowableArray): Puntos por ronda.
+        points_histogram (IntegerHistogram): Histograma de los puntos por ronda.
+        special_shots_by_game (GrowableArray): Tiros especiales por juego.
+        experience_by_game (GrowableArray): Experiencia obtenida por juego.
         repeated_special_archer (int): Veces que el arquero especial se repite.
+        total_experience_gained (int): Experiencia ganada por los arqueros del equipo en el juego actual.
+        experience_gained_by_gender (dict[Gender, int]): Experiencia ganada en el juego actual por género.
     """
     def __init__(self, name: str):
         """
@@ -281,10 +362,14 @@ class Team:
         self.puntuations: list[PuntuationTeam] = []
         self.special_archer = None
         self.quantity_games_won = 0
-        self.points_by_round = []
-        self.special_shots_by_game = []
-        self.experience_by_game = []
+        self.points_by_round = GrowableArray(np.int32)
+        self.points_histogram = IntegerHistogram()
+        self.special_shots_by_game = GrowableArray(np.int32)
+        self.experience_by_game = GrowableArray(np.int32)
         self.repeated_special_archer = 0
+        # Totales que los arqueros actualizan al cambiar su experiencia, para no recorrerlos en cada ronda
+        self.total_experience_gained = 0
+        self.experience_gained_by_gender = {gender: 0 for gender in Gender}
 
     def add_archer(self, archer: Archer):
         """
@@ -294,6 +379,19 @@ class Team:
             archer (Archer): Arquero a añadir al equipo
         """
         self.archers.append(archer)
+        archer.experience_listeners.append(self.__add_experience)
+        self.__add_experience(archer, archer.experience_gained())
+
+    def __add_experience(self, archer: Archer, experience: int):
+        """
+        Actualiza los totales de experiencia con el cambio de experiencia de un arquero
+        
+        Args:
+            archer (Archer): Arquero cuya experiencia cambió
+            experience (int): Cambio de la experiencia
+        """
+        self.total_experience_gained += experience
+        self.experience_gained_by_gender[archer.gender] += experience
 
     def add_special_shot_game(self, game: int):
         """
@@ -311,7 +409,7 @@ class Team:
         """
         Agrega la experiencia ganada en el juego
         """
-        self.experience_by_game.append(self.__total_experience_gained())
+        self.experience_by_game.append(self.total_experience_gained)
 
     def add_puntuation(
         self,
@@ -331,11 +429,12 @@ class Team:
                 game,
                 round,
                 self.total_points,
-                self.__total_experience_gained(),
+                self.total_experience_gained,
                 self.total_special_shots,
             )
         )
         self.points_by_round.append(self.total_points)
+        self.points_histogram.add(self.total_points)
 
     def add_points(self, points: int):
         """
@@ -346,18 +445,6 @@ class Team:
         """
         self.total_points += points
 
-    def __total_experience_gained(self) -> int:
-        """
-        Experiencia total reunida fuera de la experiencia inicial
-            
-        Returns:
-            int: experiencia reunida en total
-        """
-        total_experience = 0
-        for archer in self.archers:
-            total_experience += archer.experience_gained()
-        return total_experience
-
     def add_special_shot(self):
         """
         Aumenta el contador de la cantidad total de lanzamientos especiales realizados del equipo
@@ -416,7 +503,7 @@ class Team:
                     best_archers.append(archer)
             else:
                 best_archers.append(archer)
-        return list(set(best_archers))
+        return list(dict.fromkeys(best_archers))
 
     def set_special_archer(self, archer: Archer):
         """
@@ -448,6 +535,91 @@ class Team:
         self.quantity_games_won += 1
 
 
+class RoundResults:
+    """
+    Resultados de las rondas de un juego guardados en arreglos compactos indexados por el identificador de la ronda.
+
+    Los equipos y arqueros se identifican por su posición en la lista de equipos del juego; -1 indica que no hubo
+    ganador.
+
+    Atributos:
+        team_names (list[str]): Nombres de los equipos, en el orden de sus identificadores.
+        archer_names (list[str]): Nombres de los arqueros, en el orden de sus identificadores.
+        team_ids (dict[str, int]): Identificador de cada equipo por nombre.
+        archer_ids (dict[str, int]): Identificador de cada arquero por nombre.
+        best_team (np.ndarray): Equipo ganador de cada ronda.
+        best_archer (np.ndarray): Arquero ganador de cada ronda.
+        best_archer_gender (np.ndarray): Género del arquero ganador: 1 masculino, 0 femenino, -1 sin ganador.
+        luckiest_archer (np.ndarray): Arquero más afortunado de cada ronda.
+        luck (np.ndarray): Suerte del arquero más afortunado de cada ronda.
+        tied (np.ndarray): Indica si la ronda fue empatada.
+    """
+    def __init__(self, teams: list, quantity_of_rounds: int = constants.QUANTITY_OF_ROUNDS):
+        """
+        Inicializa los arreglos de resultados
+
+        Args:
+            teams (list[Team]): Lista de los equipos que juegan las rondas
+            quantity_of_rounds (int): Cantidad de rondas del juego
+        """
+        self.team_names = [team.name for team in teams]
+        self.archer_names = [archer.name for team in teams for archer in team.archers]
+        self.team_ids = {name: i for i, name in enumerate(self.team_names)}
+        self.archer_ids = {name: i for i, name in enumerate(self.archer_names)}
+        self.best_team = np.full(quantity_of_rounds, -1, dtype=np.int16)
+        self.best_archer = np.full(quantity_of_rounds, -1, dtype=np.int16)
+        self.best_archer_gender = np.full(quantity_of_rounds, -1, dtype=np.int8)
+        self.luckiest_archer = np.full(quantity_of_rounds, -1, dtype=np.int16)
+        self.luck = np.zeros(quantity_of_rounds)
+        self.tied = np.zeros(quantity_of_rounds, dtype=np.bool_)
+
+    def record(self, round: "Round"):
+        """
+        Guarda los resultados de una ronda terminada
+
+        Args:
+            round (Round): Ronda terminada
+        """
+        i = round.id
+        if round.best_team:
+            self.best_team[i] = self.team_ids[round.best_team[constants.NAME_ATRIBUTE]]
+        if round.best_archer:
+            self.best_archer[i] = self.archer_ids[round.best_archer[constants.NAME_ATRIBUTE]]
+            self.best_archer_gender[i] = 1 if round.best_archer[constants.GENDER] == Gender.MALE else 0
+        if round.luckiest_archer:
+            self.luckiest_archer[i] = self.archer_ids[round.luckiest_archer[constants.NAME_ATRIBUTE]]
+            self.luck[i] = round.luckiest_archer[constants.LUCK]
+        self.tied[i] = round.is_a_tied_round
+
+
+def define_winner_index(scores: np.ndarray) -> int:
+    """
+    Define el ganador entre participantes ordenados con el mismo criterio secuencial que usan los juegos: cada
+    participante con más puntaje que el ganador actual lo reemplaza, uno con el mismo puntaje lo descarta (empate) y,
+    sin ganador actual, el siguiente participante toma su lugar
+
+    Args:
+        scores (np.ndarray): Puntaje de cada participante, en el orden en que se comparan
+
+    Returns:
+        int: Posición del ganador, -1 si hubo empate o no hay participantes
+    """
+    if len(scores) == 0:
+        return -1
+    best = int(scores.argmax())
+    values = scores.tolist()
+    if values.count(values[best]) == 1:
+        # Con un único máximo el recorrido secuencial siempre termina en él
+        return best
+    winner = -1
+    for i, score in enumerate(values):
+        if winner < 0 or score > values[winner]:
+            winner = i
+        elif score == values[winner]:
+            winner = -1
+    return winner
+
+
 class Round:
     """
     Representa una ronda dentro de un juego.
@@ -460,8 +632,21 @@ class Round:
         best_team (dict): Mejor equipo de la ronda.
         luckiest_archer (dict): Arquero más afortunado de la ronda.
         values (Values): Generador de valores aleatorios.
+        analytic (bool): Indica si se calcula la probabilidad exacta de empate antes de simular la ronda.
+        tie_probability (float): Probabilidad exacta de empate dado el estado inicial de la ronda, None si no es analítica.
+        sampled_shots (bool): Indica si los lanzamientos normales de cada arquero se reemplazan por un único sorteo de su total a partir de su distribución exacta, y el desempate de arqueros se sortea de la distribución de sus lanzamientos.
+        reshoot_rounds (int): Rondas de lanzamientos adicionales que hicieron falta para desempatar a los arqueros.
+        results (RoundResults): Arreglos del juego donde se guardan los resultados de la ronda, None para no guardarlos.
     """
-    def __init__(self, id: int, game: int, values:Values):
+    def __init__(
+        self,
+        id: int,
+        game: int,
+        values:Values,
+        analytic: bool = False,
+        results: RoundResults = None,
+        sampled_shots: bool = False,
+    ):
         """
         Inicializa una ronda
         
@@ -469,6 +654,9 @@ class Round:
             id (int): Identificador de la ronda
             game (int): Identificador del juego al que pertenece la ronda
             values (Values): Generador de valores aleatorios.
+            analytic (bool): Indica si se calcula la probabilidad exacta de empate antes de simular la ronda.
+            results (RoundResults): Arreglos del juego donde se guardan los resultados de la ronda.
+            sampled_shots (bool): Sortea el total de los lanzamientos normales de cada arquero con un solo valor aleatorio (ver analytic.sample_shots_points) y el desempate de arqueros con analytic.sample_tie_breaks.
         """
         self.id = id
         self.game_id = game
@@ -477,6 +665,11 @@ class Round:
         self.best_team: dict = None
         self.luckiest_archer: dict = None
         self.values = values
+        self.analytic = analytic
+        self.tie_probability: float = None
+        self.sampled_shots = sampled_shots
+        self.reshoot_rounds = 0
+        self.results = results
 
     def execute(self, teams: list[Team]):
         """
@@ -485,11 +678,15 @@ class Round:
         Args:
             teams (list[Team]): lista de equipos que van a jugar la ronda
         """
+        if self.analytic:
+            self.tie_probability = AnalyticRound(teams).tie_probability
         self.make_shots(teams)
         most_lucky_archers = self.obtain_most_lucky_archers(teams)
         self.execute_special_shots(most_lucky_archers, teams, self.id)
         self.define_winning_team(teams)
         self.define_winning_archer(teams)
+        if self.results is not None:
+            self.results.record(self)
         self.save_team_points(teams)
         self.restore_values(teams)
         #self.show_results()
@@ -521,7 +718,7 @@ class Round:
         Args:
             teams (list[Team]): lista de equipos a los que se le resetará los valores
         """
-        substractConverter = SubstractResistanceConverter()
+        substractConverter = SubstractResistanceConverter(self.values.quantized)
         for team in teams:
             for archer in team.archers:
                 if archer.experience_gained() >= 9:
@@ -535,13 +732,15 @@ class Round:
                     )
             team.reset_values()
 
-    def verify_tie(self, archers: list[Archer], teams: list[Team]):
+    def verify_tie(self, archers: list[Archer]) -> bool:
         """
         Verifica la existencia de un empate, de lo contrario define un ganador
         
         Args:
             archers (list[Archer]): Lista de jugadores a los que hay que verificar si hay empate
-            teams (list[Team]): lista de equipos existentes para guardar registro de los lanzamientos
+
+        Returns:
+            bool: True si hay un único arquero con más puntos (queda como ganador), False si sigue el empate
         """
         best_archers: list[Archer] = list()
         for archer in archers:
@@ -556,24 +755,56 @@ class Round:
                 best_archers.append(archer)
         if len(best_archers) == 1:
             self.set_winner_archer(best_archers[0])
-        elif len(best_archers) > 1:
-            self.execute_additional_shots(archers, teams)
+            return True
+        return False
 
     def execute_additional_shots(self, archers: list[Archer], teams: list[Team]):
         """
-        Ejecuta los lanzamientos adicionales de los arqueros que lo ganaron
+        Ejecuta rondas de lanzamientos adicionales de todos los arqueros empatados, acumulando sus puntos, hasta que uno
+        quede con más puntos que los demás. Es iterativo, por lo que la cantidad de rondas de desempate no tiene límite
+        de recursión; cada ronda consume un valor por arquero en el mismo orden que siempre
         
         Args:
             archers (list[Archer]): Lista de jugadores que realizarán los lanzamientos adicionales
             teams (list[Team]): lista de equipos existentes para guardar registro de los lanzamientos
         """
-        for archer in archers:
-            points = archer.execute_additional_shot(
-                self.values.random_value(), self.game_id, self.id
-            )
+        if self.sampled_shots:
+            self.sample_additional_shots(archers, teams)
+            return
+        resolved = False
+        while not resolved:
+            self.reshoot_rounds += 1
+            for archer in archers:
+                points = archer.execute_additional_shot(
+                    self.values.random_value(), self.game_id, self.id
+                )
+                team = self.searchTeam(archer.team, teams)
+                team.add_points(points)
+            resolved = self.verify_tie(archers)
+
+    def sample_additional_shots(self, archers: list[Archer], teams: list[Team]):
+        """
+        Sortea el desempate de los arqueros con los valores aleatorios del torneo y la distribución de un lanzamiento de
+        cada uno, con la misma regla que execute_additional_shots. El de dos arqueros se sortea en forma cerrada
+        (analytic.sample_two_archer_tie_break) y el de tres o más con analytic.sample_tie_breaks
+        
+        Args:
+            archers (list[Archer]): Lista de jugadores empatados
+            teams (list[Team]): lista de equipos existentes para guardar registro de los lanzamientos
+        """
+        converters = [type(archer.points_converter) for archer in archers]
+        if len(archers) == 2:
+            winner, rounds, points = sample_two_archer_tie_break(*converters, self.values.unit_random_values)
+        else:
+            distributions = [shot_distribution(converter) for converter in converters]
+            winners, rounds, points = sample_tie_breaks(distributions, 1, self.values.unit_random_values)
+            winner, rounds, points = int(winners[0]), int(rounds[0]), points[0].tolist()
+        self.reshoot_rounds += rounds
+        for archer, archer_points in zip(archers, points):
+            archer.execute_sampled_additional_shots(archer_points, self.game_id, self.id)
             team = self.searchTeam(archer.team, teams)
-            team.add_points(points)
-        self.verify_tie(archers, teams)
+            team.add_points(archer_points)
+        self.set_winner_archer(archers[winner])
 
     def set_winner_archer(self, archer: Archer):
         """
@@ -619,6 +850,9 @@ class Round:
         """
         for archer in team.archers:
             self.compare_luck(archer)
+            if self.sampled_shots:
+                self.add_sampled_points(archer, team)
+                continue
             while archer.can_continue():
                 self.add_points(archer, team)
 
@@ -725,6 +959,20 @@ class Round:
         )
         team.add_points(points_archer)
 
+    def add_sampled_points(self, archer: Archer, team: Team):
+        """
+        Agrega al arquero y a su equipo el total de sus lanzamientos normales de la ronda, sorteado con un solo valor
+        aleatorio. Hace la misma cantidad de lanzamientos que Archer.can_continue permitiría uno a uno
+        
+        Args:
+            archer (Archer): Arquero que ejecuta los lanzamientos
+            team (Team): Equipo al que pertenece el arquero
+        """
+        quantity = quantity_of_shots(archer)
+        if quantity > 0:
+            points = archer.execute_sampled_shots(self.values.unit_random_value(), quantity, self.game_id, self.id)
+            team.add_points(points)
+
     def define_winning_team(self, teams: list[Team]):
         """
         Define el equipo ganador comparando la cantidad de puntos que logró
@@ -802,14 +1050,20 @@ class Game:
         female_experience_by_round (list): Experiencia femenina por ronda.
         male_experience_by_round (list): Experiencia masculina por ronda.
         values (Values): Generador de valores aleatorios.
+        analytic (bool): Indica si cada ronda calcula su probabilidad exacta de empate.
+        sampled_shots (bool): Indica si cada ronda sortea el total de los lanzamientos normales de cada arquero.
+        expected_tied_rounds (float): Suma de las probabilidades exactas de empate de las rondas, None si no es analítico.
+        results (RoundResults): Resultados de las rondas en arreglos compactos, con los que se define el juego.
     """
-    def __init__(self, id: int, values:Values):
+    def __init__(self, id: int, values:Values, analytic: bool = False, sampled_shots: bool = False):
         """
         Inicializa un juego
         
         Args:
             id (int): Identificador del juego
             values (Values): Generador de valores aleatorios.
+            analytic (bool): Indica si cada ronda calcula su probabilidad exacta de empate.
+            sampled_shots (bool): Indica si cada ronda sortea el total de los lanzamientos normales de cada arquero.
         """
         self.id = id
         self.rounds: list[Round] = []
@@ -823,6 +1077,10 @@ class Game:
         self.female_experience_by_round = []
         self.male_experience_by_round = []
         self.values = values
+        self.analytic = analytic
+        self.sampled_shots = sampled_shots
+        self.expected_tied_rounds: float = None
+        self.results: RoundResults = None
 
     def execute(self, teams: list[Team]):
         """
@@ -847,10 +1105,13 @@ class Game:
         Args:
             teams (list[Team]): Lista de los equipos que jugarán las rondas
         """
+        self.results = RoundResults(teams)
         for i in range(constants.QUANTITY_OF_ROUNDS):
-            round = Round(i, self.id, self.values)
+            round = Round(i, self.id, self.values, self.analytic, self.results, self.sampled_shots)
             self.rounds.append(round)
             round.execute(teams)
+        if self.analytic:
+            self.expected_tied_rounds = sum(round.tie_probability for round in self.rounds)
 
         # self.show_results()
 
@@ -895,12 +1156,15 @@ class Game:
         Args:
             teams (list[Team]): Lista de los equipos que hacen parte del juego
         """
-        best_teams = self.count_victories_by_team()
-        self.bestTeam = self.define_winner(best_teams, constants.ROUNDS_WON)
-        if self.bestTeam:
-            self.search_team(
-                teams, self.bestTeam[constants.NAME_ATRIBUTE]
-            ).add_game_won()
+        best_team = self.results.best_team
+        self.quantity_of_tied_rounds = int(np.count_nonzero(self.results.tied[best_team < 0]))
+        winner, rounds_won = self.define_winner(best_team)
+        if winner >= 0:
+            self.bestTeam = {
+                constants.NAME_ATRIBUTE: self.results.team_names[winner],
+                constants.ROUNDS_WON: rounds_won,
+            }
+            teams[winner].add_game_won()
         # if not self.bestTeam:
         #    print(f"Empate de equipos en el juego {self.id}")
 
@@ -919,114 +1183,65 @@ class Game:
             if team.name == team_name:
                 return team
 
-    def count_victories_by_team(self):
-        """
-        Cuenta la cantidad de rondas ganadas de cada equipo
-        
-        Returns:
-            list : Lista de los equipos junto con la cantidad de rondas ganadas
-        """
-        list = []
-        for round in self.rounds:
-            if round.best_team:
-                team_name = round.best_team[constants.NAME_ATRIBUTE]
-                team = self.search_item(list, team_name)
-                self.add_won_round(team, team_name, list)
-            elif round.is_a_tied_round:
-                self.quantity_of_tied_rounds += 1
-        return list
-
     def define_winner_archer(self):
         """
-        Define el equipo ganador del juego, comparando la cantidad de rondas ganadas
+        Define el arquero ganador del juego, comparando la cantidad de rondas ganadas
         """
-        best_archers = self.count_victories_by_archer()
-        self.bestArcher = self.define_winner(best_archers, constants.ROUNDS_WON)
+        winner, rounds_won = self.define_winner(self.results.best_archer)
+        if winner >= 0:
+            self.bestArcher = {
+                constants.NAME_ATRIBUTE: self.results.archer_names[winner],
+                constants.ROUNDS_WON: rounds_won,
+            }
         # if not self.bestArcher:
         #    print(f"Empate de jugadores en el juego {self.id}")
 
-    def count_victories_by_archer(self):
+    def define_winner(self, round_winners: np.ndarray) -> tuple[int, int]:
         """
-        Cuenta la cantidad de rondas ganadas por arquero
-        
-        Returns:
-            list : Lista de los arqueros junto con el conteo de rondas ganadas
-        """
-        list = []
-        for round in self.rounds:
-            if round.best_archer:
-                archer_name = round.best_archer[constants.NAME_ATRIBUTE]
-                archer = self.search_item(list, archer_name)
-                self.add_won_round(archer, archer_name, list)
-        return list
-
-    def add_won_round(self, object, object_name, list: list):
-        """
-        Aumenta el contador de rondas ganadas al objeto que se le pasa por parámetro, en caso de no existir lo agrega a la lista con un contador inicial de 1.
+        Define el ganador del juego por la cantidad de rondas ganadas. Los participantes se comparan en el orden en que
+        ganaron su primera ronda, por lo que el resultado es el mismo que al recorrerlos uno a uno
         
         Args:
-            object: Objeto al que se le aumentará el contador de rondas ganadas.
-            object_name: Nombre del objeto para crearlo en dado caso de que no exista.
-            list (list): Lista en donde se agrega el objeto en dado caso de no existir.
-        """
-        if object:
-            object[constants.ROUNDS_WON] += 1
-        else:
-            list.append({constants.NAME_ATRIBUTE: object_name, constants.ROUNDS_WON: 1})
-
-    def define_winner(self, best_participants, criterion):
-        """
-        Define el arquero ganador del juego por medio del criterio pasado por parámetro
-        
-        Args:
-            best_participants : Lista de los jugadores con su respectiva cantidad de rondas ganadas
-            criterion : Criterio a utilizar para comparar y definir quién es el ganador
+            round_winners (np.ndarray): Identificador del ganador de cada ronda, -1 si no hubo ganador
             
         Return: 
-            dict: diccionario del mejor arquero el cual contiene el nombre y cantidad de rondas ganadas
-            En caso de no haber ganador porque hubo empate retorna None
-        """
-        winner = None
-        for participant in best_participants:
-            if winner:
-                if participant[criterion] > winner[criterion]:
-                    winner = participant
-                elif participant[criterion] == winner[criterion]:
-                    winner = None
-            else:
-                winner = participant
-        return winner
-
-    def search_item(self, list, name):
-        """
-        Busca un objeto en la lista a partir del nombre del mismo
-        
-        Args:
-            list: Lista en la que se buscará el objeto
-            name: Nombre del objeto a buscar
-
-        Returns:
-            Retorna el objeto que tenga el nombre ingresado, de no encontrarse retorna None
-        """
-        for object in list:
-            if object[constants.NAME_ATRIBUTE] == name:
-                return object
-        return None
+            tuple[int, int]: Identificador del ganador y cantidad de rondas ganadas; (-1, 0) si hubo empate
+        """
+        # Los identificadores se desplazan en uno para que las rondas sin ganador (-1) caigan en la primera posición
+        rounds_won = np.bincount(round_winners + 1)[1:]
+        if len(rounds_won) == 0:
+            return -1, 0
+        best = int(rounds_won.argmax())
+        counts = rounds_won.tolist()
+        if counts.count(counts[best]) > 1:
+            winners = round_winners[round_winners >= 0]
+            ids, first_rounds = np.unique(winners, return_index=True)
+            participants = ids[np.argsort(first_rounds)]
+            winner = define_winner_index(rounds_won[participants])
+            if winner < 0:
+                return -1, 0
+            best = int(participants[winner])
+        return best, int(rounds_won[best])
 
     def define_luckiest_archer(self, teams: list[Team]):
         """
-        Determina cual es el arquero más afortunado del juego
+        Determina cual es el arquero más afortunado del juego comparando el más afortunado de cada ronda
         
         Args:
             teams (list[Team]): Lista de los equipos en que se buscará el arquero más afortunado
         """
-        luckiest_archers = self.obtain_luckiest_archers()
-        self.the_luckiest_archer = self.define_winner(luckiest_archers, constants.LUCK)
+        round = define_winner_index(self.results.luck)
+        if round < 0:
+            print(f"Empate de jugador afortunado en el juego {self.id}")
+            return
+        archer = int(self.results.luckiest_archer[round])
+        self.the_luckiest_archer = {
+            constants.NAME_ATRIBUTE: self.results.archer_names[archer],
+            constants.LUCK: float(self.results.luck[round]),
+        }
         self.search_archer(
             teams, self.the_luckiest_archer[constants.NAME_ATRIBUTE]
         ).add_lucky_game()
-        if not self.the_luckiest_archer:
-            print(f"Empate de jugador afortunado en el juego {self.id}")
 
     def search_archer(search, teams: list[Team], archer_name) -> Archer:
         """
@@ -1044,18 +1259,6 @@ class Game:
                 if archer.name == archer_name:
                     return archer
 
-    def obtain_luckiest_archers(self):
-        """
-        Devuleve los arquero más afortunados de cada ronda
-        
-        Returns:
-            list: Lista de arqueros más afortunados por ronda
-        """
-        luckiest_archers = []
-        for round in self.rounds:
-            luckiest_archers.append(round.luckiest_archer)
-        return luckiest_archers
-
     def define_most_experienced_archers(self, teams: list[Team]):
         """
         Declara el o los arqueros más experimentados del juego
@@ -1149,13 +1352,8 @@ class Game:
         """
         Cuenta la cantidad de victorias por género
         """
-        for round in self.rounds:
-            winner = round.best_archer
-            if winner:
-                if winner[constants.GENDER] == Gender.MALE:
-                    self.male_wins += 1
-                else:
-                    self.female_wins += 1
+        # Posiciones: sin ganador, femenino, masculino
+        _, self.female_wins, self.male_wins = np.bincount(self.results.best_archer_gender + 1, minlength=3).tolist()
 
     def reset_values(self, teams: list[Team]):
         """
@@ -1180,11 +1378,8 @@ class Game:
         female_exp = 0
         male_exp = 0
         for team in teams:
-            for archer in team.archers:
-                if archer.gender == Gender.MALE:
-                    male_exp += archer.experience_gained()
-                else:
-                    female_exp += archer.experience_gained()
+            female_exp += team.experience_gained_by_gender[Gender.FEMALE]
+            male_exp += team.experience_gained_by_gender[Gender.MALE]
         self.acumulate_value(self.female_experience_by_round, female_exp)
         self.acumulate_value(self.male_experience_by_round, male_exp)
 
@@ -1227,6 +1422,22 @@ class Game:
         self.acumulate_values(male_experience_by_round, self.male_experience_by_round)
 
 
+def print_progress(games: int, max_games: int):
+    """
+    Imprime el progreso de la simulación del torneo
+    
+    Args:
+        games (int): Cantidad de juegos simulados
+        max_games (int): Cantidad máxima de juegos a simular
+    """
+    porcentaje = games / max_games * 100
+    print(
+        f"\rProgreso: {porcentaje:.1f}% ({games}/{max_games})",
+        end="",
+        flush=True,
+    )
+
+
 class Tournament:
     """
     Representa el torneo completo de arquería.
@@ -1240,13 +1451,73 @@ class Tournament:
         male_wins (int): Rondas ganadas por hombres.
         tied_rounds (int): Rondas empatadas.
         games (list[Game]): Lista de juegos del torneo.
-        female_experience_by_round (list): Experiencia femenina acumulada por ronda.
-        male_experience_by_round (list): Experiencia masculina acumulada por ronda.
+        female_experience_by_round (GrowableArray): Experiencia femenina acumulada por ronda.
+        male_experience_by_round (GrowableArray): Experiencia masculina acumulada por ronda.
         values (Values): Generador de valores aleatorios.
+        max_games (int): Cantidad máxima de juegos a simular.
+        batch_size (int): Cantidad de juegos por lote entre cada verificación de precisión.
+        tolerance (float): Semiamplitud máxima de los intervalos de confianza para detener la simulación, None para simular todos los juegos.
+        estimates (TournamentEstimates): Estimandos usados para el criterio de parada.
+        quantity_of_games (int): Cantidad de juegos simulados.
+        seed (int): Semilla base de los valores aleatorios; dos torneos con la misma semilla y la misma cantidad máxima de juegos (o el mismo pool) comparten los mismos valores (números aleatorios comunes).
+        antithetic (bool): Indica si cada juego se repite con los valores aleatorios reflejados (muestreo antitético).
+        sampled_shots (bool): Indica si los lanzamientos normales de cada arquero en una ronda se reemplazan por un único sorteo de su total a partir de su distribución exacta, y los desempates de arqueros se sortean de la distribución de sus lanzamientos.
+        quantized (bool): Indica si los Ri se generan cuantizados (enteros Ri*10^5) y los conversores usan límites enteros.
+        pool_path (str): Directorio del pool precalculado de valores aleatorios, None si se generan.
+        variance_reduction (dict): Factor de reducción de varianza logrado por estimando en modo antitético.
+        checkpoint_path (str): Archivo del punto de control que se guarda al terminar cada lote.
+        results_path (str): Directorio de los resultados por ronda y juego (ver results_store).
+        results_writer (ResultsWriter): Escritor de los resultados por ronda y juego.
+        quantity_of_teams (int): Cantidad de equipos del torneo.
+        archers_by_team (int): Cantidad de arqueros por equipo.
+        progress (callable): Función que recibe el progreso del torneo al terminar cada juego.
+        verbose (bool): Indica si se imprimen los resultados del torneo.
+        cancelled (bool): Indica si se pidió detener la simulación.
+
+    Al reanudar desde un punto de control, games solo contiene los juegos ejecutados después de reanudar,
+    mientras que quantity_of_games y los acumulados cuentan todos los juegos del torneo.
     """
-    def __init__(self):
+    def __init__(
+        self,
+        tolerance: float = constants.PRECISION_TOLERANCE,
+        max_games: int = constants.QUANTITY_OF_GAMES,
+        batch_size: int = constants.BATCH_SIZE,
+        confidence: float = constants.CONFIDENCE_LEVEL,
+        seed: int = None,
+        antithetic: bool = False,
+        analytic: bool = False,
+        sampled_shots: bool = False,
+        quantized: bool = False,
+        pool_path: str = None,
+        keep_observations: bool = False,
+        checkpoint_path: str = None,
+        results_path: str = None,
+        quantity_of_teams: int = constants.QUANTITY_OF_TEAMS,
+        archers_by_team: int = constants.QUANTITY_OF_ARCHERS_BY_TEAM,
+        progress=None,
+        verbose: bool = True,
+    ):
         """
         Inicializa un torneo
+        
+        Args:
+            tolerance (float): Semiamplitud máxima de los intervalos de confianza para detener la simulación, None para simular todos los juegos.
+            max_games (int): Cantidad máxima de juegos a simular.
+            batch_size (int): Cantidad de juegos por lote entre cada verificación de precisión.
+            confidence (float): Nivel de confianza de los intervalos.
+            seed (int): Semilla base de los valores aleatorios, None para usar una semilla basada en la hora.
+            antithetic (bool): Indica si cada juego se repite con los valores aleatorios reflejados.
+            analytic (bool): Calcula además, en cada ronda, la probabilidad exacta de empate dado su estado inicial (ver analytic).
+            sampled_shots (bool): Sortea con un solo valor aleatorio el total de los lanzamientos normales de cada arquero en cada ronda, a partir de su distribución exacta (ver analytic), y los desempates de arqueros con analytic.sample_tie_breaks; mucho más rápido, con la misma distribución de resultados pero sin los mismos valores que la simulación lanzamiento a lanzamiento.
+            quantized (bool): Genera los Ri cuantizados (enteros Ri*10^5) y convierte los puntos con límites enteros; con la misma semilla los resultados son los mismos que con Ri flotantes.
+            pool_path (str): Directorio de un pool precalculado de valores aleatorios (ver random_pool), None para generarlos; si no se indica la semilla se usa la del pool.
+            keep_observations (bool): Guarda las observaciones de cada juego para comparar configuraciones con números aleatorios comunes.
+            checkpoint_path (str): Archivo en el que se guarda un punto de control al terminar cada lote, None para no guardarlos.
+            results_path (str): Directorio en el que se guardan los resultados de cada ronda y juego, None para no guardarlos.
+            quantity_of_teams (int): Cantidad de equipos del torneo.
+            archers_by_team (int): Cantidad de arqueros por equipo.
+            progress (callable): Función que recibe los juegos simulados y el máximo de juegos al terminar cada juego, None para usar print_progress si verbose es True.
+            verbose (bool): Indica si se imprimen el progreso y los resultados del torneo.
         """
         self.teams: list[Team] = []
         self.luckiest_archer: Archer = None
@@ -1255,26 +1526,83 @@ class Tournament:
         self.female_wins = 0
         self.male_wins = 0
         self.tied_rounds = 0
+        self.expected_tied_rounds = 0.0
         self.games: list[Game] = []
-        self.female_experience_by_round = []
-        self.male_experience_by_round = []
-        self.values = Values()
+        self.female_experience_by_round = GrowableArray(np.int64)
+        self.male_experience_by_round = GrowableArray(np.int64)
+        self.max_games = max_games
+        # En modo antitético los lotes deben contener parejas completas de juegos
+        self.batch_size = batch_size + batch_size % 2 if antithetic else batch_size
+        self.tolerance = tolerance
+        self.antithetic = antithetic
+        self.analytic = analytic
+        self.sampled_shots = sampled_shots
+        self.quantized = quantized
+        self.estimates = TournamentEstimates(confidence, antithetic, keep_observations)
+        self.variance_reduction = {}
+        self.antithetic_state = []
+        self.quantity_of_games = 0
+        self.pool_path = pool_path
+        pool = RandomPool(pool_path) if pool_path else None
+        if seed is None:
+            seed = pool.seed if pool else int(time.time_ns() % (2**31 - 1))
+        self.seed = seed
+        self.confidence = confidence
+        self.keep_observations = keep_observations
+        self.checkpoint_path = checkpoint_path
+        self.results_path = results_path
+        self.results_writer: ResultsWriter = None
+        self.quantity_of_teams = quantity_of_teams
+        self.archers_by_team = archers_by_team
+        self.verbose = verbose
+        self.progress = progress if progress or not verbose else print_progress
+        self.cancelled = False
+        self.values = Values(max_games, self.seed, quantity_of_teams * archers_by_team, quantized, pool)
+        self.estimates.stream = self.values.stream()
 
     def execute(self):
         """
         Ejecuta el torneo y define los resultados finales del mismo
         """
-        self.__assign_team_values()
+        if not self.teams:
+            self.__assign_team_values()
+        if self.results_path:
+            self.results_writer = ResultsWriter(
+                self.results_path,
+                [team.name for team in self.teams],
+                [archer.name for team in self.teams for archer in team.archers],
+                resume_games=self.quantity_of_games,
+            )
         self.__execute_games()
+        if self.results_writer:
+            self.results_writer.close()
         self.__define_luckiest_archer()
         self.__define_most_experienced_archer()
         self.__define_best_team()
 
         self.tied_rounds_frequency = (
             self.tied_rounds
-            / (constants.QUANTITY_OF_ROUNDS * constants.QUANTITY_OF_GAMES)
+            / (constants.QUANTITY_OF_ROUNDS * self.quantity_of_games)
             * 100
+            if self.quantity_of_games > 0
+            else 0
         )
+        self.analytic_tied_rounds_frequency = (
+            self.expected_tied_rounds
+            / (constants.QUANTITY_OF_ROUNDS * self.quantity_of_games)
+            * 100
+            if self.analytic and self.quantity_of_games > 0
+            else None
+        )
+        if self.antithetic:
+            self.variance_reduction = self.estimates.variance_reduction_factors()
+        if self.verbose:
+            self.show_results()
+
+    def show_results(self):
+        """
+        Muestra los resultados del torneo
+        """
         print(
             "\nResultados torneo:\n"
             + f"Jugador más afortunado: {self.luckiest_archer.name} con {self.luckiest_archer.quantity_luckiest_games} rondas como el más afortunado\n"
@@ -1284,55 +1612,245 @@ class Tournament:
             + f"Cantidad de rondas ganadas por el género másculino: {self.male_wins} rondas\n"
             + f"Cantidad de rondas empatadas: {self.tied_rounds} rondas\n"
             + f"Frecuencia relativa de rondas empatadas: {self.tied_rounds_frequency:.2f}%\n"
+            + f"Juegos simulados: {self.quantity_of_games} (semiamplitud máxima al {self.estimates.confidence:.0%}: {self.estimates.max_half_width():.4f})\n"
         )
+        if self.analytic:
+            print(f"Frecuencia de rondas empatadas (analítica): {self.analytic_tied_rounds_frequency:.2f}%")
+        if self.antithetic:
+            print("Factor de reducción de varianza (antitético):")
+            for name, factor in self.variance_reduction.items():
+                print(f"  {name}: {factor:.2f}")
+
+    @staticmethod
+    def resume(path: str, verbose: bool = True, progress=None):
+        """
+        Reanuda un torneo desde un punto de control. Los valores aleatorios se generan de nuevo con la semilla guardada,
+        por lo que al ejecutarlo se obtienen los mismos resultados que sin la interrupción
+        
+        Args:
+            path (str): Archivo del punto de control, en el que se seguirán guardando los siguientes
+            verbose (bool): Indica si se imprimen el progreso y los resultados del torneo; no se guarda en el punto de control.
+            progress (callable): Función que recibe el progreso al terminar cada juego, como en Tournament; no se guarda en el punto de control.
+            
+        Returns:
+            Tournament: Torneo listo para continuar con execute
+        """
+        metadata, arrays = load_checkpoint(path)
+        tournament = Tournament(**metadata["config"], checkpoint_path=path, progress=progress, verbose=verbose)
+        tournament.__restore(metadata, arrays)
+        return tournament
+
+    def __restore(self, metadata: dict, arrays: dict):
+        """
+        Restaura el estado del torneo guardado en un punto de control
+        
+        Args:
+            metadata (dict): Contadores y estado de equipos, arqueros y estimandos
+            arrays (dict): Series acumuladas del torneo
+        """
+        self.quantity_of_games = metadata["quantity_of_games"]
+        self.female_wins = metadata["female_wins"]
+        self.male_wins = metadata["male_wins"]
+        self.tied_rounds = metadata["tied_rounds"]
+        self.expected_tied_rounds = metadata.get("expected_tied_rounds", 0.0)
+        self.female_experience_by_round = GrowableArray.from_values(arrays["female_experience_by_round"])
+        self.male_experience_by_round = GrowableArray.from_values(arrays["male_experience_by_round"])
+        self.values.restore_positions(**metadata["values"])
+
+        for i, team_state in enumerate(metadata["teams"]):
+            team = Team(team_state["name"])
+            team.quantity_games_won = team_state["quantity_games_won"]
+            team.repeated_special_archer = team_state["repeated_special_archer"]
+            team.points_by_round = GrowableArray.from_values(arrays[f"team_{i}_points_by_round"], np.int32)
+            team.points_histogram = IntegerHistogram.from_values(arrays[f"team_{i}_points_by_round"])
+            team.special_shots_by_game = GrowableArray.from_values(arrays[f"team_{i}_special_shots_by_game"], np.int32)
+            team.experience_by_game = GrowableArray.from_values(arrays[f"team_{i}_experience_by_game"], np.int32)
+            for id, (game, round, points, experience_gained, total_special_shots) in enumerate(
+                arrays[f"team_{i}_puntuations"].tolist()
+            ):
+                team.puntuations.append(
+                    PuntuationTeam(id, game, round, points, experience_gained, total_special_shots)
+                )
+            self.teams.append(team)
+
+        for i, archer_state in enumerate(metadata["archers"]):
+            gender = Gender[archer_state["gender"]]
+            archer = Archer(
+                archer_state["name"],
+                archer_state["team"],
+                archer_state["current_resistance"],
+                archer_state["luck"],
+                gender,
+                MalePointsConverter(self.quantized) if gender == Gender.MALE else FemalePointsConverter(self.quantized),
+            )
+            archer.quantity_luckiest_games = archer_state["quantity_luckiest_games"]
+            archer.quantity_experienced_games = archer_state["quantity_experienced_games"]
+            archer.round_points = archer_state["round_points"]
+            archer.acumulation_points = GrowableArray.from_values(arrays[f"archer_{i}_acumulation_points"])
+            self.search_team(archer.team).add_archer(archer)
+
+        self.__restore_estimates(self.estimates.estimates, metadata["estimates"])
+        self.__restore_estimates(self.estimates.pair_estimates, metadata["pair_estimates"])
+        if metadata["observations"] is not None:
+            self.estimates.observations = dict(
+                zip(metadata["observations"], arrays["observations"].tolist())
+            )
+
+    def __restore_estimates(self, estimates: dict, states: dict):
+        """
+        Restaura los estimandos acumulados guardados en un punto de control
+        
+        Args:
+            estimates (dict): Diccionario de estimandos a restaurar
+            states (dict): Cantidad, media y m2 por nombre de estimando
+        """
+        for name, (count, mean, m2) in states.items():
+            estimate = RunningEstimate()
+            estimate.count, estimate.mean, estimate.m2 = count, mean, m2
+            estimates[name] = estimate
+
+    def search_team(self, name: str) -> Team:
+        """
+        Busca un equipo del torneo a partir de su nombre
+        
+        Args:
+            name (str): Nombre del equipo a buscar
+            
+        Returns:
+            Team: Equipo encontrado, de no encontrarlo retorna None
+        """
+        for team in self.teams:
+            if team.name == name:
+                return team
+        return None
 
     def __assign_team_values(self):
         """
         Asigna los valores iniciales a cada equipo utilizando los valores aleatorios generados y testeados previamente 
         """
+        self.teams.extend(Tournament.build_teams(self.values, self.quantity_of_teams, self.archers_by_team))
+
+    @staticmethod
+    def build_teams(
+        values: Values,
+        quantity_of_teams: int = constants.QUANTITY_OF_TEAMS,
+        archers_by_team: int = constants.QUANTITY_OF_ARCHERS_BY_TEAM,
+    ) -> list[Team]:
+        """
+        Crea los equipos y sus arqueros con los valores aleatorios del torneo; los conversores de puntos usan el modo
+        cuantizado de values
+        
+        Args:
+            values (Values): Valores aleatorios del torneo
+            quantity_of_teams (int): Cantidad de equipos
+            archers_by_team (int): Cantidad de arqueros por equipo
+            
+        Returns:
+            list[Team]: Equipos con sus arqueros
+        """
+        teams = []
         number_archers = 1
-        for i in range(constants.QUANTITY_OF_TEAMS):
+        for i in range(quantity_of_teams):
             team = Team(f"Equipo {(i+1)}")
-            for j in range(constants.QUANTITY_OF_ARCHERS_BY_TEAM):
-                gender = obtain_gender(self.values.random_value())
+            for j in range(archers_by_team):
+                gender = obtain_gender(values.random_value(), values.quantized)
                 points_converter = None
                 if gender == Gender.MALE:
-                    points_converter = MalePointsConverter()
+                    points_converter = MalePointsConverter(values.quantized)
                 else:
-                    points_converter = FemalePointsConverter()
+                    points_converter = FemalePointsConverter(values.quantized)
                 team.add_archer(
                     Archer(
                         f"Arquero {(number_archers)}",
                         team.name,
-                        self.values.uniform_value(),
-                        self.values.norm_random_value(),
+                        values.uniform_value(),
+                        values.norm_random_value(),
                         gender,
                         points_converter,
                     )
                 )
                 number_archers += 1
-            self.teams.append(team)
+            teams.append(team)
+        return teams
 
     def __execute_games(self):
         """
-        Ejecuta todos los juegos del torneo, donde la cantidad se define a partir de la constante QUANTITY_OF_GAMES, además de que imprime el progreso del tiempo que lleva en ejecución
+        Ejecuta los juegos del torneo por lotes de batch_size juegos hasta llegar a max_games, o hasta que todos los estimandos alcancen la tolerancia definida, además de que imprime el progreso del tiempo que lleva en ejecución
         """
-        for i in range(constants.QUANTITY_OF_GAMES):
-            porcentaje = (i + 1) / constants.QUANTITY_OF_GAMES * 100
-            print(
-                f"\rProgreso: {porcentaje:.1f}% ({i + 1}/{constants.QUANTITY_OF_GAMES})",
-                end="",
-                flush=True,
-            )
-            game = Game(i, self.values)
-            self.games.append(game)
-            game.execute(self.teams)
-            game.acumulate_experience_by_gender(
-                self.female_experience_by_round, self.male_experience_by_round, self.teams
-            )
-            self.female_wins += game.female_wins
-            self.male_wins += game.male_wins
-            self.tied_rounds += game.quantity_of_tied_rounds
+        while self.quantity_of_games < self.max_games and not self.__precision_reached():
+            batch_end = min(self.quantity_of_games + self.batch_size, self.max_games)
+            for i in range(self.quantity_of_games, batch_end):
+                if self.cancelled:
+                    return
+                self.__execute_game(i)
+                if self.progress:
+                    self.progress(i + 1, self.max_games)
+            if self.checkpoint_path:
+                if self.results_writer:
+                    self.results_writer.flush()
+                save_checkpoint(self, self.checkpoint_path)
+
+    def cancel(self):
+        """
+        Pide detener la simulación. El juego en curso termina y los resultados se definen con los juegos simulados hasta
+        el momento; el punto de control no se actualiza, por lo que el torneo puede reanudarse desde el último lote completo
+        """
+        self.cancelled = True
+
+    def __precision_reached(self) -> bool:
+        """
+        Define si todos los estimandos alcanzaron la tolerancia definida
+        
+        Returns:
+            bool: True si hay tolerancia definida y se alcanzó, de lo contrario False
+        """
+        return self.tolerance is not None and self.estimates.converged(self.tolerance)
+
+    def __execute_game(self, id: int):
+        """
+        Ejecuta un juego y acumula sus resultados en el torneo
+        
+        Args:
+            id (int): Identificador del juego
+        """
+        if self.antithetic:
+            self.__prepare_antithetic_game(id)
+        game = Game(id, self.values, self.analytic, self.sampled_shots)
+        self.games.append(game)
+        game.execute(self.teams)
+        game.acumulate_experience_by_gender(
+            self.female_experience_by_round, self.male_experience_by_round, self.teams
+        )
+        self.female_wins += game.female_wins
+        self.male_wins += game.male_wins
+        self.tied_rounds += game.quantity_of_tied_rounds
+        if self.analytic:
+            self.expected_tied_rounds += game.expected_tied_rounds
+        self.estimates.add_game(game, self.teams)
+        if self.results_writer:
+            self.results_writer.add_game(game, self.teams)
+        self.quantity_of_games += 1
+
+    def __prepare_antithetic_game(self, id: int):
+        """
+        Prepara los valores aleatorios de un juego en modo antitético. Los juegos pares registran los valores que consumen
+        y guardan el estado inicial de los arqueros; los impares parten del estado inicial reflejado y reproducen reflejados
+        los valores del juego anterior
+        
+        Args:
+            id (int): Identificador del juego
+        """
+        if id % 2 == 0:
+            self.values.record()
+            self.antithetic_state = [
+                (archer, archer.luck, archer.current_resistance)
+                for team in self.teams
+                for archer in team.archers
+            ]
+        else:
+            self.values.replay_mirrored()
+            for archer, luck, resistance in self.antithetic_state:
+                archer.reset_values(mirror_norm_value(luck), mirror_uniform_value(resistance))
 
     def __define_luckiest_archer(self):
         """
@@ -1395,12 +1913,12 @@ class Tournament:
         Devuelve el acumulado de puntos por ronda de cada arquero
         
         Returns:
-            dict: diccionario de los puntos de cada arquero en cada ronda
+            dict: diccionario de los puntos de cada arquero en cada ronda, como vistas de sus series sin copiarlas
         """
         points_archers = {}
         for team in self.teams:
             for archer in team.archers:
-                points_archers.update({archer.name: archer.acumulation_points})
+                points_archers.update({archer.name: archer.acumulation_points.view()})
         return points_archers
 
     def points_by_team(self) -> dict:
@@ -1408,23 +1926,33 @@ class Tournament:
         Devuelve el acumulado de puntos por ronda de cada equipo
         
         Returns:
-            dict: diccionario de los puntos de cada equipo en cada ronda      
+            dict: diccionario de los puntos de cada equipo en cada ronda, como vistas de sus series sin copiarlas
         """
         points_team = {}
         for team in self.teams:
-            points_team.update({team.name: team.points_by_round})
+            points_team.update({team.name: team.points_by_round.view()})
         return points_team
 
+    def points_histogram_by_team(self) -> dict:
+        """
+        Devuelve el histograma de los puntos por ronda de cada equipo, del que se obtienen las estadísticas del
+        diagrama de caja sin recorrer la serie completa
+
+        Returns:
+            dict[str, IntegerHistogram]: histograma de cada equipo
+        """
+        return {team.name: team.points_histogram for team in self.teams}
+
     def experience_by_gender(self):
         """
         Devuelve la experiencia de cada ronda obtenida por cada género
         
         Returns:
-            dict: Experiencia por ronda de cada género
+            dict: Experiencia por ronda de cada género, como vistas de sus series sin copiarlas
         """
         experience = {
-            "Masculino": self.male_experience_by_round,
-            "Femenino": self.female_experience_by_round,
+            "Masculino": self.male_experience_by_round.view(),
+            "Femenino": self.female_experience_by_round.view(),
         }
         return experience
 